@@ -1,6 +1,10 @@
-from typing import Callable, Optional
+from functools import partial
+from typing import Callable, Optional, Union, cast
 
 import numpy as np
+from scipy.sparse import csr_matrix, diags, issparse
+from sklearn import get_config
+from sklearn.utils import gen_batches
 
 from ._typing import ArrayLike
 
@@ -48,10 +52,21 @@ def phi1D(
 def phi2D(
     A: ArrayLike,
     B: ArrayLike,
-    fun: Callable[[ArrayLike], ArrayLike],
+    fun: Union[str, Callable[[ArrayLike], ArrayLike]],
+    working_memory: Optional[float] = None,
 ) -> ArrayLike:
     """
-    The function phi2D is a loop applying phi1D on each row of A.
+    The function phi2D applies phi1D on each row of A.
+
+    Rows of A are processed by blocks: the products of a block of rows
+    of A with a block of rows of B are computed at once by broadcasting,
+    in a 3D array whose size fits in ``working_memory``, and ``fun`` is
+    applied to all of them in a single call.
+
+    If ``B`` is a mask, i.e. a 1-or-nan array or a sparse boolean matrix,
+    the means and medians ignoring nan have specialised kernels, selected
+    by ``fun="mean"`` or ``fun="median"``: means are computed with
+    matrix products, and medians with ``masked_median``.
 
     Parameters
     ----------
@@ -59,14 +74,26 @@ def phi2D(
     B : ArrayLike of shape (n_rowsB, n_columns)
         A and B must have the same number of columns.
 
-    fun : function
-        Vectorized function applying to Arraylike, and that should ignore nan.
+    fun : Union[str, Callable]
+        Vectorized function applying to Arraylike, and that should
+        ignore nan, or "mean" or "median" for ``np.nanmean`` or
+        ``np.nanmedian`` with argument ``axis=1``.
+
+    working_memory : Optional[float]
+        Maximum memory of temporary arrays, in MiB.
+        If ``None``, the ``working_memory`` of ``sklearn.get_config()``.
+        By default ``None``.
 
     Returns
     -------
     ArrayLike of shape (n_rowsA, n_rowsB)
         Applies phi1D(x, B, fun) to each row x of A.
 
+    Raises
+    ------
+    ValueError
+        If ``fun`` is a string other than "mean" and "median".
+
     Examples
     --------
     >>> import numpy as np
@@ -77,8 +104,202 @@ def phi2D(
     >>> res = phi2D(A, B, fun)
     >>> print(res.ravel())
     [ 2.  4.  7.  9. 12. 14.]
+    >>> print(phi2D(A, B, "median").ravel())
+    [ 2.  4.  7.  9. 12. 14.]
+    """
+    if isinstance(fun, str) and fun not in ["mean", "median"]:
+        raise ValueError("Aggregation function called but not defined.")
+    if working_memory is None:
+        working_memory = get_config()["working_memory"]
+    is_mask = issparse(B) or bool(
+        np.all((np.asarray(B) == 1) | np.isnan(np.asarray(B, dtype=float)))
+    )
+    if fun == "median" and is_mask:
+        return masked_median(A, B, working_memory=working_memory)
+    if fun == "mean" and is_mask:
+        return masked_mean(A, B)
+    if fun in ["mean", "median"]:
+        fun = partial(
+            np.nanmean if fun == "mean" else np.nanmedian, axis=1
+        )
+    fun = cast(Callable[[ArrayLike], ArrayLike], fun)
+
+    A = np.asarray(A)
+    if issparse(B):
+        B = np.where(B.toarray(), 1.0, np.nan)
+    B = np.asarray(B)
+    n_rows_A, n_columns = A.shape
+    n_rows_B = B.shape[0]
+    result = np.empty((n_rows_A, n_rows_B), dtype=float)
+    if n_rows_A == 0 or n_rows_B == 0:
+        return result
+    # 8 bytes per element of the products of shape
+    # (n_chunk_A, n_chunk_B, n_columns).
+    n_elements = max(int(working_memory * 2 ** 20) // 8, 1)
+    n_chunk_B = min(n_rows_B, max(n_elements // max(n_columns, 1), 1))
+    n_chunk_A = max(n_elements // (max(n_columns, 1) * n_chunk_B), 1)
+    for batch_A in gen_batches(n_rows_A, n_chunk_A):
+        for batch_B in gen_batches(n_rows_B, n_chunk_B):
+            products = A[batch_A, np.newaxis, :] * B[np.newaxis, batch_B, :]
+            result[batch_A, batch_B] = np.reshape(
+                fun(products.reshape(-1, n_columns)), products.shape[:2]
+            )
+    return result
+
+
+def masked_mean(A: ArrayLike, B: ArrayLike) -> ArrayLike:
+    """
+    Vectorized equivalent of ``phi2D(A, B, fun)`` with ``fun`` the
+    mean ignoring nan, when ``B`` is a 1-or-nan mask.
+
+    The means are computed with a matrix product with the rows of B
+    normalized, or as the ratio of the sums and counts of non-nan values
+    if A contains nans.
+
+    Parameters
+    ----------
+    A : ArrayLike of shape (n_rowsA, n_columns)
+    B : ArrayLike of shape (n_rowsB, n_columns)
+        1-or-nan array, or sparse boolean matrix: indicates which
+        columns of A to integrate in each mean.
+        A and B must have the same number of columns.
+
+    Returns
+    -------
+    ArrayLike of shape (n_rowsA, n_rowsB)
+        Mean of each row of A over each row of B,
+        nan if there is no value to average.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from mapie.aggregation_functions import masked_mean
+    >>> A = np.array([[1, 2, 3, 4, 5],[6, 7, 8, 9, 10],[11, 12, 13, 14, 15]])
+    >>> B = np.array([[1, 1, 1, np.nan, np.nan],
+    ...               [np.nan, np.nan, 1, 1, 1]])
+    >>> print(masked_mean(A, B).ravel())
+    [ 2.  4.  7.  9. 12. 14.]
+    """
+    A = np.asarray(A, dtype=float)
+    if issparse(B):
+        K = csr_matrix(B, dtype=float)
+    else:
+        K = np.nan_to_num(np.asarray(B, dtype=float), nan=0.0)
+    counts = np.asarray(K.sum(axis=1)).ravel()
+    is_nan = np.isnan(A)
+    if np.any(is_nan):
+        sums = np.asarray(K @ np.where(is_nan, 0.0, A).T).T
+        counts_A = np.asarray(K @ (~is_nan).T.astype(float)).T
+        return np.divide(
+            sums,
+            counts_A,
+            out=np.full(sums.shape, np.nan),
+            where=counts_A > 0,
+        )
+    weights = np.divide(
+        1.0, counts, out=np.zeros(len(counts)), where=counts > 0
+    )
+    if issparse(K):
+        # Sparse matrices product, with rows of K normalized.
+        result = np.asarray((diags(weights) @ K) @ np.transpose(A)).T
+    else:
+        result = np.matmul(A, (K * weights[:, np.newaxis]).T)
+    # Rows of B without any value give nans.
+    result[:, counts == 0] = np.nan
+    return result
+
+
+def masked_median(
+    A: ArrayLike,
+    B: ArrayLike,
+    working_memory: Optional[float] = None,
+) -> ArrayLike:
+    """
+    Vectorized equivalent of ``phi2D(A, B, fun)`` with ``fun`` the
+    median ignoring nan, when ``B`` is a 1-or-nan mask.
+
+    Each row of A is sorted once. The median of the values selected
+    by each row of B is then found by rank selection: cumulative counts
+    of the mask, in the sorted order, give the positions of the middle
+    elements. Computations are made by chunks of rows of A and B,
+    whose temporary arrays fit in ``working_memory``.
+
+    Parameters
+    ----------
+    A : ArrayLike of shape (n_rowsA, n_columns)
+    B : ArrayLike of shape (n_rowsB, n_columns)
+        1-or-nan array, or sparse boolean matrix: indicates which
+        columns of A to integrate in each median.
+        A and B must have the same number of columns.
+    working_memory : Optional[float]
+        Maximum memory of temporary arrays, in MiB.
+        If ``None``, the ``working_memory`` of ``sklearn.get_config()``.
+        By default ``None``.
+
+    Returns
+    -------
+    ArrayLike of shape (n_rowsA, n_rowsB)
+        Median of each row of A over each row of B.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from mapie.aggregation_functions import masked_median
+    >>> A = np.array([[1, 2, 3, 4, 5],[6, 7, 8, 9, 10],[11, 12, 13, 14, 15]])
+    >>> B = np.array([[1, 1, 1, np.nan, np.nan],
+    ...               [np.nan, np.nan, 1, 1, 1]])
+    >>> print(masked_median(A, B).ravel())
+    [ 2.  4.  7.  9. 12. 14.]
     """
-    return np.apply_along_axis(phi1D, axis=1, arr=A, B=B, fun=fun)
+    if working_memory is None:
+        working_memory = get_config()["working_memory"]
+    A = np.asarray(A, dtype=float)
+    if issparse(B):
+        mask = csr_matrix(B, dtype=bool)
+    else:
+        mask = ~np.isnan(np.asarray(B, dtype=float))
+    n_rows_A, n_columns = A.shape
+    n_rows_B = mask.shape[0]
+    result = np.empty((n_rows_A, n_rows_B), dtype=float)
+    if n_rows_A == 0 or n_rows_B == 0:
+        return result
+
+    order = np.argsort(A, axis=1)
+    A_sorted = np.take_along_axis(A, order, axis=1)
+    is_valid = ~np.isnan(A_sorted)
+
+    # About 8 bytes per element of the temporary arrays of shape
+    # (n_chunk_B, n_chunk_A, n_columns): mask, counts and comparisons.
+    n_elements = max(int(working_memory * 2 ** 20) // 8, 1)
+    n_chunk_B = min(n_rows_B, max(n_elements // n_columns, 1))
+    n_chunk_A = max(n_elements // (n_columns * n_chunk_B), 1)
+
+    for batch_A in gen_batches(n_rows_A, n_chunk_A):
+        for batch_B in gen_batches(n_rows_B, n_chunk_B):
+            # Mask of each row of B, in the sorted order of each row of A,
+            # of shape (n_chunk_B, n_chunk_A, n_columns).
+            mask_B = mask[batch_B]
+            if issparse(mask_B):
+                mask_B = mask_B.toarray()
+            is_selected = mask_B[:, order[batch_A]]
+            is_selected &= is_valid[batch_A]
+            counts = np.cumsum(is_selected, axis=2, dtype=np.int32)
+            del is_selected
+            n = counts[:, :, -1:]
+            medians = []
+            for rank in [(n - 1) // 2, n // 2]:
+                index = np.minimum(
+                    np.sum(counts <= rank, axis=2), n_columns - 1
+                )
+                medians.append(
+                    np.take_along_axis(
+                        A_sorted[batch_A], index.T, axis=1
+                    )
+                )
+            result[batch_A, batch_B] = np.where(
+                n[:, :, 0].T > 0, (medians[0] + medians[1]) / 2, np.nan
+            )
+    return result
 
 
 def aggregate_all(agg_function: Optional[str], X: ArrayLike) -> ArrayLike:
@@ -117,3 +338,132 @@ def aggregate_all(agg_function: Optional[str], X: ArrayLike) -> ArrayLike:
     elif agg_function == "mean":
         return np.nanmean(X, axis=1)
     raise ValueError("Aggregation function called but not defined.")
+
+
+def aggregate_sparse(agg_function: Optional[str], X: csr_matrix) -> ArrayLike:
+    """
+    Applies ``aggregate_all`` to the stored values of each row of a
+    sparse matrix, values which are not stored being ignored like nans.
+
+    Parameters
+    -----------
+    X : csr_matrix of shape (n, p)
+        Sparse matrix of floats and nans.
+
+    Returns
+    --------
+    ArrayLike of shape (n,):
+        Array of the means or medians of the stored values of each row
+        of X, nan for rows without any value.
+
+    Raises
+    ------
+    ValueError
+        If agg_function is ``None``
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from scipy.sparse import csr_matrix
+    >>> from mapie.aggregation_functions import aggregate_sparse
+    >>> X = csr_matrix(
+    ...     (np.array([4., 1., 0., 3.]), ([0, 0, 0, 1], [0, 1, 2, 2])),
+    ...     shape=(3, 3),
+    ... )
+    >>> print(aggregate_sparse("median", X))
+    [ 1.  3. nan]
+    """
+    X = csr_matrix(X)
+    n_rows = X.shape[0]
+    row_ids = np.repeat(np.arange(n_rows), np.diff(X.indptr))
+    is_valid = ~np.isnan(X.data)
+    counts = np.bincount(row_ids[is_valid], minlength=n_rows)
+    if agg_function == "median":
+        # Values sorted in each row, nans last.
+        data_sorted = X.data[np.lexsort((X.data, row_ids))]
+        medians = []
+        for rank in [(counts - 1) // 2, counts // 2]:
+            index = np.clip(X.indptr[:-1] + rank, 0, len(data_sorted) - 1)
+            medians.append(
+                data_sorted[index] if len(data_sorted) > 0 else np.nan
+            )
+        return np.where(
+            counts > 0, (medians[0] + medians[1]) / 2, np.nan
+        )
+    elif agg_function == "mean":
+        sums = np.bincount(
+            row_ids[is_valid], weights=X.data[is_valid], minlength=n_rows
+        )
+        return np.divide(
+            sums,
+            counts,
+            out=np.full(n_rows, np.nan),
+            where=counts > 0,
+        )
+    raise ValueError("Aggregation function called but not defined.")
+
+
+def aggregate_with_counts(
+    agg_function: Optional[str], X: ArrayLike, counts: ArrayLike
+) -> ArrayLike:
+    """
+    Applies ``aggregate_all`` to the array obtained by repeating
+    each column ``j`` of X ``counts[j]`` times, without building it.
+
+    Parameters
+    -----------
+    X : ArrayLike of shape (n, p)
+        Array of floats and nans
+    counts : ArrayLike of shape (p,)
+        Number of repetitions of each column of X.
+
+    Returns
+    --------
+    ArrayLike of shape (n,):
+        Array of the means or medians of each repeated row of X
+
+    Raises
+    ------
+    ValueError
+        If agg_function is ``None``
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from mapie.aggregation_functions import aggregate_with_counts
+    >>> X = np.array([[1., 4.], [2., 8.]])
+    >>> aggregate_with_counts("mean", X, np.array([3, 1]))
+    array([1.75, 3.5 ])
+    >>> aggregate_with_counts("median", X, np.array([3, 1]))
+    array([1., 2.])
+    """
+    weights = np.where(np.isnan(X), 0, counts)
+    if agg_function == "median":
+        index_sorted = np.argsort(X, axis=1)
+        X_sorted = np.take_along_axis(X, index_sorted, axis=1)
+        cum_counts = np.cumsum(
+            np.take_along_axis(weights, index_sorted, axis=1), axis=1
+        )
+        n = cum_counts[:, -1:]
+        lower = np.take_along_axis(
+            X_sorted,
+            np.minimum(
+                np.sum(cum_counts <= (n - 1) // 2, axis=1, keepdims=True),
+                X.shape[1] - 1,
+            ),
+            axis=1,
+        )
+        upper = np.take_along_axis(
+            X_sorted,
+            np.minimum(
+                np.sum(cum_counts <= n // 2, axis=1, keepdims=True),
+                X.shape[1] - 1,
+            ),
+            axis=1,
+        )
+        return np.where(n > 0, (lower + upper) / 2, np.nan).ravel()
+    elif agg_function == "mean":
+        return np.sum(
+            np.nan_to_num(X) * weights, axis=1
+        ) / np.sum(weights, axis=1)
+    raise ValueError("Aggregation function called but not defined.")
@@ -1,18 +1,22 @@
 from __future__ import annotations
-from typing import Optional, Union, Tuple, Iterable
+import warnings
+from typing import Optional, Union, Tuple, Iterable, Iterator, cast
 
 import numpy as np
 from sklearn.base import BaseEstimator, ClassifierMixin
 from sklearn.linear_model import LogisticRegression
 from sklearn.model_selection import BaseCrossValidator
 from sklearn.pipeline import Pipeline
-from sklearn.utils import check_X_y, check_array, check_random_state
+from sklearn.utils import (
+    check_X_y, check_array, check_random_state, gen_batches
+)
 from sklearn.utils.multiclass import type_of_target
 from sklearn.utils.validation import check_is_fitted
 from sklearn.preprocessing import label_binarize
 
 from ._typing import ArrayLike
 from ._machine_precision import EPSILON
+from .quantile_functions import compute_quantiles_from_sorted
 from .utils import (
     check_null_weight,
     check_n_features_in,
@@ -20,7 +24,9 @@ from .utils import (
     check_alpha_and_n_samples,
     check_n_jobs,
     check_verbose,
-    check_input_is_image
+    check_input_is_image,
+    check_batch_size,
+    concatenate_batches
 )
 
 
@@ -97,6 +103,15 @@ class MapieClassifier(BaseEstimator, ClassifierMixin):  # type: ignore
 
         By default ``0``.
 
+    predict_from_proba: bool
+        Whether predicted labels are the labels of highest probability,
+        i.e. ``classes_[argmax(predict_proba(X))]``, so that ``predict``
+        runs a single inference of the estimator.
+        Set to ``False`` for estimators whose ``predict`` method does not
+        return the label of highest probability, to call it.
+
+        By default ``True``.
+
     Attributes
     ----------
     valid_methods: List[str]
@@ -114,8 +129,16 @@ class MapieClassifier(BaseEstimator, ClassifierMixin):  # type: ignore
     conformity_scores_ : np.ndarray of shape (n_samples_train)
         The conformity scores used to calibrate the prediction sets.
 
+    sorted_conformity_scores_ : np.ndarray of shape (n_samples_train,)
+        Conformity scores sorted in ascending order, so that quantiles
+        of conformity scores are simple index lookups at prediction time.
+
     quantiles_ : np.ndarray of shape (n_alpha)
-        The quantiles estimated from ``conformity_scores_`` and alpha values.
+        Deprecated, use ``get_quantiles`` instead.
+        The quantiles estimated from ``conformity_scores_`` and alpha values
+        during the last call of ``predict``. Predictions do not read this
+        attribute, but it is written by each call of ``predict``: it is
+        unreliable if several calls run concurrently on the same model.
 
     References
     ----------
@@ -163,7 +186,8 @@ class MapieClassifier(BaseEstimator, ClassifierMixin):  # type: ignore
         cv: Optional[str] = "prefit",
         n_jobs: Optional[int] = None,
         random_state: Optional[Union[int, np.random.RandomState]] = None,
-        verbose: int = 0
+        verbose: int = 0,
+        predict_from_proba: bool = True,
     ) -> None:
         self.estimator = estimator
         self.method = method
@@ -171,6 +195,7 @@ class MapieClassifier(BaseEstimator, ClassifierMixin):  # type: ignore
         self.n_jobs = n_jobs
         self.random_state = random_state
         self.verbose = verbose
+        self.predict_from_proba = predict_from_proba
 
     def _check_parameters(self) -> None:
         """
@@ -366,6 +391,7 @@ class MapieClassifier(BaseEstimator, ClassifierMixin):  # type: ignore
     def _get_last_index_included(
         self,
         y_pred_proba_cumsum: ArrayLike,
+        quantiles: ArrayLike,
         include_last_label: Optional[Union[bool, str]]
     ) -> ArrayLike:
         """
@@ -377,6 +403,8 @@ class MapieClassifier(BaseEstimator, ClassifierMixin):  # type: ignore
         ----------
         y_pred_proba_cumsum : ArrayLike of shape (n_samples, n_classes)
             Cumsumed probabilities in the original order.
+        quantiles : ArrayLike of shape (n_alpha,)
+            Quantiles of conformity scores.
         include_last_label : Union[bool, str]
             Whether or not include the last label. If 'randomized',
             the last label is included.
@@ -399,7 +427,7 @@ class MapieClassifier(BaseEstimator, ClassifierMixin):  # type: ignore
                         ),
                         axis=1
                     )
-                    for quantile in self.quantiles_
+                    for quantile in quantiles
                 ], axis=1
             )
         elif (include_last_label is False):
@@ -415,7 +443,7 @@ class MapieClassifier(BaseEstimator, ClassifierMixin):  # type: ignore
                         ),
                         axis=1
                     )
-                    for quantile in self.quantiles_
+                    for quantile in quantiles
                 ], axis=1
             )
         else:
@@ -426,12 +454,107 @@ class MapieClassifier(BaseEstimator, ClassifierMixin):  # type: ignore
 
         return y_pred_index_last
 
+    def _get_proba_cumsum(
+        self,
+        y_pred_proba: ArrayLike,
+        quantiles: ArrayLike,
+        include_last_label: Optional[Union[bool, str]],
+        n_top: int = 16,
+    ) -> ArrayLike:
+        """
+        Return the cumulated scores of labels sorted by decreasing
+        probability, at their original position.
+
+        Only the labels of highest probability are sorted: the ``n_top``
+        largest probabilities of each sample are selected with a partial
+        sort, and their number is doubled for samples whose cumulated
+        scores do not go beyond the largest quantile. Cumulated scores of
+        labels that are not sorted are set to ``np.inf``, so that they are
+        never selected by ``_get_last_index_included``, which gives the
+        same last included labels as with a full sort of the labels.
+        If the number of classes is lower than ``2 * n_top``,
+        all labels are sorted.
+
+        Parameters
+        ----------
+        y_pred_proba : ArrayLike of shape (n_samples, n_classes)
+            Predicted probabilities.
+        quantiles : ArrayLike of shape (n_alpha,)
+            Quantiles of conformity scores.
+        include_last_label : Union[bool, str]
+            Whether or not include the last label. If 'randomized',
+            the last label is included.
+        n_top : int
+            Initial number of sorted labels of each sample.
+            By default ``16``.
+
+        Returns
+        -------
+        ArrayLike of shape (n_samples, n_classes)
+            Cumsumed probabilities in the original order.
+        """
+        n_samples, n_classes = y_pred_proba.shape
+        y_pred_proba_cumsum = np.full((n_samples, n_classes), np.inf)
+        rows = np.arange(n_samples)
+        n_sorted = n_top if 2 * n_top < n_classes else n_classes
+        while len(rows) > 0:
+            y_proba = y_pred_proba[rows]
+            if n_sorted < n_classes:
+                # select the labels of highest probability
+                index_top = np.argpartition(
+                    y_proba, n_classes - n_sorted, axis=1
+                )[:, n_classes - n_sorted:]
+                index_sorted = np.take_along_axis(
+                    index_top,
+                    np.fliplr(np.argsort(
+                        np.take_along_axis(y_proba, index_top, axis=1),
+                        axis=1
+                    )),
+                    axis=1
+                )
+            else:
+                index_sorted = np.fliplr(np.argsort(y_proba, axis=1))
+            # get sorted cumulated score
+            y_proba_sorted_cumsum = np.cumsum(
+                np.take_along_axis(y_proba, index_sorted, axis=1), axis=1
+            )
+            if n_sorted == n_classes:
+                is_sorted = np.full(len(rows), True)
+            elif include_last_label is False:
+                # all labels with the last included cumulated score are
+                # sorted if a sorted cumulated score is above the threshold
+                threshold = np.maximum(
+                    np.max(quantiles), y_proba_sorted_cumsum[:, 0] + EPSILON
+                )
+                is_sorted = y_proba_sorted_cumsum[:, -1] > threshold
+            else:
+                # all labels with the last included cumulated score are
+                # sorted if a sorted cumulated score is above it
+                is_above = y_proba_sorted_cumsum >= np.max(quantiles)
+                cumsum_last = np.take_along_axis(
+                    y_proba_sorted_cumsum,
+                    np.argmax(is_above, axis=1).reshape(-1, 1),
+                    axis=1
+                )[:, 0]
+                is_sorted = (
+                    is_above[:, -1]
+                    & (y_proba_sorted_cumsum[:, -1] > cumsum_last)
+                )
+            y_pred_proba_cumsum[
+                rows[is_sorted].reshape(-1, 1), index_sorted[is_sorted]
+            ] = y_proba_sorted_cumsum[is_sorted]
+            rows = rows[~is_sorted]
+            n_sorted = min(2 * n_sorted, n_classes)
+        return y_pred_proba_cumsum
+
     def _add_random_tie_breaking(
         self,
         prediction_sets: ArrayLike,
         y_pred_index_last: ArrayLike,
         y_pred_proba_cumsum: ArrayLike,
-        y_pred_proba_last: ArrayLike
+        y_pred_proba_last: ArrayLike,
+        quantiles: ArrayLike,
+        us: ArrayLike
     ) -> ArrayLike:
         """
         Randomly remove last label from prediction set based on the
@@ -448,6 +571,10 @@ class MapieClassifier(BaseEstimator, ClassifierMixin):  # type: ignore
             Cumsumed probability of the model in the original order.
         y_pred_proba_last : ArrayLike of shape (n_samples, n_alpha)
             Last included probability.
+        quantiles : ArrayLike of shape (n_alpha,)
+            Quantiles of conformity scores.
+        us : ArrayLike of shape (n_samples,)
+            Uniform random numbers for each observation.
 
         Returns
         -------
@@ -458,14 +585,12 @@ class MapieClassifier(BaseEstimator, ClassifierMixin):  # type: ignore
         # filter sorting probabilities with kept labels
         y_proba_last_cumsumed = np.stack(
             [
-                np.squeeze(
-                    np.take_along_axis(
-                        y_pred_proba_cumsum,
-                        y_pred_index_last[:, iq].reshape(-1, 1),
-                        axis=1
-                    )
-                )
-                for iq, _ in enumerate(self.quantiles_)
+                np.take_along_axis(
+                    y_pred_proba_cumsum,
+                    y_pred_index_last[:, iq].reshape(-1, 1),
+                    axis=1
+                )[:, 0]
+                for iq, _ in enumerate(quantiles)
             ], axis=1
         )
         # compute V parameter from Romano+(2020)
@@ -474,13 +599,10 @@ class MapieClassifier(BaseEstimator, ClassifierMixin):  # type: ignore
                 (
                     y_proba_last_cumsumed[:, iq]
                     - quantile
-                ) / np.squeeze(y_pred_proba_last[:, :, iq])
-                for iq, quantile in enumerate(self.quantiles_)
+                ) / y_pred_proba_last[:, 0, iq]
+                for iq, quantile in enumerate(quantiles)
             ], axis=1,
         )
-        # get random numbers for each observation and alpha value
-        random_state = check_random_state(self.random_state)
-        us = random_state.uniform(size=prediction_sets.shape[0])
         # remove last label from comparison between uniform number and V
         vs_less_than_us = vs < us[:, np.newaxis]
         np.put_along_axis(
@@ -593,6 +715,9 @@ class MapieClassifier(BaseEstimator, ClassifierMixin):  # type: ignore
                 "Invalid method. "
                 "Allowed values are 'score' or 'cumulated_score'."
             )
+        self.sorted_conformity_scores_ = np.sort(
+            self.conformity_scores_, axis=None
+        )
 
         return self
 
@@ -601,6 +726,7 @@ class MapieClassifier(BaseEstimator, ClassifierMixin):  # type: ignore
         X: ArrayLike,
         alpha: Optional[Union[float, Iterable[float]]] = None,
         include_last_label: Optional[Union[bool, str]] = True,
+        batch_size: Optional[int] = None,
     ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
         """
         Prediction prediction sets on new samples based on target confidence
@@ -638,6 +764,14 @@ class MapieClassifier(BaseEstimator, ClassifierMixin):  # type: ignore
             and the quantile.
             By default ``True``.
 
+        batch_size: Optional[int]
+            Number of test samples processed at once.
+            Outputs of each batch are written into arrays preallocated
+            for all test samples, so that peak memory does not grow
+            with the number of test samples.
+            If ``None``, all test samples are processed at once.
+            By default ``None``.
+
         Returns
         -------
         Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]
@@ -647,14 +781,81 @@ class MapieClassifier(BaseEstimator, ClassifierMixin):  # type: ignore
         - Tuple[np.ndarray, np.ndarray] of shapes
         (n_samples,) and (n_samples, n_classes, n_alpha) if alpha is not None.
         """
-        # Checks
         include_last_label = self._check_include_last_label(include_last_label)
+        X, alpha_ = self._check_predict_input(X, alpha)
+        return concatenate_batches(
+            self._predict_iter(X, alpha_, include_last_label, batch_size),
+            len(X),
+        )
+
+    def predict_iter(
+        self,
+        X: ArrayLike,
+        alpha: Optional[Union[float, Iterable[float]]] = None,
+        include_last_label: Optional[Union[bool, str]] = True,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[Union[ArrayLike, Tuple[ArrayLike, ArrayLike]]]:
+        """
+        Predict prediction sets on successive batches of new samples.
+        See ``predict`` for details.
+
+        Parameters
+        ----------
+        X : ArrayLike of shape (n_samples, n_features)
+            Test data.
+
+        alpha: Optional[Union[float, Iterable[float]]]
+            Can be a float, a list of floats, or a ``np.ndarray`` of floats.
+            By default ``None``.
+
+        include_last_label: Optional[Union[bool, str]]
+            Whether or not to include last label in
+            prediction sets for the "cumulated_score" method.
+            By default ``True``.
+
+        batch_size: Optional[int]
+            Number of test samples in each batch.
+            If ``None``, all test samples are processed at once.
+            By default ``None``.
+
+        Returns
+        -------
+        Iterator[Union[ArrayLike, Tuple[ArrayLike, ArrayLike]]]
+            Outputs of ``predict`` for each batch of ``batch_size``
+            consecutive test samples.
+        """
+        include_last_label = self._check_include_last_label(include_last_label)
+        X, alpha_ = self._check_predict_input(X, alpha)
+        return self._predict_iter(X, alpha_, include_last_label, batch_size)
+
+    def _check_predict_input(
+        self,
+        X: ArrayLike,
+        alpha: Optional[Union[float, Iterable[float]]] = None,
+    ) -> Tuple[ArrayLike, Optional[ArrayLike]]:
+        """
+        Check that the model is fitted and check inputs of ``predict``.
+
+        Parameters
+        ----------
+        X : ArrayLike of shape (n_samples, n_features)
+            Test data.
+
+        alpha: Optional[Union[float, Iterable[float]]]
+            Can be a float, a list of floats, or a ``np.ndarray`` of floats.
+
+        Returns
+        -------
+        Tuple[ArrayLike, Optional[ArrayLike]]
+            Checked test data and alpha.
+        """
         alpha_ = check_alpha(alpha)
         check_is_fitted(
             self,
             [
                 "single_estimator_",
                 "conformity_scores_",
+                "sorted_conformity_scores_",
                 "n_features_in_",
                 "n_samples_val_",
             ],
@@ -665,54 +866,198 @@ class MapieClassifier(BaseEstimator, ClassifierMixin):  # type: ignore
             X, force_all_finite=False, ensure_2d=self.image_input,
             allow_nd=self.image_input, dtype=["float64", "object"]
         )
-        y_pred = self.single_estimator_.predict(X)
+        if alpha_ is not None:
+            check_alpha_and_n_samples(alpha_, self.n_samples_val_)
+        return X, alpha_
+
+    def _predict_iter(
+        self,
+        X: ArrayLike,
+        alpha_: Optional[ArrayLike],
+        include_last_label: Optional[Union[bool, str]],
+        batch_size: Optional[int] = None,
+    ) -> Iterator[Union[ArrayLike, Tuple[ArrayLike, ArrayLike]]]:
+        """
+        Generate the outputs of ``_predict_batch`` on successive batches
+        of checked test data.
+
+        Quantiles and random numbers used for tie-breaking are computed
+        once for all test samples, so that outputs do not depend on
+        the size of the batches.
+        """
+        us = None
+        quantiles = None
+        if alpha_ is not None:
+            quantiles = self._get_quantiles(alpha_)
+            # Only kept for the deprecated quantiles_ attribute.
+            self._last_quantiles = quantiles
+            if (
+                self.method in ["cumulated_score", "naive"]
+                and include_last_label == "randomized"
+            ):
+                # get random numbers for each observation
+                random_state = check_random_state(self.random_state)
+                us = random_state.uniform(size=len(X))
+        for batch in gen_batches(
+            len(X), check_batch_size(batch_size, len(X))
+        ):
+            yield self._predict_batch(
+                X[batch],
+                quantiles,
+                include_last_label,
+                None if us is None else us[batch],
+            )
+
+    @property
+    def quantiles_(self) -> ArrayLike:
+        if not hasattr(self, "_last_quantiles"):
+            raise AttributeError(
+                "'MapieClassifier' object has no attribute 'quantiles_'"
+            )
+        warnings.warn(
+            "quantiles_ is deprecated and unreliable if predict is called "
+            "concurrently: use get_quantiles(alpha) instead.",
+            FutureWarning,
+        )
+        return self._last_quantiles
+
+    def get_quantiles(
+        self, alpha: Union[float, Iterable[float]]
+    ) -> ArrayLike:
+        """
+        Quantiles of conformity scores used by ``predict`` to build
+        the prediction sets, for each value of ``alpha``.
+
+        The model is not modified, so that this method can be called
+        concurrently with ``predict``.
+
+        Parameters
+        ----------
+        alpha: Union[float, Iterable[float]]
+            Can be a float, a list of floats, or a ``np.ndarray`` of floats.
+            Between 0 and 1, see ``predict``.
+
+        Returns
+        -------
+        ArrayLike of shape (n_alpha,)
+            Quantiles of conformity scores.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from sklearn.datasets import make_classification
+        >>> from mapie.classification import MapieClassifier
+        >>> X, y = make_classification(
+        ...     n_classes=3, n_informative=3, random_state=1
+        ... )
+        >>> mapie = MapieClassifier().fit(X, y)
+        >>> print(np.round(mapie.get_quantiles([0.1, 0.5]), 2))
+        [0.72 0.25]
+        """
+        check_is_fitted(
+            self,
+            [
+                "conformity_scores_",
+                "sorted_conformity_scores_",
+                "n_samples_val_",
+            ],
+        )
+        alpha_ = cast(ArrayLike, check_alpha(alpha))
+        check_alpha_and_n_samples(alpha_, self.n_samples_val_)
+        return self._get_quantiles(alpha_)
+
+    def _get_quantiles(self, alpha_: ArrayLike) -> ArrayLike:
+        """
+        Compute the quantiles of conformity scores for each alpha,
+        by index lookups into ``sorted_conformity_scores_``.
+
+        The result is equal to ``np.quantile`` of ``conformity_scores_``
+        with "higher" interpolation at ``(n + 1) * (1 - alpha) / n``.
+
+        Parameters
+        ----------
+        alpha_: ArrayLike of shape (n_alpha,)
+            Checked alpha.
+
+        Returns
+        -------
+        ArrayLike of shape (n_alpha,)
+            Quantiles of conformity scores.
+        """
+        if self.method == "naive":
+            return 1 - alpha_
+        n = self.n_samples_val_
+        return compute_quantiles_from_sorted(
+            self.sorted_conformity_scores_,
+            ((n + 1) * (1 - alpha_)) / n,
+            interpolation="higher",
+        )
+
+    def _predict_batch(
+        self,
+        X: ArrayLike,
+        quantiles: Optional[ArrayLike],
+        include_last_label: Optional[Union[bool, str]],
+        us: Optional[ArrayLike] = None,
+    ) -> Union[ArrayLike, Tuple[ArrayLike, ArrayLike]]:
+        """
+        Predict prediction sets on checked test data.
+
+        Parameters
+        ----------
+        X : ArrayLike of shape (n_samples, n_features)
+            Checked test data.
+
+        quantiles: Optional[ArrayLike] of shape (n_alpha,)
+            Quantiles of conformity scores for each alpha,
+            ``None`` if alpha is ``None``.
+
+        include_last_label: Optional[Union[bool, str]]
+            Whether or not to include last label in
+            prediction sets for the "cumulated_score" method.
+
+        us: Optional[ArrayLike] of shape (n_samples,)
+            Uniform random numbers used if ``include_last_label``
+            is "randomized".
+
+        Returns
+        -------
+        Union[ArrayLike, Tuple[ArrayLike, ArrayLike]]
+            See ``predict``.
+        """
+        if not self.predict_from_proba:
+            y_pred = self.single_estimator_.predict(X)
+            if quantiles is None:
+                return np.array(y_pred)
         y_pred_proba = self.single_estimator_.predict_proba(X)
         y_pred_proba = self._check_proba_normalized(y_pred_proba)
-        n = self.n_samples_val_
-        if alpha_ is None:
+        if self.predict_from_proba:
+            # Single inference: labels of highest probability.
+            y_pred = np.asarray(self.single_estimator_.classes_)[
+                np.argmax(y_pred_proba, axis=1)
+            ]
+        if quantiles is None:
             return np.array(y_pred)
         else:
-
-            # Choice of the quantile
-            check_alpha_and_n_samples(alpha_, n)
-            if self.method == "naive":
-                self.quantiles_ = 1 - alpha_
-            else:
-                self.quantiles_ = np.stack([
-                    np.quantile(
-                        self.conformity_scores_,
-                        ((n + 1) * (1 - _alpha)) / n,
-                        interpolation="higher"
-                    ) for _alpha in alpha_
-                ])
             if self.method == "score":
                 prediction_sets = np.stack(
                     [
                         y_pred_proba > 1 - quantile
-                        for quantile in self.quantiles_
+                        for quantile in quantiles
                     ],
                     axis=2,
                 )
             elif self.method in ["cumulated_score", "naive"]:
-                # sort labels by decreasing probability
-                index_sorted = np.fliplr(np.argsort(y_pred_proba, axis=1))
-                # sort probabilities by decreasing order
-                y_pred_proba_sorted = np.take_along_axis(
-                    y_pred_proba, index_sorted, axis=1
-                )
-                # get sorted cumulated score
-                y_pred_proba_sorted_cumsum = np.cumsum(
-                    y_pred_proba_sorted, axis=1
-                )
                 # get cumulated score at their original position
-                y_pred_proba_cumsum = np.take_along_axis(
-                    y_pred_proba_sorted_cumsum,
-                    np.argsort(index_sorted),
-                    axis=1
+                y_pred_proba_cumsum = self._get_proba_cumsum(
+                    y_pred_proba,
+                    quantiles,
+                    include_last_label
                 )
                 # get index of the last included label
                 y_pred_index_last = self._get_last_index_included(
                     y_pred_proba_cumsum,
+                    quantiles,
                     include_last_label
                 )
                 # get the probability of the last included label
@@ -723,7 +1068,7 @@ class MapieClassifier(BaseEstimator, ClassifierMixin):  # type: ignore
                             y_pred_index_last[:, iq].reshape(-1, 1),
                             axis=1
                         )
-                        for iq, _ in enumerate(self.quantiles_)
+                        for iq, _ in enumerate(quantiles)
                     ], axis=2
                 )
                 # get the prediction set by taking all probabilities above the
@@ -731,7 +1076,7 @@ class MapieClassifier(BaseEstimator, ClassifierMixin):  # type: ignore
                 prediction_sets = np.stack(
                     [
                         y_pred_proba >= y_pred_proba_last[:, :, iq] - EPSILON
-                        for iq, _ in enumerate(self.quantiles_)
+                        for iq, _ in enumerate(quantiles)
                     ], axis=2
                 )
                 # remove last label randomly
@@ -740,14 +1085,16 @@ class MapieClassifier(BaseEstimator, ClassifierMixin):  # type: ignore
                         prediction_sets,
                         y_pred_index_last,
                         y_pred_proba_cumsum,
-                        y_pred_proba_last
+                        y_pred_proba_last,
+                        quantiles,
+                        us
                     )
             elif self.method == "top_k":
                 index_sorted = np.fliplr(np.argsort(y_pred_proba, axis=1))
                 y_pred_index_last = np.stack(
                     [
                         index_sorted[:, quantile]
-                        for quantile in self.quantiles_
+                        for quantile in quantiles
                     ], axis=1
                 )
                 y_pred_proba_last = np.stack(
@@ -757,13 +1104,13 @@ class MapieClassifier(BaseEstimator, ClassifierMixin):  # type: ignore
                             y_pred_index_last[:, iq].reshape(-1, 1),
                             axis=1
                         )
-                        for iq, _ in enumerate(self.quantiles_)
+                        for iq, _ in enumerate(quantiles)
                     ], axis=2
                 )
                 prediction_sets = np.stack(
                     [
                         y_pred_proba >= y_pred_proba_last[:, :, iq] - EPSILON
-                        for iq, _ in enumerate(self.quantiles_)
+                        for iq, _ in enumerate(quantiles)
                     ], axis=2
                 )
             else:
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from threading import Lock
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Union,
+    overload,
+)
+
+from joblib import dump, load
+from sklearn.base import RegressorMixin
+
+
+class EstimatorsStore(Sequence):  # type: ignore
+    """
+    Sequence of fitted estimators stored in a folder, one file per
+    estimator, and loaded on demand.
+
+    The most recently used estimators are kept in memory, up to
+    ``cache_size`` of them. Pickling the store only pickles the path
+    of the folder, so that it can be deployed with the folder and
+    loaded instantly.
+
+    Parameters
+    ----------
+    folder : str
+        Folder containing the estimators, dumped by ``dump``.
+
+    n_estimators : int
+        Number of estimators.
+
+    cache_size : int
+        Maximum number of estimators kept in memory.
+        By default ``8``.
+
+    mmap_mode : Optional[str]
+        Memory mapping mode of the arrays of the estimators, see
+        ``joblib.load``. By default ``"r"``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from tempfile import TemporaryDirectory
+    >>> from sklearn.linear_model import LinearRegression
+    >>> from mapie.estimators_store import EstimatorsStore
+    >>> X, y = np.array([[0], [1], [2]]), np.array([0, 1, 2])
+    >>> estimators = [LinearRegression().fit(X * i, y) for i in [1, 2]]
+    >>> with TemporaryDirectory() as folder:
+    ...     store = EstimatorsStore.dump(estimators, folder, cache_size=1)
+    ...     print(len(store), store[1].coef_)
+    2 [0.5]
+    """
+
+    def __init__(
+        self,
+        folder: str,
+        n_estimators: int,
+        cache_size: int = 8,
+        mmap_mode: Optional[str] = "r",
+    ) -> None:
+        if not isinstance(cache_size, int) or cache_size < 1:
+            raise ValueError(
+                "Invalid cache_size argument. Must be a positive integer."
+            )
+        self.folder = folder
+        self.n_estimators = n_estimators
+        self.cache_size = cache_size
+        self.mmap_mode = mmap_mode
+        self._cache: OrderedDict[int, RegressorMixin] = OrderedDict()
+        self._lock = Lock()
+
+    @classmethod
+    def dump(
+        cls,
+        estimators: Iterable[RegressorMixin],
+        folder: str,
+        cache_size: int = 8,
+        mmap_mode: Optional[str] = "r",
+    ) -> EstimatorsStore:
+        """
+        Dump estimators in a folder, one file per estimator.
+
+        Parameters
+        ----------
+        estimators : Iterable[RegressorMixin]
+            Fitted estimators.
+
+        folder : str
+            Folder where estimators are dumped. Created if needed.
+
+        cache_size : int
+            See ``EstimatorsStore``. By default ``8``.
+
+        mmap_mode : Optional[str]
+            See ``EstimatorsStore``. By default ``"r"``.
+
+        Returns
+        -------
+        EstimatorsStore
+            Store of the dumped estimators.
+        """
+        os.makedirs(folder, exist_ok=True)
+        n_estimators = 0
+        for i, estimator in enumerate(estimators):
+            dump(estimator, cls._get_filename(folder, i))
+            n_estimators += 1
+        return cls(folder, n_estimators, cache_size, mmap_mode)
+
+    def extend(self, estimators: Iterable[RegressorMixin]) -> None:
+        """
+        Dump more estimators in the folder, after the stored ones.
+
+        Parameters
+        ----------
+        estimators : Iterable[RegressorMixin]
+            Fitted estimators.
+        """
+        for estimator in estimators:
+            dump(estimator, self._get_filename(self.folder, len(self)))
+            self.n_estimators += 1
+
+    @staticmethod
+    def _get_filename(folder: str, index: int) -> str:
+        return os.path.join(folder, f"estimator_{index}.joblib")
+
+    def __len__(self) -> int:
+        return self.n_estimators
+
+    @overload
+    def __getitem__(self, index: int) -> RegressorMixin:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[RegressorMixin]:
+        ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[RegressorMixin, Sequence[RegressorMixin]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        index = range(len(self))[index]
+        with self._lock:
+            if index in self._cache:
+                self._cache.move_to_end(index)
+                return self._cache[index]
+        estimator = load(
+            self._get_filename(self.folder, index), mmap_mode=self.mmap_mode
+        )
+        with self._lock:
+            self._cache[index] = estimator
+            self._cache.move_to_end(index)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return estimator
+
+    def __iter__(self) -> Iterator[RegressorMixin]:
+        return (self[i] for i in range(len(self)))
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_cache"], state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._cache = OrderedDict()
+        self._lock = Lock()
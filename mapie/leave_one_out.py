@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+from typing import Iterator, Optional, Sequence, Tuple, Union, overload
+
+import numpy as np
+from sklearn.base import RegressorMixin, clone
+from sklearn.linear_model import LinearRegression, Ridge
+
+from ._typing import ArrayLike
+
+
+class LinearLeaveOneOutEstimators(Sequence):  # type: ignore
+    """
+    Leave-one-out linear models, stored as a matrix of coefficients.
+
+    Behaves like the list of the ``n_samples`` estimators fitted on all
+    training samples but one: each item is a fitted copy of the
+    estimator, built on demand. The predictions of all the models are
+    computed at once by ``predict_all``, with a single matrix product.
+
+    Parameters
+    ----------
+    estimator : RegressorMixin
+        Linear estimator, used as a template for the items.
+
+    coefs : ArrayLike of shape (n_samples, n_features)
+        Coefficients of each leave-one-out model.
+
+    intercepts : ArrayLike of shape (n_samples,)
+        Intercepts of each leave-one-out model.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from sklearn.linear_model import LinearRegression
+    >>> from mapie.leave_one_out import LinearLeaveOneOutEstimators
+    >>> estimators = LinearLeaveOneOutEstimators(
+    ...     LinearRegression(), np.array([[1.], [2.]]), np.array([0., 1.])
+    ... )
+    >>> print(len(estimators), estimators[1].coef_)
+    2 [2.]
+    >>> print(estimators.predict_all(np.array([[1.], [2.]])))
+    [[1. 3.]
+     [2. 5.]]
+    """
+
+    def __init__(
+        self,
+        estimator: RegressorMixin,
+        coefs: ArrayLike,
+        intercepts: ArrayLike,
+    ) -> None:
+        self.estimator = estimator
+        self.coefs = coefs
+        self.intercepts = intercepts
+
+    def __len__(self) -> int:
+        return len(self.intercepts)
+
+    @overload
+    def __getitem__(self, index: int) -> RegressorMixin:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[RegressorMixin]:
+        ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[RegressorMixin, Sequence[RegressorMixin]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        index = range(len(self))[index]
+        estimator = clone(self.estimator)
+        estimator.coef_ = self.coefs[index].copy()
+        estimator.intercept_ = self.intercepts[index]
+        estimator.n_features_in_ = self.coefs.shape[1]
+        return estimator
+
+    def __iter__(self) -> Iterator[RegressorMixin]:
+        return (self[i] for i in range(len(self)))
+
+    def predict_all(self, X: ArrayLike) -> ArrayLike:
+        """
+        Predict test data with all the leave-one-out models.
+
+        Parameters
+        ----------
+        X : ArrayLike of shape (n_samples_test, n_features)
+            Test data.
+
+        Returns
+        -------
+        ArrayLike of shape (n_samples_test, n_samples)
+            Predictions of each leave-one-out model.
+        """
+        return np.asarray(X, dtype=float) @ self.coefs.T + self.intercepts
+
+
+def _get_penalty(estimator: RegressorMixin) -> Optional[float]:
+    """
+    Get the L2 penalty of a linear estimator whose leave-one-out
+    models have a closed form, or ``None`` if there is no closed form.
+
+    Parameters
+    ----------
+    estimator : RegressorMixin
+        Estimator to check.
+
+    Returns
+    -------
+    Optional[float]
+        0 for ``LinearRegression``, ``alpha`` for ``Ridge``, ``None``
+        for other estimators or unsupported parameters.
+    """
+    params = estimator.get_params()
+    if params.get("normalize", False) not in [False, "deprecated"]:
+        return None
+    if params.get("positive", False):
+        return None
+    if type(estimator) is LinearRegression:
+        return 0.0
+    if (
+        type(estimator) is Ridge
+        and params["solver"] in ["auto", "cholesky", "svd"]
+        and np.ndim(params["alpha"]) == 0
+        and params["alpha"] >= 0
+    ):
+        return float(params["alpha"])
+    return None
+
+
+def fit_linear_leave_one_out(
+    estimator: RegressorMixin,
+    X: ArrayLike,
+    y: ArrayLike,
+    sample_weight: Optional[ArrayLike] = None,
+) -> Optional[Tuple[LinearLeaveOneOutEstimators, ArrayLike]]:
+    """
+    Fit the leave-one-out models of a ``LinearRegression`` or ``Ridge``
+    estimator in closed form, without refitting the estimator.
+
+    With ``Z`` the design matrix, with a column of ones if the estimator
+    fits an intercept, and ``A = Z^T Z + alpha * I`` (the intercept being
+    not penalized), the coefficients without the sample ``i`` are given
+    by the Sherman-Morrison formula:
+    ``beta_{-i} = beta - A^{-1} z_i e_i / (1 - h_i)``,
+    with ``e_i`` the residual of the full model and
+    ``h_i = z_i^T A^{-1} z_i`` the leverage of the sample.
+
+    ``A`` is never formed, which would square the condition number of
+    ``Z``: with ``U S V^T`` the thin SVD of ``Z`` stacked over the
+    square root of the penalty, ``A^{-1} Z^T = V S^{-1} U^T`` and the
+    leverages are the squared norms of the rows of ``U``.
+    The cost is O(n_samples * n_features^2).
+
+    Parameters
+    ----------
+    estimator : RegressorMixin
+        Estimator to fit on each leave-one-out training set.
+
+    X : ArrayLike of shape (n_samples, n_features)
+        Training data.
+
+    y : ArrayLike of shape (n_samples,)
+        Training labels.
+
+    sample_weight : Optional[ArrayLike] of shape (n_samples,)
+        Sample weights. There is no closed form with sample weights.
+        By default ``None``.
+
+    Returns
+    -------
+    Optional[Tuple[LinearLeaveOneOutEstimators, ArrayLike]]
+        ``None`` if there is no closed form for the estimator,
+        its parameters or the data, in particular if the design matrix
+        is numerically rank deficient. Otherwise:
+
+        - [0]: Leave-one-out models.
+        - [1]: Prediction of each sample by the model fitted without it,
+          of shape (n_samples,).
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from sklearn.linear_model import LinearRegression
+    >>> from mapie.leave_one_out import fit_linear_leave_one_out
+    >>> X = np.array([[0], [1], [2], [3]])
+    >>> y = np.array([0., 1., 2., 4.])
+    >>> estimators, y_pred = fit_linear_leave_one_out(
+    ...     LinearRegression(), X, y
+    ... )
+    >>> print(np.round(y_pred, 3))
+    [-0.667  1.143  2.571  3.   ]
+    >>> print(np.round(estimators[0].predict(X[:1]), 3))
+    [-0.667]
+    """
+    penalty = _get_penalty(estimator)
+    if penalty is None or sample_weight is not None:
+        return None
+    X = np.asarray(X)
+    y = np.asarray(y)
+    if X.dtype.kind not in "biuf" or y.dtype.kind not in "biuf":
+        return None
+    X = X.astype(float)
+    y = y.astype(float)
+    if not (np.all(np.isfinite(X)) and np.all(np.isfinite(y))):
+        return None
+    n_samples, n_features = X.shape
+    fit_intercept = estimator.get_params()["fit_intercept"]
+    if fit_intercept:
+        Z = np.column_stack([X, np.ones(n_samples)])
+    else:
+        Z = X
+    penalty_rows = np.zeros((n_features, Z.shape[1]))
+    penalty_rows[np.arange(n_features), np.arange(n_features)] = np.sqrt(
+        penalty
+    )
+    U, S, Vt = np.linalg.svd(
+        np.concatenate([Z, penalty_rows]), full_matrices=False
+    )
+    # Same tolerance as np.linalg.matrix_rank.
+    tol = S[0] * (n_samples + n_features) * np.finfo(float).eps
+    if S[-1] <= tol:
+        return None
+    U = U[:n_samples]
+    A_inv_Z = (U / S) @ Vt
+    beta = A_inv_Z.T @ y
+    errors = y - Z @ beta
+    leverages = np.sum(U ** 2, axis=1)
+    if np.any(leverages > 1 - 1e-10):
+        return None
+    loo_errors = errors / (1 - leverages)
+    betas = beta - A_inv_Z * loo_errors[:, np.newaxis]
+    if fit_intercept:
+        coefs, intercepts = betas[:, :-1], betas[:, -1]
+    else:
+        coefs, intercepts = betas, np.zeros(n_samples)
+    estimators = LinearLeaveOneOutEstimators(
+        clone(estimator), coefs, intercepts
+    )
+    return estimators, y - loo_errors
@@ -0,0 +1,350 @@
+from typing import Callable, List
+
+import numpy as np
+
+from ._typing import ArrayLike
+
+
+def _get_round_index(interpolation: str) -> Callable[[ArrayLike], ArrayLike]:
+    """
+    Rounding function of the index of order statistics
+    for the "lower" and "higher" interpolations.
+
+    Parameters
+    ----------
+    interpolation : str
+        Either "lower" or "higher".
+
+    Returns
+    -------
+    Callable[[ArrayLike], ArrayLike]
+        ``np.floor`` for "lower", ``np.ceil`` for "higher".
+
+    Raises
+    ------
+    ValueError
+        If interpolation is not "lower" or "higher".
+    """
+    if interpolation == "lower":
+        return np.floor
+    if interpolation == "higher":
+        return np.ceil
+    raise ValueError(
+        "Invalid interpolation. Allowed values are 'lower' and 'higher'."
+    )
+
+
+def compute_quantiles(
+    X: ArrayLike,
+    quantiles: ArrayLike,
+    interpolation: str,
+) -> ArrayLike:
+    """
+    Compute several quantiles of each row of X, ignoring nans,
+    with a single partial sort of the rows.
+
+    The result is equal to calling ``np.nanquantile`` for each quantile
+    with the same ``interpolation``, "lower" or "higher", i.e. the
+    order statistic of index ``floor((n - 1) * q)`` or
+    ``ceil((n - 1) * q)``, ``n`` being the number of non-nan values
+    of each row. Rows without any non-nan value give nans.
+
+    Parameters
+    ----------
+    X : ArrayLike of shape (n_rows, n_columns)
+        Array of floats and nans.
+    quantiles : ArrayLike of shape (n_quantiles,)
+        Quantiles to compute, between 0 and 1.
+    interpolation : str
+        Either "lower" or "higher".
+
+    Returns
+    -------
+    ArrayLike of shape (n_rows, n_quantiles)
+        Quantiles of each row of X.
+
+    Raises
+    ------
+    ValueError
+        If interpolation is not "lower" or "higher".
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from mapie.quantile_functions import compute_quantiles
+    >>> X = np.array([[4., 1., 3., 2.], [np.nan, 5., 7., 6.]])
+    >>> print(compute_quantiles(X, np.array([0.2, 0.5, 0.9]), "lower"))
+    [[1. 2. 3.]
+     [5. 6. 6.]]
+    """
+    round_index = _get_round_index(interpolation)
+    X = np.asarray(X, dtype=float)
+    is_nan = np.isnan(X)
+    if not np.any(is_nan):
+        # All rows have the same length: the same indices are selected
+        # in each row, and a partial sort is enough.
+        index = round_index(
+            (X.shape[1] - 1) * np.asarray(quantiles)
+        ).astype(int)
+        X_partitioned = np.partition(X, np.unique(index), axis=1)
+        return X_partitioned[:, index]
+    n_valid = X.shape[1] - np.sum(is_nan, axis=1, keepdims=True)
+    index = round_index(
+        (n_valid - 1) * np.asarray(quantiles)[np.newaxis, :]
+    ).astype(int)
+    X_sorted = np.sort(X, axis=1)
+    return np.where(
+        n_valid > 0,
+        np.take_along_axis(X_sorted, np.maximum(index, 0), axis=1),
+        np.nan,
+    )
+
+
+def compute_quantiles_from_sorted(
+    X_sorted: ArrayLike,
+    quantiles: ArrayLike,
+    interpolation: str,
+) -> ArrayLike:
+    """
+    Compute several quantiles of a 1D array already sorted in ascending
+    order and without nans, by simple index lookups.
+
+    The result is equal to ``np.quantile`` with the same
+    ``interpolation``, "lower" or "higher". An empty array gives nans.
+
+    Parameters
+    ----------
+    X_sorted : ArrayLike of shape (n_values,)
+        Values sorted in ascending order.
+    quantiles : ArrayLike of shape (n_quantiles,)
+        Quantiles to compute, between 0 and 1.
+    interpolation : str
+        Either "lower" or "higher".
+
+    Returns
+    -------
+    ArrayLike of shape (n_quantiles,)
+        Quantiles of X_sorted.
+
+    Raises
+    ------
+    ValueError
+        If interpolation is not "lower" or "higher".
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from mapie.quantile_functions import compute_quantiles_from_sorted
+    >>> X_sorted = np.array([1., 2., 3., 4.])
+    >>> print(compute_quantiles_from_sorted(X_sorted, [0.2, 0.5], "higher"))
+    [2. 3.]
+    """
+    round_index = _get_round_index(interpolation)
+    if len(X_sorted) == 0:
+        return np.full(len(quantiles), np.nan)
+    index = round_index((len(X_sorted) - 1) * np.asarray(quantiles))
+    return X_sorted[index.astype(int)]
+
+
+def count_less_or_equal(
+    offsets: ArrayLike,
+    values: ArrayLike,
+    thresholds: ArrayLike,
+) -> ArrayLike:
+    """
+    For each row ``j``, count the number of elements of ``values``
+    such that ``offsets[j] + values[i] <= thresholds[j]``.
+
+    The count is computed by a vectorized binary search, the sum
+    ``offsets[j] + values[i]`` being evaluated exactly as it would be
+    in a broadcast ``offsets[:, np.newaxis] + values``, so that the
+    result is free of rounding inconsistencies.
+
+    Parameters
+    ----------
+    offsets : ArrayLike of shape (n_rows,)
+        Offset added to ``values`` for each row.
+    values : ArrayLike of shape (n_values,)
+        Values sorted in ascending order.
+    thresholds : ArrayLike of shape (n_rows,)
+        Thresholds for each row.
+
+    Returns
+    -------
+    ArrayLike of shape (n_rows,)
+        Number of sums lower or equal to the threshold, for each row.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from mapie.quantile_functions import count_less_or_equal
+    >>> offsets = np.array([0., 10.])
+    >>> values = np.array([1., 2., 3.])
+    >>> print(count_less_or_equal(offsets, values, np.array([2., 12.5])))
+    [2 2]
+    """
+    n_values = len(values)
+    low = np.zeros(len(offsets), dtype=int)
+    high = np.full(len(offsets), n_values, dtype=int)
+    active = low < high
+    while np.any(active):
+        middle = np.minimum((low + high) // 2, n_values - 1)
+        is_lower = offsets + values[middle] <= thresholds
+        low = np.where(active & is_lower, middle + 1, low)
+        high = np.where(active & ~is_lower, middle, high)
+        active = low < high
+    return low
+
+
+def grouped_order_statistic(
+    offsets: ArrayLike,
+    groups: List[ArrayLike],
+    ranks: ArrayLike,
+) -> ArrayLike:
+    """
+    For each row ``j``, select the element of rank ``ranks[j]``
+    (starting from 0) among the multiset of sums
+    ``offsets[j, g] + groups[g][i]`` for all groups ``g``
+    and all elements ``i`` of each group.
+
+    The sums are never materialized: for each group, a binary search
+    finds the smallest sum whose global rank is high enough, the
+    global rank being counted with ``count_less_or_equal`` over all
+    the groups. The answer is the minimum of these candidates.
+    Memory is hence of order O(n_rows * n_groups + n_values)
+    instead of O(n_rows * n_values).
+
+    Parameters
+    ----------
+    offsets : ArrayLike of shape (n_rows, n_groups)
+        Offset of each row for each group.
+    groups : List[ArrayLike]
+        List of ``n_groups`` arrays, each sorted in ascending order.
+    ranks : ArrayLike of shape (n_rows,)
+        Rank of the selected order statistic, for each row.
+
+    Returns
+    -------
+    ArrayLike of shape (n_rows,)
+        Order statistics of the requested ranks.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from mapie.quantile_functions import grouped_order_statistic
+    >>> offsets = np.array([[0., 10.], [5., 0.]])
+    >>> groups = [np.array([1., 2., 3.]), np.array([0., 4.])]
+    >>> print(grouped_order_statistic(offsets, groups, np.array([3, 0])))
+    [10.  0.]
+    """
+    n_rows = offsets.shape[0]
+    ranks = np.broadcast_to(ranks, (n_rows,))
+    result = np.full(n_rows, np.inf)
+
+    def count(thresholds: ArrayLike) -> ArrayLike:
+        return np.sum(
+            [
+                count_less_or_equal(offsets[:, g], values, thresholds)
+                for g, values in enumerate(groups)
+            ],
+            axis=0,
+        )
+
+    for g, values in enumerate(groups):
+        if len(values) == 0:
+            continue
+        low = np.zeros(n_rows, dtype=int)
+        high = np.full(n_rows, len(values) - 1, dtype=int)
+        active = low < high
+        while np.any(active):
+            middle = (low + high) // 2
+            is_enough = count(offsets[:, g] + values[middle]) > ranks
+            low = np.where(active & ~is_enough, middle + 1, low)
+            high = np.where(active & is_enough, middle, high)
+            active = low < high
+        candidates = offsets[:, g] + values[low]
+        is_enough = count(candidates) > ranks
+        result = np.where(
+            is_enough, np.minimum(result, candidates), result
+        )
+    result[np.any(np.isnan(offsets), axis=1)] = np.nan
+    return result
+
+
+def insert_sorted(X_sorted: ArrayLike, values: ArrayLike) -> ArrayLike:
+    """
+    Insert values into a 1D array sorted in ascending order, keeping
+    it sorted. Values are sorted, and their positions are found by
+    binary search, hence a cost of O(n_values * log(n + n_values))
+    besides the copy of the array.
+
+    Parameters
+    ----------
+    X_sorted : ArrayLike of shape (n,)
+        Values sorted in ascending order.
+    values : ArrayLike of shape (n_values,)
+        Values to insert.
+
+    Returns
+    -------
+    ArrayLike of shape (n + n_values,)
+        Sorted array of all the values.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from mapie.quantile_functions import insert_sorted
+    >>> print(insert_sorted(np.array([1., 3., 5.]), np.array([4., 0.])))
+    [0. 1. 3. 4. 5.]
+    """
+    values_sorted = np.sort(values)
+    return np.insert(
+        X_sorted,
+        np.searchsorted(X_sorted, values_sorted, side="right"),
+        values_sorted,
+    )
+
+
+def delete_sorted(X_sorted: ArrayLike, values: ArrayLike) -> ArrayLike:
+    """
+    Delete one occurrence of each value from a 1D array sorted in
+    ascending order, keeping it sorted. Positions of the values are
+    found by binary search, hence a cost of
+    O(n_values * log(n + n_values)) besides the copy of the array.
+
+    Parameters
+    ----------
+    X_sorted : ArrayLike of shape (n,)
+        Values sorted in ascending order.
+    values : ArrayLike of shape (n_values,)
+        Values to delete, that must all be in ``X_sorted``, with
+        repetitions if they are deleted several times.
+
+    Returns
+    -------
+    ArrayLike of shape (n - n_values,)
+        Sorted array of the remaining values.
+
+    Raises
+    ------
+    ValueError
+        If some values are not in ``X_sorted``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from mapie.quantile_functions import delete_sorted
+    >>> print(delete_sorted(np.array([0., 1., 1., 3.]), np.array([1., 0.])))
+    [1. 3.]
+    """
+    values_sorted = np.sort(values)
+    # Equal values are deleted at consecutive positions.
+    ranks = np.arange(len(values_sorted)) - np.searchsorted(
+        values_sorted, values_sorted, side="left"
+    )
+    index = np.searchsorted(X_sorted, values_sorted, side="left") + ranks
+    if np.any(index >= len(X_sorted)) or np.any(
+        X_sorted[np.minimum(index, len(X_sorted) - 1)] != values_sorted
+    ):
+        raise ValueError("Invalid values. Values must be in X_sorted.")
+    return np.delete(X_sorted, index)
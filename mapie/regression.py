@@ -1,30 +1,67 @@
 from __future__ import annotations
 
 import warnings
-from typing import Iterable, List, Optional, Tuple, Union, cast
+from contextlib import ExitStack
+from itertools import chain
+from numbers import Integral
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import numpy as np
-import numpy.ma as ma
-from joblib import Parallel, delayed
+from joblib import Parallel, delayed, effective_n_jobs
+from scipy.sparse import csr_matrix, hstack
 from sklearn.base import BaseEstimator, RegressorMixin, clone
 from sklearn.linear_model import LinearRegression
 from sklearn.model_selection import BaseCrossValidator, KFold, LeaveOneOut
 from sklearn.pipeline import Pipeline
-from sklearn.utils import check_array, check_X_y
-from sklearn.utils.validation import check_is_fitted
+from sklearn.utils import check_array, check_X_y, gen_batches
+from sklearn.utils.validation import _num_samples, check_is_fitted
 
 from ._typing import ArrayLike
-from .aggregation_functions import aggregate_all, phi2D
+from .aggregation_functions import (
+    aggregate_all,
+    aggregate_sparse,
+    aggregate_with_counts,
+    phi2D,
+)
+from .estimators_store import EstimatorsStore
+from .leave_one_out import fit_linear_leave_one_out
+from .quantile_functions import (
+    compute_quantiles,
+    compute_quantiles_from_sorted,
+    delete_sorted,
+    grouped_order_statistic,
+    insert_sorted,
+)
 from .subsample import Subsample
 from .utils import (
+    as_slice_if_contiguous,
+    available_if,
     check_alpha,
     check_alpha_and_n_samples,
+    check_batch_size,
     check_n_features_in,
     check_n_jobs,
     check_nan_in_aposteriori_prediction,
     check_null_weight,
     check_verbose,
+    concatenate_batches,
     fit_estimator,
+    get_worker_id,
+    memmap_arrays,
+    supports_sample_weight,
 )
 
 
@@ -132,22 +169,72 @@ class MapieRegressor(BaseEstimator, RegressorMixin):  # type: ignore
 
     estimators_ : list
         List of out-of-folds estimators.
+        With ``LeaveOneOut`` and a ``LinearRegression`` or ``Ridge``
+        estimator, sequence of leave-one-out models computed in closed form,
+        see ``mapie.leave_one_out``.
+        After ``dump_estimators``, estimators stored in a folder,
+        see ``mapie.estimators_store``.
+        ``None`` if discarded by ``fit_predict_intervals``.
 
     residuals_ : np.ndarray of shape (n_samples_train,)
         Residuals between ``y_train`` and ``y_pred``.
+        After ``partial_fit`` with a full ``window``, circular buffer
+        of the residuals of the last samples, not in chronological order.
+
+    sorted_residuals_ : np.ndarray of shape (n_residuals,)
+        Non-nan residuals sorted in ascending order, so that quantiles
+        of residuals are simple index lookups at prediction time.
+
+    sorted_residuals_per_fold_ : List[np.ndarray]
+        Residuals of the samples of each fold, sorted in ascending order,
+        if cv is neither "prefit" nor a Subsample and the method is not
+        "naive". Used by the "plus" method when out-of-fold estimators
+        are shared by several training samples.
 
     k_ : np.ndarray
         - Id of the fold containing each training sample,
         if cv is not Resample. Of shape(n_samples_train,).
-        - Dummy array of folds containing each training sample, otherwise.
+        - Sparse boolean matrix indicating the resamplings for which each
+        training sample is out-of-bag, otherwise.
         Of shape (n_samples_train, n_resamplings).
 
+    y_pred_oob_ : csr_matrix of shape (n_samples_train, n_resamplings)
+        Out-of-bag predictions of each resampling, if cv is Subsample
+        and the method is not "naive". Its structure is ``k_``.
+
+    random_state_ : Union[RandomState, SeedSequence]
+        Random state of the resamplings, if cv is Subsample and the method
+        is not "naive", used to draw more resamplings in ``fit_more``.
+        Seed sequence spawning the stream of each resampling
+        if the Subsample has independent streams.
+
+    n_resamplings_ : int
+        Number of fitted resamplings, if cv is Subsample and the method
+        is not "naive". It counts the resamplings added by ``fit_more``,
+        whereas ``cv.n_resamplings`` is left unchanged.
+
     n_features_in_: int
         Number of features passed to the fit method.
 
     n_samples_val_: List[int]
         Number of samples passed to the fit method.
 
+    fit_stats_: Dict[str, Any]
+        Statistics of the fit, to find where time goes:
+
+        - "validation_time": time of the checks of inputs, in seconds.
+        - "fit_time": time of the fit of all the estimators.
+        - "aggregation_time": time of the computation of residuals.
+        - "single_estimator": fit of the estimator on the whole
+          training set, None if ``cv`` is "prefit". Dictionary with keys
+          "n_samples_train", "fit_time" and "worker".
+        - "folds": list of the fits of the out-of-fold models, with keys
+          "k", "n_samples_train", "n_samples_val", "fit_time",
+          "predict_time" and "worker". Empty for the "naive" method and
+          leave-one-out models computed in closed form.
+
+        Workers are identified by process id and thread name.
+
     References
     ----------
     Rina Foygel Barber, Emmanuel J. Candès,
@@ -314,8 +401,8 @@ class MapieRegressor(BaseEstimator, RegressorMixin):  # type: ignore
             "KFold, LeaveOneOut, or Subsample."
         )
 
+    @staticmethod
     def _fit_and_predict_oof_model(
-        self,
         estimator: RegressorMixin,
         X: ArrayLike,
         y: ArrayLike,
@@ -328,6 +415,10 @@ class MapieRegressor(BaseEstimator, RegressorMixin):  # type: ignore
         Fit a single out-of-fold model on a given training set and
         perform predictions on a test set.
 
+        This is a static method, so that the ``MapieRegressor`` itself
+        is not sent to the ``joblib`` workers. Only training rows are
+        copied: contiguous validation rows are a view of ``X``.
+
         Parameters
         ----------
         estimator : RegressorMixin
@@ -365,19 +456,135 @@ class MapieRegressor(BaseEstimator, RegressorMixin):  # type: ignore
           of shape (n_samples_val,).
 
         """
-        X_train, y_train, X_val = X[train_index], y[train_index], X[val_index]
-        if sample_weight is None:
-            estimator = fit_estimator(estimator, X_train, y_train)
-        else:
-            estimator = fit_estimator(
-                estimator, X_train, y_train, sample_weight[train_index]
+        output = MapieRegressor._fit_and_predict_oof_model_with_stats(
+            estimator, X, y, train_index, val_index, k, sample_weight
+        )
+        return output[0], output[1], output[2], output[3]
+
+    @staticmethod
+    def _fit_and_predict_oof_model_with_stats(
+        estimator: RegressorMixin,
+        X: ArrayLike,
+        y: ArrayLike,
+        train_index: ArrayLike,
+        val_index: ArrayLike,
+        k: int,
+        sample_weight: Optional[ArrayLike] = None,
+        X_test: Optional[ArrayLike] = None,
+        train_weight: Optional[ArrayLike] = None,
+    ) -> Tuple[
+        Optional[RegressorMixin],
+        ArrayLike,
+        ArrayLike,
+        ArrayLike,
+        Optional[ArrayLike],
+        Dict[str, Any],
+    ]:
+        """
+        Fit a single out-of-fold model as ``_fit_and_predict_oof_model``,
+        and record its fit and prediction times.
+        If test data are given, perform predictions on them and discard
+        the model.
+
+        Parameters
+        ----------
+        X_test : Optional[ArrayLike] of shape (n_samples_test, n_features)
+            Test data. By default None.
+
+        train_weight : Optional[ArrayLike] of shape (n_samples_train,)
+            Weights of the training samples in the resampling, multiplied
+            by their sample weights. By default None.
+
+        See ``_fit_and_predict_oof_model`` for the other parameters.
+
+        Returns
+        -------
+        Tuple[Optional[RegressorMixin], ArrayLike, ArrayLike, ArrayLike,
+        Optional[ArrayLike], Dict[str, Any]]
+
+        - [0]: Fitted estimator, None if test data are given
+        - [1:4]: See ``_fit_and_predict_oof_model``
+        - [4]: Estimator predictions on the test set,
+          of shape (n_samples_test,), None if no test data are given
+        - [5]: Statistics of the fold, see ``fit_stats_``
+        """
+        start = perf_counter()
+        X_train, y_train = X[train_index], y[train_index]
+        X_val = X[as_slice_if_contiguous(val_index)]
+        sample_weight_train = None
+        if sample_weight is not None:
+            sample_weight_train = sample_weight[train_index]
+        if train_weight is not None:
+            sample_weight_train = (
+                train_weight
+                if sample_weight_train is None
+                else sample_weight_train * train_weight
             )
+        estimator = fit_estimator(
+            estimator, X_train, y_train, sample_weight_train
+        )
+        fit_time = perf_counter() - start
+        start = perf_counter()
         if X_val.shape[0] > 0:
             y_pred = estimator.predict(X_val)
         else:
             y_pred = np.array([])
+        y_pred_test = None
+        if X_test is not None:
+            y_pred_test = estimator.predict(X_test)
+            estimator = None
+        predict_time = perf_counter() - start
         val_id = np.full_like(y_pred, k, dtype=int)
-        return estimator, y_pred, val_id, val_index
+        stats = {
+            "k": k,
+            "n_samples_train": _num_samples(X_train),
+            "n_samples_val": _num_samples(X_val),
+            "fit_time": fit_time,
+            "predict_time": predict_time,
+            "worker": get_worker_id(),
+        }
+        return estimator, y_pred, val_id, val_index, y_pred_test, stats
+
+    @staticmethod
+    def _fit_estimator_with_stats(
+        estimator: RegressorMixin,
+        X: ArrayLike,
+        y: ArrayLike,
+        sample_weight: Optional[ArrayLike] = None,
+    ) -> Tuple[RegressorMixin, Dict[str, Any]]:
+        """
+        Fit an estimator with ``fit_estimator`` and record its fit time.
+
+        Parameters
+        ----------
+        estimator : RegressorMixin
+            Estimator to train.
+
+        X : ArrayLike of shape (n_samples, n_features)
+            Input data.
+
+        y : ArrayLike of shape (n_samples,)
+            Input labels.
+
+        sample_weight : Optional[ArrayLike] of shape (n_samples,)
+            Sample weights. If None, then samples are equally weighted.
+            By default None.
+
+        Returns
+        -------
+        Tuple[RegressorMixin, Dict[str, Any]]
+
+        - [0]: Fitted estimator
+        - [1]: Statistics of the fit, see ``fit_stats_``
+        """
+        start = perf_counter()
+        estimator = fit_estimator(estimator, X, y, sample_weight)
+        stats = {
+            "n_samples_train": _num_samples(X),
+            "fit_time": perf_counter() - start,
+            "worker": get_worker_id(),
+        }
+        return estimator, stats
 
     def aggregate_with_mask(self, x: ArrayLike, k: ArrayLike) -> ArrayLike:
         """
@@ -393,9 +600,9 @@ class MapieRegressor(BaseEstimator, RegressorMixin):  # type: ignore
                 Array of predictions, made by the refitted estimators,
                 for each sample of the testing set.
             k : ArrayLike of shape (n_samples_training, n_estimators)
-                1-or-nan array: indicates whether to integrate the prediction
-                of a given estimator into the aggregation, for each training
-                sample.
+                1-or-nan array, or sparse boolean matrix such as ``k_``:
+                indicates whether to integrate the prediction of a given
+                estimator into the aggregation, for each training sample.
 
         Returns:
         --------
@@ -404,18 +611,133 @@ class MapieRegressor(BaseEstimator, RegressorMixin):  # type: ignore
 
 
         """
-        if self.agg_function == "median":
-            return phi2D(A=x, B=k, fun=lambda x: np.nanmedian(x, axis=1))
-        elif self.agg_function == "mean":
-            # If self.agg_function == "mean", the aggregation coud be done
-            # with phi2D(A=x, B=k, fun=lambda x: np.nanmean(x, axis=1).
-            # However, phi2D contains a np.apply_along_axis loop which
-            # is much slower than the matrices multiplication that can
-            # be used to compute the means.
-            K = np.nan_to_num(k, nan=0.0)
-            return np.matmul(x, (K / (K.sum(axis=1, keepdims=True))).T)
+        if self.agg_function in ["mean", "median"]:
+            # Specialised kernels of phi2D, without the loop over
+            # testing samples of np.apply_along_axis.
+            return phi2D(A=x, B=k, fun=self.agg_function)
         raise ValueError("Aggregation function called but not defined.")
 
+    def _predict_oof_estimators(self, X: ArrayLike) -> ArrayLike:
+        """
+        Predict test data with all the out-of-fold estimators.
+
+        Inference is distributed with ``joblib`` according to ``n_jobs``.
+        Threads are preferred, since most estimators release the GIL
+        at prediction time. Another backend can be selected with the
+        ``joblib.parallel_backend`` context manager.
+
+        Estimators are dispatched by batches of ``2 * n_jobs``, each
+        batch being written into the preallocated output before the next
+        one is predicted, so that at most one batch of predictions
+        is held on top of the output.
+
+        Parameters
+        ----------
+        X : ArrayLike of shape (n_samples, n_features)
+            Checked test data.
+
+        Returns
+        -------
+        ArrayLike of shape (n_samples, n_estimators)
+            Predictions of each out-of-fold estimator.
+        """
+        estimators = self._check_estimators_kept()
+        y_pred_multi = np.empty(
+            (_num_samples(X), len(estimators)), dtype=float
+        )
+        if hasattr(estimators, "predict_all"):
+            y_pred_multi[:] = estimators.predict_all(X)
+        elif self.n_jobs in [None, 1]:
+            for i, estimator in enumerate(estimators):
+                y_pred_multi[:, i] = estimator.predict(X)
+        else:
+            batch_size = 2 * effective_n_jobs(self.n_jobs)
+            with Parallel(
+                n_jobs=self.n_jobs, verbose=self.verbose, prefer="threads"
+            ) as parallel:
+                for batch in gen_batches(len(estimators), batch_size):
+                    y_pred_multi[:, batch] = np.column_stack(
+                        parallel(
+                            delayed(estimator.predict)(X)
+                            for estimator in estimators[batch]
+                        )
+                    )
+        return y_pred_multi
+
+    def _check_estimators_kept(self) -> Sequence[RegressorMixin]:
+        """
+        Check that the out-of-fold estimators were not discarded by
+        ``fit_predict_intervals``.
+
+        Returns
+        -------
+        Sequence[RegressorMixin]
+            Out-of-fold estimators.
+
+        Raises
+        ------
+        ValueError
+            If ``estimators_`` is ``None``.
+        """
+        if self.estimators_ is None:
+            raise ValueError(
+                "Invalid estimators_ attribute. Out-of-fold estimators "
+                "were discarded by fit_predict_intervals: call fit to "
+                "use them."
+            )
+        return self.estimators_
+
+    def _compute_bounds_per_fold(
+        self, y_pred_multi: ArrayLike, alpha_: ArrayLike
+    ) -> Tuple[ArrayLike, ArrayLike]:
+        """
+        Compute the lower and upper bounds of the "plus" method
+        when the out-of-fold estimators are shared by several training
+        samples, as in K-fold cross-validation.
+
+        The bounds are the quantiles of
+        ``y_pred_multi[:, self.k_] -/+ self.residuals_``. Instead of
+        building these matrices of shape (n_samples_test, n_samples_train),
+        the order statistics are selected across the residuals of each
+        fold, sorted at fit time, for each testing sample.
+
+        Parameters
+        ----------
+        y_pred_multi : ArrayLike of shape (n_samples_test, n_estimators)
+            Predictions of the out-of-fold estimators.
+        alpha_ : ArrayLike of shape (n_alpha,)
+            Complements of the target coverage levels.
+
+        Returns
+        -------
+        Tuple[ArrayLike, ArrayLike] of shapes
+        (n_samples_test, n_alpha) and (n_samples_test, n_alpha)
+            Lower and upper bounds of the prediction intervals.
+        """
+        n = len(self.residuals_)
+        groups = self.sorted_residuals_per_fold_
+        y_pred_low = np.column_stack(
+            [
+                -grouped_order_statistic(
+                    -y_pred_multi,
+                    groups,
+                    n - 1 - np.floor((n - 1) * _alpha).astype(int),
+                )
+                for _alpha in alpha_
+            ]
+        )
+        y_pred_up = np.column_stack(
+            [
+                grouped_order_statistic(
+                    y_pred_multi,
+                    groups,
+                    np.ceil((n - 1) * (1 - _alpha)).astype(int),
+                )
+                for _alpha in alpha_
+            ]
+        )
+        return y_pred_low, y_pred_up
+
     def fit(
         self,
         X: ArrayLike,
@@ -452,7 +774,44 @@ class MapieRegressor(BaseEstimator, RegressorMixin):  # type: ignore
         MapieRegressor
             The model itself.
         """
+        self._fit(X, y, sample_weight)
+        return self
+
+    def _fit(
+        self,
+        X: ArrayLike,
+        y: ArrayLike,
+        sample_weight: Optional[ArrayLike] = None,
+        X_test: Optional[ArrayLike] = None,
+    ) -> Optional[ArrayLike]:
+        """
+        Fit estimator and compute residuals, see ``fit``.
+        If test data are given, out-of-fold models predict them as soon
+        as they are fitted, and are discarded.
+
+        Parameters
+        ----------
+        X : ArrayLike of shape (n_samples, n_features)
+            Training data.
+
+        y : ArrayLike of shape (n_samples,)
+            Training labels.
+
+        sample_weight : Optional[ArrayLike] of shape (n_samples,)
+            Sample weights, see ``fit``.
+            By default None.
+
+        X_test : Optional[ArrayLike] of shape (n_samples_test, n_features)
+            Checked test data. By default None.
+
+        Returns
+        -------
+        Optional[ArrayLike] of shape (n_samples_test, n_estimators)
+            Predictions of the out-of-fold models on the test data,
+            ``None`` if there are no test data or no out-of-fold models.
+        """
         # Checks
+        start = perf_counter()
         self._check_parameters()
         cv = self._check_cv(self.cv)
         estimator = self._check_estimator(self.estimator)
@@ -461,205 +820,1212 @@ class MapieRegressor(BaseEstimator, RegressorMixin):  # type: ignore
         )
         self.n_features_in_ = check_n_features_in(X, cv, estimator)
         sample_weight, X, y = check_null_weight(sample_weight, X, y)
+        self.fit_stats_: Dict[str, Any] = {
+            "validation_time": perf_counter() - start,
+            "single_estimator": None,
+            "folds": [],
+        }
 
         # Initialization
-        self.estimators_: List[RegressorMixin] = []
+        self.estimators_: Sequence[RegressorMixin] = []
 
         if isinstance(cv, Subsample):
-            self.k_ = np.full(
-                shape=(len(y), cv.n_resamplings),
-                fill_value=np.nan,
-                dtype=float,
-            )
-
-            pred_after_resampling = np.full(
-                shape=(len(y), cv.n_resamplings),
-                fill_value=np.nan,
-                dtype=float,
-            )
+            self.k_ = csr_matrix((len(y), cv.n_resamplings), dtype=bool)
         else:
             self.k_ = np.empty_like(y, dtype=int)
 
         y_pred = np.empty_like(y, dtype=float)
+        y_pred_multi_test = None
 
         # Work
+        start = perf_counter()
+        outputs = None
         if cv == "prefit":
             self.single_estimator_ = estimator
             y_pred = self.single_estimator_.predict(X)
             self.n_samples_val_ = [X.shape[0]]
         else:
-            self.single_estimator_ = fit_estimator(
-                clone(estimator), X, y, sample_weight
-            )
+            linear_loo = None
+            if self.method != "naive" and isinstance(cv, LeaveOneOut):
+                # Closed form of the leave-one-out models, if any,
+                # instead of n_samples refits.
+                linear_loo = fit_linear_leave_one_out(
+                    estimator, X, y, sample_weight
+                )
+            if self.method == "naive" or linear_loo is not None:
+                (
+                    self.single_estimator_,
+                    self.fit_stats_["single_estimator"],
+                ) = self._fit_estimator_with_stats(
+                    clone(estimator), X, y, sample_weight
+                )
             if self.method == "naive":
                 y_pred = self.single_estimator_.predict(X)
                 self.n_samples_val_ = [X.shape[0]]
+            elif linear_loo is not None:
+                self.estimators_, y_pred = linear_loo
+                self.k_ = np.arange(len(y))
+                self.n_samples_val_ = [1] * len(y)
+                if X_test is not None:
+                    y_pred_multi_test = self.estimators_.predict_all(X_test)
             else:
-                outputs = Parallel(n_jobs=self.n_jobs, verbose=self.verbose)(
-                    delayed(self._fit_and_predict_oof_model)(
-                        clone(estimator),
-                        X,
-                        y,
-                        train_index,
-                        val_index,
-                        k,
-                        sample_weight,
-                    )
-                    for k, (train_index, val_index) in enumerate(cv.split(X))
-                )
-                self.estimators_, predictions, val_ids, val_indices = map(
-                    list, zip(*outputs)
-                )
-
-                self.n_samples_val_ = [
-                    np.array(pred).shape[0] for pred in predictions
-                ]
-
                 if isinstance(cv, Subsample):
-                    for i, val_ind in enumerate(val_indices):
-                        pred_after_resampling[val_ind, i] = predictions[i]
-                        self.k_[val_ind, i] = 1
-                    check_nan_in_aposteriori_prediction(pred_after_resampling)
-
-                    y_pred = aggregate_all(
-                        self.agg_function, pred_after_resampling
+                    # The random state is kept to draw more resamplings
+                    # in ``fit_more``.
+                    self.random_state_ = cv._get_random_state()
+                    self.n_resamplings_ = cv.n_resamplings
+                    splits = self._split_subsample(
+                        cv, estimator, X, cv.n_resamplings
                     )
                 else:
-                    predictions, val_ids, val_indices = map(
-                        np.concatenate, (predictions, val_ids, val_indices)
+                    splits = (
+                        (train_index, val_index, None)
+                        for train_index, val_index in cast(
+                            BaseCrossValidator, cv
+                        ).split(X)
                     )
-                    self.k_[val_indices] = val_ids
-                    y_pred[val_indices] = predictions
+                (
+                    self.single_estimator_,
+                    self.fit_stats_["single_estimator"],
+                    outputs,
+                ) = self._fit_oof_models(
+                    estimator, splits, X, y, sample_weight, X_test
+                )
+        self.fit_stats_["fit_time"] = perf_counter() - start
+
+        start = perf_counter()
+        if outputs is not None:
+            (
+                self.estimators_,
+                predictions,
+                val_ids,
+                val_indices,
+                predictions_test,
+                self.fit_stats_["folds"],
+            ) = map(list, zip(*outputs))
+            if X_test is not None:
+                # Estimators are replaced by their predictions
+                # on the test data.
+                y_pred_multi_test = np.column_stack(predictions_test)
+
+            self.n_samples_val_ = [
+                np.array(pred).shape[0] for pred in predictions
+            ]
+
+            if isinstance(cv, Subsample):
+                self.y_pred_oob_ = self._get_oob_predictions(
+                    predictions, val_indices, len(y)
+                )
+                y_pred = self._aggregate_oob_predictions()
+            else:
+                predictions, val_ids, val_indices = map(
+                    np.concatenate, (predictions, val_ids, val_indices)
+                )
+                self.k_[val_indices] = val_ids
+                y_pred[val_indices] = predictions
 
         self.residuals_ = np.abs(y - y_pred)
-        return self
+        self._residuals_head = 0
+        residuals = np.asarray(self.residuals_, dtype=float)
+        self.sorted_residuals_ = np.sort(residuals[~np.isnan(residuals)])
+        if outputs is not None and not isinstance(cv, Subsample):
+            # Residuals are sorted by fold once for all, instead of
+            # at each prediction of the "plus" method.
+            self.sorted_residuals_per_fold_ = np.split(
+                residuals[np.lexsort((residuals, self.k_))],
+                np.cumsum(np.bincount(self.k_, minlength=len(outputs)))[:-1],
+            )
+        self.fit_stats_["aggregation_time"] = perf_counter() - start
+        return y_pred_multi_test
 
-    def predict(
+    def _split_subsample(
         self,
+        cv: Subsample,
+        estimator: RegressorMixin,
         X: ArrayLike,
-        alpha: Optional[Union[float, Iterable[float]]] = None,
-    ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+        n_resamplings: int,
+    ) -> Iterator[Tuple[ArrayLike, ArrayLike, Optional[ArrayLike]]]:
         """
-        Predict target on new samples with confidence intervals.
-        Residuals from the training set and predictions from the model clones
-        are central to the computation.
-        Prediction Intervals for a given ``alpha`` are deduced from either
-
-        - quantiles of residuals (naive and base methods),
-        - quantiles of (predictions +/- residuals) (plus method),
-        - quantiles of (max/min(predictions) +/- residuals) (minmax method).
+        Draw resamplings of a ``Subsample`` from ``random_state_``.
+        They are given as weights of the unique training samples if
+        ``bootstrap_weights`` is set and the estimator supports
+        sample weights.
 
         Parameters
         ----------
+        cv : Subsample
+            Checked cross-validator.
+
+        estimator : RegressorMixin
+            Checked estimator.
+
         X : ArrayLike of shape (n_samples, n_features)
-            Test data.
+            Checked training data.
 
-        alpha: Optional[Union[float, Iterable[float]]]
-            Can be a float, a list of floats, or a ``np.ndarray`` of floats.
-            Between 0 and 1, represents the uncertainty of the confidence
-            interval.
-            Lower ``alpha`` produce larger (more conservative) prediction
-            intervals.
-            ``alpha`` is the complement of the target coverage level.
-            By default ``None``.
+        n_resamplings : int
+            Number of resamplings.
 
         Returns
         -------
-        Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]
+        Iterator[Tuple[ArrayLike, ArrayLike, Optional[ArrayLike]]]
+            Training indices, validation indices and training weights,
+            ``None`` if samples are repeated, of each resampling.
+        """
+        if cv.bootstrap_weights is not None and supports_sample_weight(
+            estimator
+        ):
+            return cv._split_weights(X, self.random_state_, n_resamplings)
+        return (
+            (train_index, val_index, None)
+            for train_index, val_index in cv._split(
+                X, self.random_state_, n_resamplings
+            )
+        )
 
-        - np.ndarray of shape (n_samples,) if alpha is None.
+    @staticmethod
+    def _get_oob_predictions(
+        predictions: List[ArrayLike],
+        val_indices: List[ArrayLike],
+        n_samples: int,
+    ) -> csr_matrix:
+        """
+        Store out-of-bag predictions in a sparse matrix, whose structure
+        is the out-of-bag membership matrix.
 
-        - Tuple[np.ndarray, np.ndarray] of shapes
-        (n_samples,) and (n_samples, 2, n_alpha) if alpha is not None.
+        Parameters
+        ----------
+        predictions : List[ArrayLike]
+            Out-of-bag predictions of each resampling.
 
-            - [:, 0, :]: Lower bound of the prediction interval.
-            - [:, 1, :]: Upper bound of the prediction interval.
+        val_indices : List[ArrayLike]
+            Out-of-bag indices of each resampling.
+
+        n_samples : int
+            Number of training samples.
+
+        Returns
+        -------
+        csr_matrix of shape (n_samples, n_resamplings)
+            Out-of-bag predictions.
         """
-        # Checks
-        check_is_fitted(
-            self,
-            [
-                "single_estimator_",
-                "estimators_",
-                "k_",
-                "residuals_",
-                "n_features_in_",
-                "n_samples_val_",
-            ],
+        return csr_matrix(
+            (
+                np.concatenate(predictions).astype(float),
+                (
+                    np.concatenate(val_indices),
+                    np.repeat(
+                        np.arange(len(val_indices)),
+                        [len(ind) for ind in val_indices],
+                    ),
+                ),
+            ),
+            shape=(n_samples, len(val_indices)),
         )
-        alpha_ = check_alpha(alpha)
-        X = check_array(X, force_all_finite=False, dtype=["float64", "object"])
-        y_pred = self.single_estimator_.predict(X)
 
-        if alpha is None:
-            return np.array(y_pred)
-        else:
-            alpha_ = cast(np.ndarray, alpha_)
-            check_alpha_and_n_samples(alpha_, self.residuals_.shape[0])
-            if self.method in ["naive", "base"] or self.cv == "prefit":
-                quantile = np.quantile(
-                    self.residuals_, 1 - alpha_, interpolation="higher"
+    def _aggregate_oob_predictions(self) -> ArrayLike:
+        """
+        Set the out-of-bag membership matrix ``k_`` from the structure
+        of the out-of-bag predictions ``y_pred_oob_``, and aggregate them.
+
+        Returns
+        -------
+        ArrayLike of shape (n_samples_train,)
+            Aggregated out-of-bag predictions of each training sample.
+        """
+        self.k_ = csr_matrix(
+            (
+                np.ones_like(self.y_pred_oob_.data, dtype=bool),
+                self.y_pred_oob_.indices,
+                self.y_pred_oob_.indptr,
+            ),
+            shape=self.y_pred_oob_.shape,
+        )
+        check_nan_in_aposteriori_prediction(self.y_pred_oob_)
+        return aggregate_sparse(self.agg_function, self.y_pred_oob_)
+
+    def _fit_oof_models(
+        self,
+        estimator: RegressorMixin,
+        splits: Iterable[Tuple[ArrayLike, ArrayLike, Optional[ArrayLike]]],
+        X: ArrayLike,
+        y: ArrayLike,
+        sample_weight: Optional[ArrayLike] = None,
+        X_test: Optional[ArrayLike] = None,
+        k_start: int = 0,
+        fit_single_estimator: bool = True,
+    ) -> Tuple[
+        Optional[RegressorMixin],
+        Optional[Dict[str, Any]],
+        List[Tuple[Any, ...]],
+    ]:
+        """
+        Fit the estimator on the whole training set and the out-of-fold
+        models, in the same ``joblib`` pool.
+
+        Parameters
+        ----------
+        estimator : RegressorMixin
+            Checked estimator.
+
+        splits : Iterable[Tuple[ArrayLike, ArrayLike, Optional[ArrayLike]]]
+            Training indices, validation indices and training weights
+            of each out-of-fold model.
+
+        X : ArrayLike of shape (n_samples, n_features)
+            Checked training data.
+
+        y : ArrayLike of shape (n_samples,)
+            Checked training labels.
+
+        sample_weight : Optional[ArrayLike] of shape (n_samples,)
+            Sample weights. By default None.
+
+        X_test : Optional[ArrayLike] of shape (n_samples_test, n_features)
+            Checked test data. If given, out-of-fold models are discarded
+            after predicting them. By default None.
+
+        k_start : int
+            Id of the first out-of-fold model. By default ``0``.
+
+        fit_single_estimator : bool
+            Whether to fit the estimator on the whole training set.
+            By default ``True``.
+
+        Returns
+        -------
+        Tuple[
+            Optional[RegressorMixin],
+            Optional[Dict[str, Any]],
+            List[Tuple[Any, ...]],
+        ]
+
+        - [0]: Estimator fitted on the whole training set, ``None`` if
+          ``fit_single_estimator`` is ``False``
+        - [1]: Statistics of its fit, ``None`` if not fitted
+        - [2]: Outputs of ``_fit_and_predict_oof_model_with_stats``
+          for each split
+        """
+        with ExitStack() as stack:
+            # With several jobs, training data are memory mapped
+            # once, and workers only receive the indices of each split.
+            # The folder of the memory maps is only created then.
+            if effective_n_jobs(self.n_jobs) != 1:
+                folder = stack.enter_context(
+                    TemporaryDirectory(prefix="mapie_")
                 )
-                y_pred_low = y_pred[:, np.newaxis] - quantile
-                y_pred_up = y_pred[:, np.newaxis] + quantile
-            else:
-                y_pred_multi = np.column_stack(
-                    [e.predict(X) for e in self.estimators_]
+                X_, y_, sample_weight_, X_test_ = memmap_arrays(
+                    (X, y, sample_weight, X_test), folder
                 )
-
-                # At this point, y_pred_multi is of shape
-                # (n_samples_test, n_estimators_).
-                # If ``method`` is "plus":
-                #   - if ``cv`` is not a ``Subsample``,
-                #       we enforce y_pred_multi to be of shape
-                #       (n_samples_test, n_samples_train),
-                #       thanks to the folds identifier.
-                #   - if ``cv``is a ``Subsample``, the methode
-                #       ``aggregate_with_mask`` fits it to the right size
-                #       thanks to the shape of k_.
-
-                if isinstance(self.cv, Subsample):
-                    y_pred_multi = self.aggregate_with_mask(
-                        y_pred_multi, self.k_
+            else:
+                X_, y_, sample_weight_, X_test_ = X, y, sample_weight, X_test
+            # The estimator is fitted on the whole training set
+            # in the same pool as the out-of-fold models.
+            # It receives the original data, since it may keep
+            # a reference to them after the memory maps are removed.
+            single_estimator_task = (
+                [
+                    delayed(self._fit_estimator_with_stats)(
+                        clone(estimator), X, y, sample_weight
                     )
-
-                if self.method == "plus":
-                    if (not isinstance(self.cv, Subsample)) and (
-                        len(self.estimators_) < len(self.k_)
-                    ):
-                        y_pred_multi = y_pred_multi[:, self.k_]
-
-                    lower_bounds = y_pred_multi - self.residuals_
-                    upper_bounds = y_pred_multi + self.residuals_
-
-                if self.method == "minmax":
-                    lower_bounds = np.min(y_pred_multi, axis=1, keepdims=True)
-                    upper_bounds = np.max(y_pred_multi, axis=1, keepdims=True)
-                    lower_bounds = lower_bounds - self.residuals_
-                    upper_bounds = upper_bounds + self.residuals_
-
-                y_pred_low = np.column_stack(
-                    [
-                        np.quantile(
-                            ma.masked_invalid(lower_bounds),
-                            _alpha,
-                            axis=1,
-                            interpolation="lower",
-                        )
-                        for _alpha in alpha_
-                    ]
+                ]
+                if fit_single_estimator
+                else []
+            )
+            oof_tasks = (
+                delayed(self._fit_and_predict_oof_model_with_stats)(
+                    clone(estimator),
+                    X_,
+                    y_,
+                    train_index,
+                    val_index,
+                    k,
+                    sample_weight_,
+                    X_test_,
+                    train_weight,
                 )
-                y_pred_up = np.column_stack(
-                    [
-                        np.quantile(
-                            ma.masked_invalid(upper_bounds),
-                            1 - _alpha,
-                            axis=1,
-                            interpolation="higher",
-                        )
-                        for _alpha in alpha_
-                    ]
+                for k, (train_index, val_index, train_weight) in enumerate(
+                    splits, start=k_start
                 )
-                if self.agg_function is not None:
-                    y_pred = aggregate_all(self.agg_function, y_pred_multi)
-            return y_pred, np.stack([y_pred_low, y_pred_up], axis=1)
+            )
+            outputs = Parallel(n_jobs=self.n_jobs, verbose=self.verbose)(
+                chain(single_estimator_task, oof_tasks)
+            )
+            del X_, y_, sample_weight_, X_test_
+        if not fit_single_estimator:
+            return None, None, outputs
+        (single_estimator, single_estimator_stats), *outputs = outputs
+        return single_estimator, single_estimator_stats, outputs
+
+    def fit_more(
+        self,
+        X: ArrayLike,
+        y: ArrayLike,
+        n_additional: int,
+        sample_weight: Optional[ArrayLike] = None,
+    ) -> MapieRegressor:
+        """
+        Fit additional resamplings of a ``Subsample`` cross-validator,
+        without refitting the previous ones.
+
+        The resamplings continue the random stream of ``fit``, so that
+        the model is the same as if it had been fitted with
+        ``n_resamplings_ + n_additional`` resamplings. Only the new
+        out-of-bag models are fitted, in parallel according to
+        ``n_jobs``. Their out-of-bag predictions are added to the
+        previous ones, which are aggregated again to update
+        the residuals. After ``dump_estimators``, the new models are
+        dumped in the same folder.
+
+        Parameters
+        ----------
+        X : ArrayLike of shape (n_samples, n_features)
+            Training data, the same as in ``fit``.
+
+        y : ArrayLike of shape (n_samples,)
+            Training labels, the same as in ``fit``.
+
+        n_additional : int
+            Number of additional resamplings.
+
+        sample_weight : Optional[ArrayLike] of shape (n_samples,)
+            Sample weights, the same as in ``fit``.
+            By default None.
+
+        Returns
+        -------
+        MapieRegressor
+            The model itself.
+
+        Raises
+        ------
+        ValueError
+            If ``cv`` is not a ``Subsample`` or the method is "naive",
+            if ``n_additional`` is not a positive integer,
+            or if training data do not have the shape of ``fit``.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from mapie.regression import MapieRegressor
+        >>> from mapie.subsample import Subsample
+        >>> X_toy = np.arange(10).reshape(-1, 1)
+        >>> y_toy = 2 * X_toy.ravel() + 1
+        >>> mapie_reg = MapieRegressor(
+        ...     cv=Subsample(n_resamplings=5, random_state=0),
+        ...     agg_function="mean",
+        ... ).fit(X_toy, y_toy)
+        >>> mapie_reg = mapie_reg.fit_more(X_toy, y_toy, n_additional=3)
+        >>> print(mapie_reg.n_resamplings_, mapie_reg.k_.shape)
+        8 (10, 8)
+        """
+        cv = self._check_cv(self.cv)
+        if not isinstance(cv, Subsample) or self.method == "naive":
+            raise ValueError(
+                "Invalid cv argument. "
+                "fit_more is only available with Subsample "
+                "and a method other than 'naive'."
+            )
+        if not isinstance(n_additional, Integral) or n_additional < 1:
+            raise ValueError(
+                "Invalid n_additional argument. Must be a positive integer."
+            )
+        check_is_fitted(self, ["estimators_", "y_pred_oob_", "random_state_"])
+        estimators_kept = self._check_estimators_kept()
+        estimator = self._check_estimator(self.estimator)
+        X, y = check_X_y(
+            X, y, force_all_finite=False, dtype=["float64", "int", "object"]
+        )
+        sample_weight, X, y = check_null_weight(sample_weight, X, y)
+        if X.shape != (self.y_pred_oob_.shape[0], self.n_features_in_):
+            raise ValueError(
+                "Invalid mismatch between X.shape and the training data."
+            )
+
+        start = perf_counter()
+        _, _, outputs = self._fit_oof_models(
+            estimator,
+            self._split_subsample(cv, estimator, X, n_additional),
+            X,
+            y,
+            sample_weight,
+            k_start=self.y_pred_oob_.shape[1],
+            fit_single_estimator=False,
+        )
+        self.fit_stats_["fit_time"] += perf_counter() - start
+
+        start = perf_counter()
+        estimators, predictions, _, val_indices, _, folds = map(
+            list, zip(*outputs)
+        )
+        if isinstance(estimators_kept, EstimatorsStore):
+            # Dumped estimators stay on disk.
+            estimators_kept.extend(estimators)
+            self.estimators_ = estimators_kept
+        else:
+            self.estimators_ = list(estimators_kept) + estimators
+        self.n_resamplings_ += n_additional
+        self.fit_stats_["folds"] += folds
+        self.n_samples_val_ = list(self.n_samples_val_) + [
+            np.array(pred).shape[0] for pred in predictions
+        ]
+        self.y_pred_oob_ = hstack(
+            [
+                self.y_pred_oob_,
+                self._get_oob_predictions(predictions, val_indices, len(y)),
+            ],
+            format="csr",
+        )
+        y_pred = self._aggregate_oob_predictions()
+        self.residuals_ = np.abs(y - y_pred)
+        residuals = np.asarray(self.residuals_, dtype=float)
+        self.sorted_residuals_ = np.sort(residuals[~np.isnan(residuals)])
+        self.fit_stats_["aggregation_time"] += perf_counter() - start
+        return self
+
+    def fit_predict_intervals(
+        self,
+        X: ArrayLike,
+        y: ArrayLike,
+        X_test: ArrayLike,
+        alpha: Optional[Union[float, Iterable[float]]] = None,
+        sample_weight: Optional[ArrayLike] = None,
+    ) -> Union[ArrayLike, Tuple[ArrayLike, ArrayLike]]:
+        """
+        Fit on training data and predict test data known in advance,
+        with confidence intervals.
+
+        Equivalent to ``fit(X, y, sample_weight).predict(X_test, alpha)``,
+        except that each out-of-fold model predicts the test data as soon
+        as it is fitted, and is then discarded: only its predictions are
+        kept. Memory hence holds one model per job instead of all the
+        out-of-fold models.
+
+        Out-of-fold models are fitted, and ``estimators_`` is then set
+        to ``None``, with all methods but "naive", unless ``cv`` is
+        "prefit". ``predict`` is still available afterwards for point
+        predictions and for the "base" method, which only use
+        ``single_estimator_``. Prediction intervals of the "plus" and
+        "minmax" methods, and point predictions aggregated with
+        ``agg_function`` for these methods, need the out-of-fold models
+        and raise a ``ValueError``: call ``fit`` to use them.
+
+        Parameters
+        ----------
+        X : ArrayLike of shape (n_samples, n_features)
+            Training data.
+
+        y : ArrayLike of shape (n_samples,)
+            Training labels.
+
+        X_test : ArrayLike of shape (n_samples_test, n_features)
+            Test data.
+
+        alpha: Optional[Union[float, Iterable[float]]]
+            Between 0 and 1, represents the uncertainty of the confidence
+            interval, see ``predict``.
+            By default ``None``.
+
+        sample_weight : Optional[ArrayLike] of shape (n_samples,)
+            Sample weights for fitting the out-of-fold models, see ``fit``.
+            By default None.
+
+        Returns
+        -------
+        Union[ArrayLike, Tuple[ArrayLike, ArrayLike]]
+            See ``predict``.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from mapie.regression import MapieRegressor
+        >>> X_toy = np.array([[0], [1], [2], [3], [4], [5]])
+        >>> y_toy = np.array([5, 7.5, 9.5, 10.5, 12.5, 15])
+        >>> mapie_reg = MapieRegressor()
+        >>> y_pred, y_pis = mapie_reg.fit_predict_intervals(
+        ...     X_toy, y_toy, X_toy, alpha=0.5
+        ... )
+        >>> print(y_pis[:2, :, 0])
+        [[4.7972973  5.8       ]
+         [6.69767442 7.65540541]]
+        >>> print(mapie_reg.estimators_)
+        None
+        """
+        alpha_ = check_alpha(alpha)
+        X_test = check_array(
+            X_test, force_all_finite=False, dtype=["float64", "object"]
+        )
+        y_pred_multi = self._fit(X, y, sample_weight, X_test)
+        if alpha_ is not None:
+            check_alpha_and_n_samples(alpha_, self.residuals_.shape[0])
+        if y_pred_multi is not None:
+            self.estimators_ = None  # type: ignore
+        distribution = PredictionDistribution(self, X_test, y_pred_multi)
+        if alpha_ is None:
+            return np.array(distribution.y_pred_single)
+        return distribution.predict(), distribution.intervals(alpha_)
+
+    @available_if(
+        lambda self: self.cv == "prefit",
+        "Invalid cv argument. "
+        "partial_fit is only available with cv='prefit'.",
+    )
+    def partial_fit(
+        self, X: ArrayLike, y: ArrayLike, window: Optional[int] = None
+    ) -> MapieRegressor:
+        """
+        Update the residuals of a prefit estimator with new labelled data.
+
+        Only available if ``cv`` is "prefit": the estimator is not
+        refitted, and the residuals of the new samples are inserted
+        into the sorted residuals, so that quantiles of residuals are
+        still index lookups at prediction time.
+        The first call is equivalent to ``fit``.
+
+        With ``window``, only the residuals of the last ``window``
+        samples are kept, e.g. to calibrate the intervals of a time
+        series on its most recent errors. Once ``window`` residuals are
+        kept, ``residuals_`` is a circular buffer: the new residuals
+        overwrite the oldest ones in place. The oldest residuals are
+        removed from the sorted residuals by binary search, without
+        sorting them again, the insertion and deletion in the sorted
+        residuals still copying them.
+
+        Parameters
+        ----------
+        X : ArrayLike of shape (n_samples, n_features)
+            New data.
+
+        y : ArrayLike of shape (n_samples,)
+            New labels.
+
+        window : Optional[int]
+            Maximum number of residuals kept, the oldest being removed.
+            If ``None``, all residuals are kept.
+            By default ``None``.
+
+        Returns
+        -------
+        MapieRegressor
+            The model itself.
+
+        Raises
+        ------
+        AttributeError
+            If ``cv`` is not "prefit".
+
+        ValueError
+            If ``window`` is not ``None`` nor a positive integer.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from sklearn.linear_model import LinearRegression
+        >>> from mapie.regression import MapieRegressor
+        >>> X_toy = np.array([[0], [1], [2], [3], [4], [5]])
+        >>> y_toy = np.array([5, 7.5, 9.5, 10.5, 12.5, 15])
+        >>> estimator = LinearRegression().fit(X_toy, y_toy)
+        >>> mapie_reg = MapieRegressor(estimator, cv="prefit")
+        >>> mapie_reg = mapie_reg.partial_fit(X_toy[:3], y_toy[:3])
+        >>> mapie_reg = mapie_reg.partial_fit(X_toy[3:], y_toy[3:])
+        >>> print(mapie_reg.n_samples_val_)
+        [6]
+        >>> mapie_reg = mapie_reg.partial_fit(X_toy[:2], y_toy[:2], window=4)
+        >>> print(mapie_reg.n_samples_val_)
+        [4]
+        """
+        if window is not None and (
+            not isinstance(window, Integral) or window < 1
+        ):
+            raise ValueError(
+                "Invalid window argument. Must be a positive integer."
+            )
+        if not hasattr(self, "residuals_"):
+            self.fit(X, y)
+            residuals = np.empty(0)
+        else:
+            check_is_fitted(self, ["single_estimator_", "sorted_residuals_"])
+            X, y = check_X_y(
+                X,
+                y,
+                force_all_finite=False,
+                dtype=["float64", "int", "object"],
+            )
+            if X.shape[1] != self.n_features_in_:
+                raise ValueError(
+                    "Invalid mismatch between X.shape and n_features_in_."
+                )
+            residuals = np.asarray(
+                np.abs(y - self.single_estimator_.predict(X)), dtype=float
+            )
+            if window is not None:
+                # Residuals of the batch that do not fit in the window
+                # are never kept.
+                residuals = residuals[-window:]
+            self.sorted_residuals_ = insert_sorted(
+                self.sorted_residuals_, residuals[~np.isnan(residuals)]
+            )
+        if window is not None and len(self.residuals_) == window:
+            # Circular buffer: the new residuals overwrite the oldest.
+            head = self._residuals_head
+            index = (head + np.arange(len(residuals))) % window
+            evicted = self.residuals_[index]
+            self.residuals_[index] = residuals
+            self._residuals_head = (head + len(residuals)) % window
+            # New view, so that residuals are seen as updated, e.g.
+            # by PredictionDistribution.
+            self.residuals_ = self.residuals_.view()
+        else:
+            residuals = np.concatenate(
+                [np.roll(self.residuals_, -self._residuals_head), residuals]
+            )
+            n_evicted = 0
+            if window is not None:
+                n_evicted = max(len(residuals) - window, 0)
+            evicted = residuals[:n_evicted]
+            self.residuals_ = residuals[n_evicted:]
+            self._residuals_head = 0
+            self.k_ = np.empty_like(self.residuals_, dtype=int)
+        evicted = np.asarray(evicted, dtype=float)
+        self.sorted_residuals_ = delete_sorted(
+            self.sorted_residuals_, evicted[~np.isnan(evicted)]
+        )
+        self.n_samples_val_ = [len(self.residuals_)]
+        return self
+
+    def dump_estimators(
+        self, folder: str, cache_size: int = 8
+    ) -> MapieRegressor:
+        """
+        Move the out-of-fold estimators to a folder, one file per
+        estimator, and load them on demand at prediction time,
+        keeping only the ``cache_size`` most recently used in memory.
+
+        ``estimators_`` is replaced by an ``EstimatorsStore``, and
+        pickling the ``MapieRegressor`` only pickles the path of the
+        folder, which must be deployed with it.
+
+        Parameters
+        ----------
+        folder : str
+            Folder where estimators are dumped. Created if needed.
+
+        cache_size : int
+            Maximum number of estimators kept in memory.
+            By default ``8``.
+
+        Returns
+        -------
+        MapieRegressor
+            The model itself.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from tempfile import TemporaryDirectory
+        >>> from mapie.regression import MapieRegressor
+        >>> X_toy = np.array([[0], [1], [2], [3], [4], [5]])
+        >>> y_toy = np.array([5, 7.5, 9.5, 10.5, 12.5, 15])
+        >>> mapie_reg = MapieRegressor().fit(X_toy, y_toy)
+        >>> with TemporaryDirectory() as folder:
+        ...     mapie_reg = mapie_reg.dump_estimators(folder, cache_size=2)
+        ...     y_pred, y_pis = mapie_reg.predict(X_toy, alpha=0.5)
+        >>> print(y_pis[:2, :, 0])
+        [[4.7972973  5.8       ]
+         [6.69767442 7.65540541]]
+        """
+        check_is_fitted(self, ["estimators_"])
+        self.estimators_ = EstimatorsStore.dump(
+            self._check_estimators_kept(), folder, cache_size
+        )
+        return self
+
+    def predict(
+        self,
+        X: ArrayLike,
+        alpha: Optional[Union[float, Iterable[float]]] = None,
+        batch_size: Optional[int] = None,
+    ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Predict target on new samples with confidence intervals.
+        Residuals from the training set and predictions from the model clones
+        are central to the computation.
+        Prediction Intervals for a given ``alpha`` are deduced from either
+
+        - quantiles of residuals (naive and base methods),
+        - quantiles of (predictions +/- residuals) (plus method),
+        - quantiles of (max/min(predictions) +/- residuals) (minmax method).
+
+        Parameters
+        ----------
+        X : ArrayLike of shape (n_samples, n_features)
+            Test data.
+
+        alpha: Optional[Union[float, Iterable[float]]]
+            Can be a float, a list of floats, or a ``np.ndarray`` of floats.
+            Between 0 and 1, represents the uncertainty of the confidence
+            interval.
+            Lower ``alpha`` produce larger (more conservative) prediction
+            intervals.
+            ``alpha`` is the complement of the target coverage level.
+            By default ``None``.
+
+        batch_size: Optional[int]
+            Number of test samples processed at once.
+            Outputs of each batch are written into arrays preallocated
+            for all test samples, so that peak memory does not grow
+            with the number of test samples.
+            If ``None``, all test samples are processed at once.
+            By default ``None``.
+
+        Returns
+        -------
+        Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]
+
+        - np.ndarray of shape (n_samples,) if alpha is None.
+
+        - Tuple[np.ndarray, np.ndarray] of shapes
+        (n_samples,) and (n_samples, 2, n_alpha) if alpha is not None.
+
+            - [:, 0, :]: Lower bound of the prediction interval.
+            - [:, 1, :]: Upper bound of the prediction interval.
+        """
+        X, alpha_ = self._check_predict_input(X, alpha)
+        return concatenate_batches(
+            self._predict_iter(X, alpha_, batch_size), len(X)
+        )
+
+    def predict_iter(
+        self,
+        X: ArrayLike,
+        alpha: Optional[Union[float, Iterable[float]]] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[Union[ArrayLike, Tuple[ArrayLike, ArrayLike]]]:
+        """
+        Predict target on successive batches of new samples
+        with confidence intervals.
+        See ``predict`` for details.
+
+        Parameters
+        ----------
+        X : ArrayLike of shape (n_samples, n_features)
+            Test data.
+
+        alpha: Optional[Union[float, Iterable[float]]]
+            Can be a float, a list of floats, or a ``np.ndarray`` of floats.
+            By default ``None``.
+
+        batch_size: Optional[int]
+            Number of test samples in each batch.
+            If ``None``, all test samples are processed at once.
+            By default ``None``.
+
+        Returns
+        -------
+        Iterator[Union[ArrayLike, Tuple[ArrayLike, ArrayLike]]]
+            Outputs of ``predict`` for each batch of ``batch_size``
+            consecutive test samples.
+        """
+        X, alpha_ = self._check_predict_input(X, alpha)
+        return self._predict_iter(X, alpha_, batch_size)
+
+    def _check_predict_input(
+        self,
+        X: ArrayLike,
+        alpha: Optional[Union[float, Iterable[float]]] = None,
+    ) -> Tuple[ArrayLike, Optional[ArrayLike]]:
+        """
+        Check that the model is fitted and check inputs of ``predict``.
+
+        Parameters
+        ----------
+        X : ArrayLike of shape (n_samples, n_features)
+            Test data.
+
+        alpha: Optional[Union[float, Iterable[float]]]
+            Can be a float, a list of floats, or a ``np.ndarray`` of floats.
+
+        Returns
+        -------
+        Tuple[ArrayLike, Optional[ArrayLike]]
+            Checked test data and alpha.
+        """
+        check_is_fitted(
+            self,
+            [
+                "single_estimator_",
+                "estimators_",
+                "k_",
+                "residuals_",
+                "sorted_residuals_",
+                "n_features_in_",
+                "n_samples_val_",
+            ],
+        )
+        alpha_ = check_alpha(alpha)
+        if alpha_ is not None:
+            check_alpha_and_n_samples(alpha_, self.residuals_.shape[0])
+        X = check_array(X, force_all_finite=False, dtype=["float64", "object"])
+        return X, alpha_
+
+    def _predict_iter(
+        self,
+        X: ArrayLike,
+        alpha_: Optional[ArrayLike],
+        batch_size: Optional[int] = None,
+    ) -> Iterator[Union[ArrayLike, Tuple[ArrayLike, ArrayLike]]]:
+        """
+        Generate the outputs of ``_predict_batch`` on successive batches
+        of checked test data.
+        """
+        for batch in gen_batches(
+            len(X), check_batch_size(batch_size, len(X))
+        ):
+            yield self._predict_batch(X[batch], alpha_)
+
+    def _predict_batch(
+        self,
+        X: ArrayLike,
+        alpha_: Optional[ArrayLike],
+    ) -> Union[ArrayLike, Tuple[ArrayLike, ArrayLike]]:
+        """
+        Predict target with confidence intervals on checked test data.
+
+        Parameters
+        ----------
+        X : ArrayLike of shape (n_samples, n_features)
+            Checked test data.
+
+        alpha_: Optional[ArrayLike] of shape (n_alpha,)
+            Checked alpha.
+
+        Returns
+        -------
+        Union[ArrayLike, Tuple[ArrayLike, ArrayLike]]
+            See ``predict``.
+        """
+        distribution = PredictionDistribution(self, X)
+        if alpha_ is None:
+            return np.array(distribution.y_pred_single)
+        return distribution.predict(), distribution.intervals(alpha_)
+
+    def predict_distribution(self, X: ArrayLike) -> PredictionDistribution:
+        """
+        Predict target on new samples and return an object from which
+        prediction intervals can be computed for any ``alpha``, and any
+        method sharing the same residuals, without running
+        the estimators again.
+
+        Parameters
+        ----------
+        X : ArrayLike of shape (n_samples, n_features)
+            Test data.
+
+        Returns
+        -------
+        PredictionDistribution
+            Predictions of the estimators on the test data.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from mapie.regression import MapieRegressor
+        >>> X_toy = np.array([[0], [1], [2], [3], [4], [5]])
+        >>> y_toy = np.array([5, 7.5, 9.5, 10.5, 12.5, 15])
+        >>> mapie_reg = MapieRegressor().fit(X_toy, y_toy)
+        >>> distribution = mapie_reg.predict_distribution(X_toy)
+        >>> print(distribution.interval(0.5)[:2])
+        [[4.7972973  5.8       ]
+         [6.69767442 7.65540541]]
+        >>> print(distribution.intervals([0.5, 0.6], method="minmax").shape)
+        (6, 2, 2)
+        """
+        X, _ = self._check_predict_input(X)
+        return PredictionDistribution(self, X)
+
+
+class PredictionDistribution:
+    """
+    Predictions of a fitted ``MapieRegressor`` on test samples.
+
+    Predictions of the single estimator and of the out-of-fold estimators
+    are computed once, when first needed, and reused to compute
+    point predictions and prediction intervals for any ``alpha``.
+    Instances are returned by ``MapieRegressor.predict_distribution``.
+
+    Parameters
+    ----------
+    mapie_regressor : MapieRegressor
+        Fitted ``MapieRegressor``.
+
+    X : ArrayLike of shape (n_samples, n_features)
+        Checked test data.
+
+    y_pred_oof : Optional[ArrayLike] of shape (n_samples, n_estimators)
+        Predictions of the out-of-fold estimators on the test data,
+        if already computed. By default ``None``.
+
+    Attributes
+    ----------
+    mapie_regressor : MapieRegressor
+        Fitted ``MapieRegressor``. Raises a ``ValueError`` if it was
+        fitted again since the creation of the distribution, since
+        its residuals do not match the predictions anymore.
+
+    y_pred_single : ArrayLike of shape (n_samples,)
+        Predictions of the estimator fitted on the whole training set.
+
+    y_pred_multi : ArrayLike of shape (n_samples, n_estimators)
+        Predictions of the out-of-fold estimators.
+        If ``cv`` is a ``Subsample``, predictions aggregated for each
+        training sample, of shape (n_samples, n_samples_train).
+    """
+
+    def __init__(
+        self,
+        mapie_regressor: MapieRegressor,
+        X: ArrayLike,
+        y_pred_oof: Optional[ArrayLike] = None,
+    ) -> None:
+        self._mapie_regressor = mapie_regressor
+        # Residuals are replaced by each fit, fit_more and partial_fit:
+        # the reference to the current ones identifies the fit.
+        self._residuals = mapie_regressor.residuals_
+        self.X = X
+        self.y_pred_oof = y_pred_oof
+        self._y_pred_single: Optional[ArrayLike] = None
+        self._y_pred_multi: Optional[ArrayLike] = None
+
+    @property
+    def mapie_regressor(self) -> MapieRegressor:
+        if self._mapie_regressor.residuals_ is not self._residuals:
+            raise ValueError(
+                "Invalid PredictionDistribution. The MapieRegressor was "
+                "fitted again after predict_distribution: "
+                "call predict_distribution again."
+            )
+        return self._mapie_regressor
+
+    @property
+    def y_pred_single(self) -> ArrayLike:
+        if self._y_pred_single is None:
+            single_estimator = self.mapie_regressor.single_estimator_
+            self._y_pred_single = single_estimator.predict(self.X)
+        return self._y_pred_single
+
+    @property
+    def y_pred_multi(self) -> ArrayLike:
+        if self._y_pred_multi is None:
+            mapie_regressor = self.mapie_regressor
+            if self.y_pred_oof is None:
+                y_pred_multi = mapie_regressor._predict_oof_estimators(self.X)
+            else:
+                y_pred_multi = self.y_pred_oof
+            # At this point, y_pred_multi is of shape
+            # (n_samples_test, n_estimators_).
+            # If ``cv``is a ``Subsample``, the methode
+            # ``aggregate_with_mask`` fits it to the shape
+            # (n_samples_test, n_samples_train) thanks to the shape of k_.
+            if isinstance(mapie_regressor.cv, Subsample):
+                y_pred_multi = mapie_regressor.aggregate_with_mask(
+                    y_pred_multi, mapie_regressor.k_
+                )
+            self._y_pred_multi = y_pred_multi
+        return self._y_pred_multi
+
+    def _check_method(self, method: Optional[str] = None) -> str:
+        """
+        Check that the method can be applied with the residuals
+        of the fitted ``MapieRegressor``.
+
+        Parameters
+        ----------
+        method : Optional[str]
+            Method to check. If ``None``, the method of the fitted
+            ``MapieRegressor``.
+
+        Returns
+        -------
+        str
+            The checked method.
+
+        Raises
+        ------
+        ValueError
+            If the method is not valid, or if the "naive" method is mixed
+            with other methods, since they do not share residuals.
+        """
+        fitted_method = self.mapie_regressor.method
+        if method is None:
+            return fitted_method
+        if method not in MapieRegressor.valid_methods_:
+            raise ValueError(
+                "Invalid method. "
+                "Allowed values are 'naive', 'base', 'plus' and 'minmax'."
+            )
+        if (
+            self.mapie_regressor.cv != "prefit"
+            and (method == "naive") != (fitted_method == "naive")
+        ):
+            raise ValueError(
+                "Invalid method. "
+                "The 'naive' method can only be applied if MapieRegressor "
+                "is fitted with the 'naive' method."
+            )
+        return method
+
+    def _shares_estimators(self) -> bool:
+        """
+        Whether out-of-fold estimators are shared by several training
+        samples, as in K-fold cross-validation.
+        """
+        mapie_regressor = self.mapie_regressor
+        return (not isinstance(mapie_regressor.cv, Subsample)) and (
+            self.y_pred_multi.shape[1] < mapie_regressor.k_.shape[0]
+        )
+
+    def predict(self, method: Optional[str] = None) -> ArrayLike:
+        """
+        Point predictions, aggregated from the out-of-fold estimators
+        according to ``agg_function`` for the "plus" and "minmax" methods.
+
+        Parameters
+        ----------
+        method : Optional[str]
+            Method used to compute prediction intervals.
+            If ``None``, the method of the fitted ``MapieRegressor``.
+            By default ``None``.
+
+        Returns
+        -------
+        ArrayLike of shape (n_samples,)
+            Point predictions.
+        """
+        method = self._check_method(method)
+        mapie_regressor = self.mapie_regressor
+        if (
+            mapie_regressor.agg_function is None
+            or method in ["naive", "base"]
+            or mapie_regressor.cv == "prefit"
+        ):
+            return self.y_pred_single
+        if method == "plus" and self._shares_estimators():
+            return aggregate_with_counts(
+                mapie_regressor.agg_function,
+                self.y_pred_multi,
+                np.bincount(
+                    mapie_regressor.k_, minlength=self.y_pred_multi.shape[1]
+                ),
+            )
+        return aggregate_all(mapie_regressor.agg_function, self.y_pred_multi)
+
+    def intervals(
+        self,
+        alpha: Union[float, Iterable[float]],
+        method: Optional[str] = None,
+    ) -> ArrayLike:
+        """
+        Prediction intervals for several values of ``alpha``.
+        See ``MapieRegressor.predict`` for details.
+
+        Parameters
+        ----------
+        alpha: Union[float, Iterable[float]]
+            Can be a float, a list of floats, or a ``np.ndarray`` of floats.
+            Between 0 and 1, represents the uncertainty of the confidence
+            interval.
+
+        method : Optional[str]
+            Method used to compute prediction intervals.
+            If ``None``, the method of the fitted ``MapieRegressor``.
+            By default ``None``.
+
+        Returns
+        -------
+        ArrayLike of shape (n_samples, 2, n_alpha)
+
+            - [:, 0, :]: Lower bound of the prediction interval.
+            - [:, 1, :]: Upper bound of the prediction interval.
+        """
+        method = self._check_method(method)
+        mapie_regressor = self.mapie_regressor
+        alpha_ = cast(ArrayLike, check_alpha(alpha))
+        check_alpha_and_n_samples(alpha_, mapie_regressor.residuals_.shape[0])
+        if method in ["naive", "base"] or mapie_regressor.cv == "prefit":
+            quantile = compute_quantiles_from_sorted(
+                mapie_regressor.sorted_residuals_,
+                1 - alpha_,
+                interpolation="higher",
+            )
+            y_pred = self.y_pred_single
+            y_pred_low = y_pred[:, np.newaxis] - quantile
+            y_pred_up = y_pred[:, np.newaxis] + quantile
+        elif method == "plus" and self._shares_estimators():
+            # Estimators are shared by several training samples:
+            # bounds are computed fold by fold thanks to the folds
+            # identifier, without expanding y_pred_multi to the shape
+            # (n_samples_test, n_samples_train).
+            y_pred_low, y_pred_up = mapie_regressor._compute_bounds_per_fold(
+                self.y_pred_multi, alpha_
+            )
+        elif method == "minmax":
+            # Bounds are the same for all residuals up to the residual
+            # itself: quantiles of the bounds are the minimum and maximum
+            # predictions shifted by order statistics of the sorted
+            # residuals, the lower bound using the opposite order.
+            sorted_residuals = mapie_regressor.sorted_residuals_
+            n_residuals = len(sorted_residuals)
+            y_pred_multi = self.y_pred_multi
+            index_low = n_residuals - 1 - np.floor(
+                (n_residuals - 1) * alpha_
+            ).astype(int)
+            y_pred_low = (
+                np.nanmin(y_pred_multi, axis=1, keepdims=True)
+                - sorted_residuals[index_low]
+            )
+            y_pred_up = np.nanmax(
+                y_pred_multi, axis=1, keepdims=True
+            ) + compute_quantiles_from_sorted(
+                sorted_residuals, 1 - alpha_, interpolation="higher"
+            )
+        else:
+            y_pred_multi = self.y_pred_multi
+            y_pred_low = compute_quantiles(
+                y_pred_multi - mapie_regressor.residuals_,
+                alpha_,
+                interpolation="lower",
+            )
+            y_pred_up = compute_quantiles(
+                y_pred_multi + mapie_regressor.residuals_,
+                1 - alpha_,
+                interpolation="higher",
+            )
+        return np.stack([y_pred_low, y_pred_up], axis=1)
+
+    def interval(
+        self,
+        alpha: float,
+        method: Optional[str] = None,
+    ) -> ArrayLike:
+        """
+        Prediction interval for a single value of ``alpha``.
+        See ``intervals``.
+
+        Parameters
+        ----------
+        alpha: float
+            Between 0 and 1, represents the uncertainty of the confidence
+            interval.
+
+        method : Optional[str]
+            Method used to compute prediction intervals.
+            If ``None``, the method of the fitted ``MapieRegressor``.
+            By default ``None``.
+
+        Returns
+        -------
+        ArrayLike of shape (n_samples, 2)
+
+            - [:, 0]: Lower bound of the prediction interval.
+            - [:, 1]: Upper bound of the prediction interval.
+        """
+        return self.intervals([alpha], method)[:, :, 0]
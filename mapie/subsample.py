@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from typing import Any, Generator, Optional, Tuple, Union
+from numbers import Integral
+from typing import Any, Generator, List, Optional, Tuple, Union, cast
 
 import numpy as np
-from numpy.random import RandomState
+from numpy.random import Generator as RandomGenerator
+from numpy.random import RandomState, SeedSequence
+from sklearn import get_config
 from sklearn.model_selection import BaseCrossValidator
-from sklearn.utils import check_random_state, resample
+from sklearn.utils import check_random_state, gen_batches
 
 from ._typing import ArrayLike
 
@@ -16,6 +19,11 @@ class Subsample(BaseCrossValidator):  # type: ignore
     possible bootstraps. It can replace KFold or  LeaveOneOut as cv argument
     in the MAPIE class.
 
+    Indices of several resamplings are drawn at once, by chunks whose
+    arrays fit in the ``working_memory`` of ``sklearn.get_config()``,
+    and the out-of-bag indices are found with a boolean mask.
+    Indices are stored as 32-bit integers when possible.
+
     Parameters
     ----------
     n_resamplings : int
@@ -27,6 +35,32 @@ class Subsample(BaseCrossValidator):  # type: ignore
         Whether to replace samples in resamplings or not.
     random_state: Optional
         int or RandomState instance.
+    bootstrap_weights: Optional[str]
+        How resamplings are given to estimators whose ``fit`` accepts
+        ``sample_weight``, in ``MapieRegressor``:
+
+        - ``None``: training samples are repeated as drawn,
+          and the resampled data are copied.
+        - "counts": unique training samples are weighted by their number
+          of draws, without copying repeated samples. The resamplings are
+          the same as with ``None``.
+        - "poisson": each sample is weighted by an independent Poisson
+          draw of mean ``n_samples / n``, ``n`` being the size of
+          the training set. Samples with a null weight are out-of-bag.
+          Requires ``replace=True``.
+
+        Other estimators are fitted on the training samples repeated
+        according to their weights. By default ``None``.
+    independent_streams: bool
+        Whether each resampling is drawn from its own random stream,
+        instead of all resamplings being drawn successively from
+        ``random_state``. The stream of the resampling ``k`` is spawned
+        with ``numpy.random.SeedSequence`` from the seed ``random_state``
+        and ``k`` alone, so that any resampling can be generated
+        independently of the others, e.g. by a worker, with
+        ``get_split``. Draws are then different from the ones with
+        ``independent_streams=False``, and are reproducible if
+        ``random_state`` is an int. By default ``False``.
 
 
     Examples
@@ -37,8 +71,11 @@ class Subsample(BaseCrossValidator):  # type: ignore
     >>> X = np.array([1,2,3,4,5,6,7,8,9,10])
     >>> for train_index, test_index in cv.split(X):
     ...    print(f"train index is {train_index}, test index is {test_index}")
-    train index is [5 0 3 3 7 9 3 5 2 4], test index is [8 1 6]
+    train index is [5 0 3 3 7 9 3 5 2 4], test index is [1 6 8]
     train index is [7 6 8 8 1 6 7 7 8 1], test index is [0 2 3 4 5 9]
+    >>> train_indices, test_mask = cv.split_matrix(X)
+    >>> print(train_indices.shape, test_mask.sum(axis=1))
+    (2, 10) [3 6]
     """
 
     def __init__(
@@ -47,11 +84,15 @@ class Subsample(BaseCrossValidator):  # type: ignore
         n_samples: Optional[int] = None,
         replace: bool = True,
         random_state: Optional[Union[int, RandomState]] = None,
+        bootstrap_weights: Optional[str] = None,
+        independent_streams: bool = False,
     ) -> None:
         self.n_resamplings = n_resamplings
         self.n_samples = n_samples
         self.replace = replace
         self.random_state = random_state
+        self.bootstrap_weights = bootstrap_weights
+        self.independent_streams = independent_streams
 
     def split(
         self, X: ArrayLike
@@ -71,23 +112,446 @@ class Subsample(BaseCrossValidator):  # type: ignore
         test : ArrayLike of shape (n_indices_test,)
             The testing set indices for that split.
         """
-        indices = np.arange(len(X))
-        n_samples = (
-            self.n_samples if self.n_samples is not None else len(indices)
+        yield from self._split(
+            X, self._get_random_state(), self.n_resamplings
         )
+
+    def get_split(self, X: ArrayLike, k: int) -> Tuple[Any, ArrayLike]:
+        """
+        Generate the indices of the resampling ``k`` alone, equal to the
+        split ``k`` of ``split`` if ``random_state`` is an int.
+        Only available with ``independent_streams=True``.
+
+        Parameters
+        ----------
+        X : ArrayLike of shape (n_samples, n_features)
+            Training data.
+        k : int
+            Index of the resampling, between 0 and ``n_resamplings - 1``.
+
+        Returns
+        -------
+        Tuple[ArrayLike, ArrayLike]
+            - [0]: The training set indices for that split.
+            - [1]: The testing set indices for that split.
+
+        Raises
+        ------
+        ValueError
+            If streams are not independent or ``k`` is not valid.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from mapie.subsample import Subsample
+        >>> cv = Subsample(
+        ...     n_resamplings=3, random_state=0, independent_streams=True
+        ... )
+        >>> X = np.arange(10)
+        >>> splits = list(cv.split(X))
+        >>> train_index, test_index = cv.get_split(X, 2)
+        >>> print(np.array_equal(test_index, splits[2][1]))
+        True
+        """
+        if not self.independent_streams:
+            raise ValueError(
+                "Invalid independent_streams argument. "
+                "get_split is only available with independent streams."
+            )
+        if not isinstance(k, Integral) or not 0 <= k < self.n_resamplings:
+            raise ValueError(
+                "Invalid k argument. "
+                "Must be an int between 0 and n_resamplings - 1."
+            )
+        random_state = self._get_random_state()
+        # Spawning previous streams only skips their keys: nothing is drawn.
+        random_state.spawn(k)
+        return next(self._split(X, random_state, 1))
+
+    def _get_random_state(self) -> Union[RandomState, SeedSequence]:
+        """
+        Random state of the resamplings.
+
+        Returns
+        -------
+        Union[RandomState, SeedSequence]
+            ``RandomState`` drawing all the resamplings successively,
+            or ``SeedSequence`` spawning the stream of each resampling
+            if ``independent_streams`` is ``True``.
+        """
+        if not self.independent_streams:
+            return cast(RandomState, check_random_state(self.random_state))
+        if isinstance(self.random_state, Integral):
+            return SeedSequence(int(self.random_state))
         random_state = check_random_state(self.random_state)
-        for k in range(self.n_resamplings):
-            train_index = resample(
-                indices,
-                replace=self.replace,
-                n_samples=n_samples,
-                random_state=random_state,
-                stratify=None,
+        return SeedSequence(random_state.randint(np.iinfo(np.int32).max))
+
+    def _split(
+        self,
+        X: ArrayLike,
+        random_state: Union[RandomState, SeedSequence],
+        n_resamplings: int,
+    ) -> Generator[Tuple[Any, ArrayLike], None, None]:
+        """
+        Generate indices of ``n_resamplings`` splits, drawn from
+        ``random_state``. Successive calls with the same ``random_state``
+        continue its stream: the splits are the ones that ``split``
+        would generate after the previous ones.
+
+        Parameters
+        ----------
+        X : ArrayLike of shape (n_samples, n_features)
+            Training data.
+        random_state : Union[RandomState, SeedSequence]
+            Random state used for the resamplings, updated in place,
+            see ``_get_random_state``.
+        n_resamplings : int
+            Number of resamplings.
+
+        Yields
+        ------
+        train : ArrayLike of shape (n_indices_training,)
+            The training set indices for that split.
+        test : ArrayLike of shape (n_indices_test,)
+            The testing set indices for that split.
+        """
+        n_indices = len(X)
+        index_dtype = self._get_index_dtype(n_indices)
+        for batch_size in self._get_batch_sizes(n_indices, n_resamplings):
+            if self.bootstrap_weights == "poisson":
+                counts = self._draw_counts(n_indices, random_state, batch_size)
+                indices: ArrayLike = np.arange(n_indices, dtype=index_dtype)
+                for counts_k in counts:
+                    yield np.repeat(indices, counts_k), np.flatnonzero(
+                        counts_k == 0
+                    ).astype(index_dtype)
+            else:
+                train_indices = self._draw_train_indices(
+                    n_indices, random_state, batch_size
+                )
+                test_mask = self._get_test_mask(train_indices, n_indices)
+                for train_index, test_mask_k in zip(train_indices, test_mask):
+                    yield train_index, np.flatnonzero(test_mask_k).astype(
+                        index_dtype
+                    )
+
+    def _split_weights(
+        self,
+        X: ArrayLike,
+        random_state: Union[RandomState, SeedSequence],
+        n_resamplings: int,
+    ) -> Generator[Tuple[ArrayLike, ArrayLike, ArrayLike], None, None]:
+        """
+        Generate the resamplings of ``_split`` as weights of the unique
+        training samples, see ``bootstrap_weights``.
+
+        Parameters
+        ----------
+        X : ArrayLike of shape (n_samples, n_features)
+            Training data.
+        random_state : Union[RandomState, SeedSequence]
+            Random state used for the resamplings, updated in place,
+            see ``_get_random_state``.
+        n_resamplings : int
+            Number of resamplings.
+
+        Yields
+        ------
+        train : ArrayLike of shape (n_unique_training,)
+            The unique training set indices for that split.
+        test : ArrayLike of shape (n_indices_test,)
+            The testing set indices for that split.
+        weights : ArrayLike of shape (n_unique_training,)
+            The weights of the training samples.
+        """
+        n_indices = len(X)
+        index_dtype = self._get_index_dtype(n_indices)
+        for batch_size in self._get_batch_sizes(n_indices, n_resamplings):
+            counts = self._draw_counts(n_indices, random_state, batch_size)
+            for counts_k in counts:
+                train_index: ArrayLike = np.flatnonzero(counts_k).astype(
+                    index_dtype
+                )
+                test_index: ArrayLike = np.flatnonzero(counts_k == 0).astype(
+                    index_dtype
+                )
+                yield train_index, test_index, counts_k[train_index]
+
+    def split_matrix(self, X: ArrayLike) -> Tuple[ArrayLike, ArrayLike]:
+        """
+        Generate indices of all the resamplings at once.
+        The resamplings are the ones generated by ``split``.
+
+        Parameters
+        ----------
+        X : ArrayLike of shape (n_samples, n_features)
+            Training data.
+
+        Returns
+        -------
+        Tuple[ArrayLike, ArrayLike]
+            - [0]: Training set indices of each resampling,
+              of shape (n_resamplings, n_indices_training).
+            - [1]: Boolean mask of the testing set of each resampling,
+              i.e. of the out-of-bag samples,
+              of shape (n_resamplings, n_samples).
+        """
+        self._check_bootstrap_weights()
+        if self.bootstrap_weights == "poisson":
+            raise ValueError(
+                "Invalid bootstrap_weights argument. "
+                "split_matrix is not available with Poisson weights, "
+                "whose resamplings have different sizes."
             )
-            test_index = np.array(
-                list(set(indices) - set(train_index)), dtype=np.int64
+        train_indices = self._draw_train_indices(
+            len(X), self._get_random_state(), self.n_resamplings
+        )
+        return train_indices, self._get_test_mask(train_indices, len(X))
+
+    def _get_batch_sizes(
+        self, n_indices: int, n_resamplings: int
+    ) -> Generator[int, None, None]:
+        """
+        Split resamplings in chunks, whose arrays fit in the
+        ``working_memory`` of ``sklearn.get_config()``.
+
+        Parameters
+        ----------
+        n_indices : int
+            Number of training samples.
+        n_resamplings : int
+            Number of resamplings.
+
+        Yields
+        ------
+        int
+            Number of resamplings of each chunk.
+        """
+        self._check_bootstrap_weights()
+        # Bytes of the chunk arrays per resampling: the drawn indices
+        # and the counts of each sample.
+        n_bytes = max(8 * (self._get_n_samples(n_indices) + n_indices), 1)
+        batch_size = max(
+            int(get_config()["working_memory"] * 2 ** 20) // n_bytes, 1
+        )
+        for batch in gen_batches(n_resamplings, batch_size):
+            yield batch.stop - batch.start
+
+    def _check_bootstrap_weights(self) -> None:
+        """
+        Check the ``bootstrap_weights`` argument.
+
+        Raises
+        ------
+        ValueError
+            If ``bootstrap_weights`` is not valid, or is "poisson"
+            without replacement.
+        """
+        if self.bootstrap_weights not in [None, "counts", "poisson"]:
+            raise ValueError(
+                "Invalid bootstrap_weights argument. "
+                "Allowed values are None, 'counts' and 'poisson'."
+            )
+        if self.bootstrap_weights == "poisson" and not self.replace:
+            raise ValueError(
+                "Invalid bootstrap_weights argument. "
+                "Poisson weights require replace=True."
+            )
+
+    def _get_n_samples(self, n_indices: int) -> int:
+        """
+        Number of samples in each resampling.
+
+        Parameters
+        ----------
+        n_indices : int
+            Number of training samples.
+
+        Returns
+        -------
+        int
+            ``n_samples``, or ``n_indices`` if ``None``.
+
+        Raises
+        ------
+        ValueError
+            If there are more samples than training samples
+            in resamplings without replacement.
+        """
+        n_samples = (
+            self.n_samples if self.n_samples is not None else n_indices
+        )
+        if not self.replace and n_samples > n_indices:
+            raise ValueError(
+                f"Cannot sample {n_samples} out of arrays with dim "
+                f"{n_indices} when replace is False"
+            )
+        return n_samples
+
+    @staticmethod
+    def _get_index_dtype(n_indices: int) -> type:
+        """
+        Smallest integer type of indices, 32 or 64 bits.
+
+        Parameters
+        ----------
+        n_indices : int
+            Number of training samples.
+
+        Returns
+        -------
+        type
+            ``np.int32`` if all indices fit in 32 bits, else ``np.int64``.
+        """
+        if n_indices <= np.iinfo(np.int32).max:
+            return np.int32
+        return np.int64
+
+    def _draw_train_indices(
+        self,
+        n_indices: int,
+        random_state: Union[RandomState, SeedSequence],
+        n_resamplings: int,
+    ) -> ArrayLike:
+        """
+        Draw training set indices of several resamplings at once.
+        Draws are the same as the successive draws of
+        ``sklearn.utils.resample`` for each resampling.
+
+        Parameters
+        ----------
+        n_indices : int
+            Number of training samples.
+        random_state : Union[RandomState, SeedSequence]
+            Random state used for the resamplings, updated in place,
+            see ``_get_random_state``.
+        n_resamplings : int
+            Number of resamplings.
+
+        Returns
+        -------
+        ArrayLike of shape (n_resamplings, n_samples)
+            Training set indices of each resampling.
+        """
+        n_samples = self._get_n_samples(n_indices)
+        if isinstance(random_state, SeedSequence):
+            streams = self._spawn_streams(random_state, n_resamplings)
+            train_indices = np.empty((n_resamplings, n_samples), dtype=int)
+            for k, stream in enumerate(streams):
+                if self.replace:
+                    train_indices[k] = stream.integers(
+                        0, n_indices, size=n_samples
+                    )
+                else:
+                    train_indices[k] = stream.permutation(n_indices)[
+                        :n_samples
+                    ]
+        elif self.replace:
+            train_indices = random_state.randint(
+                0, n_indices, size=(n_resamplings, n_samples)
             )
-            yield train_index, test_index
+        else:
+            train_indices = np.empty((n_resamplings, n_samples), dtype=int)
+            for k in range(n_resamplings):
+                train_indices[k] = random_state.permutation(n_indices)[
+                    :n_samples
+                ]
+        return train_indices.astype(
+            self._get_index_dtype(n_indices), copy=False
+        )
+
+    def _draw_counts(
+        self,
+        n_indices: int,
+        random_state: Union[RandomState, SeedSequence],
+        n_resamplings: int,
+    ) -> ArrayLike:
+        """
+        Draw the number of occurrences of each training sample in
+        several resamplings at once, see ``bootstrap_weights``.
+
+        Parameters
+        ----------
+        n_indices : int
+            Number of training samples.
+        random_state : Union[RandomState, SeedSequence]
+            Random state used for the resamplings, updated in place,
+            see ``_get_random_state``.
+        n_resamplings : int
+            Number of resamplings.
+
+        Returns
+        -------
+        ArrayLike of shape (n_resamplings, n_indices)
+            Number of occurrences of each sample in each resampling.
+        """
+        if self.bootstrap_weights == "poisson":
+            lam = self._get_n_samples(n_indices) / max(n_indices, 1)
+            if isinstance(random_state, SeedSequence):
+                streams = self._spawn_streams(random_state, n_resamplings)
+                return np.array(
+                    [stream.poisson(lam, size=n_indices) for stream in streams]
+                ).reshape(n_resamplings, n_indices)
+            return random_state.poisson(lam, size=(n_resamplings, n_indices))
+        train_indices = self._draw_train_indices(
+            n_indices, random_state, n_resamplings
+        )
+        offsets = n_indices * np.arange(n_resamplings)[:, np.newaxis]
+        return np.bincount(
+            (train_indices + offsets).ravel(),
+            minlength=n_resamplings * n_indices,
+        ).reshape(n_resamplings, n_indices)
+
+    @staticmethod
+    def _spawn_streams(
+        seed_sequence: SeedSequence, n_resamplings: int
+    ) -> List[RandomGenerator]:
+        """
+        Spawn the random streams of the next resamplings.
+        The ``k``-th stream spawned from a seed sequence only depends
+        on its seed and ``k``.
+
+        Parameters
+        ----------
+        seed_sequence : SeedSequence
+            Seed sequence, updated in place.
+        n_resamplings : int
+            Number of resamplings.
+
+        Returns
+        -------
+        List[RandomGenerator]
+            Random generator of each resampling.
+        """
+        return [
+            np.random.default_rng(child)
+            for child in seed_sequence.spawn(n_resamplings)
+        ]
+
+    @staticmethod
+    def _get_test_mask(
+        train_indices: ArrayLike, n_indices: int
+    ) -> ArrayLike:
+        """
+        Boolean mask of the samples absent from each resampling.
+
+        Parameters
+        ----------
+        train_indices : ArrayLike of shape (n_resamplings, n_samples)
+            Training set indices of each resampling.
+        n_indices : int
+            Number of training samples.
+
+        Returns
+        -------
+        ArrayLike of shape (n_resamplings, n_indices)
+            Whether each sample is out-of-bag for each resampling.
+        """
+        test_mask = np.ones((len(train_indices), n_indices), dtype=bool)
+        test_mask[
+            np.arange(len(train_indices))[:, np.newaxis], train_indices
+        ] = False
+        return test_mask
 
     def get_n_splits(self, *args: Any, **kargs: Any) -> int:
         """
@@ -1,6 +1,19 @@
+from typing import Callable, Optional
+
 import numpy as np
+import pytest
+from scipy.sparse import csr_matrix
 
-from mapie.aggregation_functions import phi1D, phi2D
+from mapie._typing import ArrayLike
+from mapie.aggregation_functions import (
+    aggregate_all,
+    aggregate_sparse,
+    aggregate_with_counts,
+    masked_mean,
+    masked_median,
+    phi1D,
+    phi2D,
+)
 
 
 def test_phi1D() -> None:
@@ -18,3 +31,143 @@ def test_phi2D() -> None:
     res = phi2D(A, B, fun=lambda x: np.nanmean(x, axis=1))
     assert res[0, 0] == 2.0
     assert res[1, 0] == 7.0
+
+
+def phi2D_loop(
+    A: ArrayLike, B: ArrayLike, fun: Callable[[ArrayLike], ArrayLike]
+) -> ArrayLike:
+    """Reference phi2D with a loop over the rows of A."""
+    return np.apply_along_axis(phi1D, axis=1, arr=A, B=B, fun=fun)
+
+
+@pytest.mark.parametrize("working_memory", [None, 1e-4, 1e-6])
+@pytest.mark.parametrize(
+    "fun",
+    [
+        lambda x: np.nanmax(x, axis=1),
+        lambda x: np.nanpercentile(x, 30, axis=1),
+    ],
+)
+def test_phi2D_blocks(
+    working_memory: Optional[float], fun: Callable[[ArrayLike], ArrayLike]
+) -> None:
+    """
+    Test that phi2D by blocks gives the same results as a loop over
+    the rows of A, whatever the size of blocks.
+    """
+    rng = np.random.RandomState(1)
+    A = rng.randn(30, 8)
+    B = np.where(rng.rand(15, 8) < 0.5, rng.rand(15, 8), np.nan)
+    B[:, 0] = 1.0
+    res = phi2D(A, B, fun, working_memory=working_memory)
+    np.testing.assert_allclose(res, phi2D_loop(A, B, fun))
+
+
+@pytest.mark.parametrize("fun", ["mean", "median"])
+@pytest.mark.parametrize("weighted", [False, True])
+def test_phi2D_kernels(fun: str, weighted: bool) -> None:
+    """
+    Test that mean and median kernels give the same results as
+    np.nanmean and np.nanmedian, with masks or other weights.
+    """
+    rng = np.random.RandomState(1)
+    A = rng.randn(30, 8)
+    A[2, 3] = np.nan
+    B = np.where(rng.rand(15, 8) < 0.5, 1, np.nan)
+    B[:, 0] = 1.0
+    if weighted:
+        B = B * rng.rand(15, 8)
+    np_fun = np.nanmean if fun == "mean" else np.nanmedian
+    expected = phi2D_loop(A, B, lambda x: np_fun(x, axis=1))
+    np.testing.assert_allclose(phi2D(A, B, fun), expected)
+    if not weighted:
+        res_sparse = phi2D(A, csr_matrix(~np.isnan(B)), fun)
+        np.testing.assert_allclose(res_sparse, expected)
+
+
+def test_invalid_phi2D() -> None:
+    """Test that undefined aggregation function raises errors."""
+    with pytest.raises(ValueError, match=r".*Aggregation function called.*"):
+        phi2D(np.ones((2, 2)), np.ones((2, 2)), "max")
+
+
+@pytest.mark.parametrize("with_nan", [False, True])
+def test_masked_mean(with_nan: bool) -> None:
+    """
+    Test that masked_mean gives the same results as phi2D with
+    nanmean, with dense and sparse masks.
+    """
+    rng = np.random.RandomState(1)
+    A = rng.randn(30, 8)
+    if with_nan:
+        A[2, 3] = np.nan
+        A[5] = np.nan
+    B = np.where(rng.rand(15, 8) < 0.5, 1, np.nan)
+    B[4] = np.nan
+    with pytest.warns(RuntimeWarning, match=r".*Mean of empty slice.*"):
+        expected = phi2D_loop(A, B, lambda x: np.nanmean(x, axis=1))
+    np.testing.assert_allclose(masked_mean(A, B), expected)
+    np.testing.assert_allclose(
+        masked_mean(A, csr_matrix(~np.isnan(B))), expected
+    )
+
+
+@pytest.mark.parametrize("working_memory", [None, 1e-4])
+def test_masked_median(working_memory: float) -> None:
+    """
+    Test that masked_median gives the same results as phi2D with
+    nanmedian, including with small chunks.
+    """
+    rng = np.random.RandomState(1)
+    A = rng.randn(30, 8)
+    A[2, 3] = np.nan
+    B = np.where(rng.rand(15, 8) < 0.5, 1, np.nan)
+    B[4] = np.nan
+    with pytest.warns(RuntimeWarning, match=r".*All-NaN slice.*"):
+        expected = phi2D(A, B, fun=lambda x: np.nanmedian(x, axis=1))
+    res = masked_median(A, B, working_memory=working_memory)
+    np.testing.assert_array_equal(res, expected)
+    res_sparse = masked_median(
+        A, csr_matrix(~np.isnan(B)), working_memory=working_memory
+    )
+    np.testing.assert_array_equal(res_sparse, expected)
+
+
+@pytest.mark.parametrize("agg_function", ["mean", "median"])
+def test_aggregate_sparse(agg_function: str) -> None:
+    """
+    Test that aggregate_sparse gives the same results as aggregate_all
+    on the dense array with nans instead of missing values.
+    """
+    rng = np.random.RandomState(1)
+    X = np.where(rng.rand(20, 7) < 0.4, rng.randn(20, 7), np.nan)
+    X[5] = np.nan
+    rows, columns = np.nonzero(~np.isnan(X))
+    X_sparse = csr_matrix(
+        (X[rows, columns], (rows, columns)), shape=X.shape
+    )
+    with pytest.warns(RuntimeWarning):
+        expected = aggregate_all(agg_function, X)
+    res = aggregate_sparse(agg_function, X_sparse)
+    np.testing.assert_allclose(res, expected)
+
+
+@pytest.mark.parametrize("agg_function", ["mean", "median"])
+def test_aggregate_with_counts(agg_function: str) -> None:
+    """
+    Test that aggregate_with_counts gives the same results as aggregate_all
+    on the array with repeated columns.
+    """
+    rng = np.random.RandomState(1)
+    X = rng.randn(20, 4)
+    X[3, 1] = np.nan
+    counts = np.array([3, 1, 4, 2])
+    res = aggregate_with_counts(agg_function, X, counts)
+    expected = aggregate_all(agg_function, np.repeat(X, counts, axis=1))
+    np.testing.assert_allclose(res, expected)
+
+
+def test_invalid_aggregate_with_counts() -> None:
+    """Test that undefined aggregation function raises errors."""
+    with pytest.raises(ValueError, match=r".*Aggregation function called.*"):
+        aggregate_with_counts(None, np.ones((2, 2)), np.ones(2))
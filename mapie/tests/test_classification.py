@@ -14,6 +14,7 @@ from sklearn.linear_model import LogisticRegression
 from sklearn.utils.validation import check_is_fitted
 from sklearn.dummy import DummyClassifier
 from sklearn.naive_bayes import GaussianNB
+from sklearn.tree import DecisionTreeClassifier
 
 from mapie.classification import MapieClassifier
 from mapie.metrics import classification_coverage_score
@@ -341,6 +342,7 @@ def test_default_parameters() -> None:
     assert mapie.verbose == 0
     assert mapie.random_state is None
     assert mapie.n_jobs is None
+    assert mapie.predict_from_proba is True
 
 
 def test_default_sample_weight() -> None:
@@ -784,7 +786,7 @@ def test_cumulated_scores() -> None:
         include_last_label=True,
         alpha=alpha
     )
-    np.testing.assert_allclose(mapie.quantiles_, quantile)
+    np.testing.assert_allclose(mapie.get_quantiles(alpha), quantile)
     np.testing.assert_allclose(y_ps[:, :, 0], cumclf.y_pred_sets)
 
 
@@ -812,7 +814,7 @@ def test_image_cumulated_scores(X: dict[str, np.ndarray]) -> None:
         include_last_label=True,
         alpha=alpha
     )
-    np.testing.assert_allclose(mapie.quantiles_, quantile)
+    np.testing.assert_allclose(mapie.get_quantiles(alpha), quantile)
     np.testing.assert_allclose(y_ps[:, :, 0], cumclf.y_pred_sets)
 
 
@@ -871,3 +873,150 @@ def test_classifier_without_classes_attribute(
         AttributeError, match=r".*does not contain 'classes_'.*"
     ):
         mapie.fit(X_toy, y_toy)
+
+
+@pytest.mark.parametrize("strategy", [*STRATEGIES])
+@pytest.mark.parametrize("batch_size", [1, 7, 500])
+def test_results_with_batch_size(strategy: str, batch_size: int) -> None:
+    """Test that prediction sets do not depend on the size of batches."""
+    args_init, args_predict = STRATEGIES[strategy]
+    # Probabilities of a decision tree do not depend on the size of batches
+    estimator = DecisionTreeClassifier(max_depth=3, random_state=0)
+    mapie = MapieClassifier(estimator=estimator.fit(X, y), **args_init)
+    mapie.fit(X, y)
+    y_pred, y_ps = mapie.predict(X, alpha=[0.1, 0.2], **args_predict)
+    y_pred_batch, y_ps_batch = mapie.predict(
+        X, alpha=[0.1, 0.2], batch_size=batch_size, **args_predict
+    )
+    np.testing.assert_array_equal(y_pred, y_pred_batch)
+    np.testing.assert_array_equal(y_ps, y_ps_batch)
+
+
+def test_predict_iter() -> None:
+    """Test that predict_iter yields the outputs of predict by batches."""
+    mapie = MapieClassifier().fit(X, y)
+    _, y_ps = mapie.predict(X, alpha=0.1)
+    batches = list(mapie.predict_iter(X, alpha=0.1, batch_size=300))
+    assert [len(y_pred_batch) for y_pred_batch, _ in batches] == [300, 200]
+    np.testing.assert_array_equal(
+        y_ps, np.concatenate([y_ps_batch for _, y_ps_batch in batches])
+    )
+
+
+@pytest.mark.parametrize("predict_from_proba", [True, False])
+def test_predict_from_proba(predict_from_proba: bool) -> None:
+    """
+    Test that predicted labels are the labels of highest probability,
+    without calling predict, unless predict_from_proba is False.
+    """
+    estimator = LogisticRegression().fit(X, y)
+    y_pred_est = estimator.predict(X)
+    mapie = MapieClassifier(
+        estimator=estimator, predict_from_proba=predict_from_proba
+    ).fit(X, y)
+    np.testing.assert_array_equal(mapie.predict(X), y_pred_est)
+    estimator.predict = lambda X: np.full(len(X), -1)
+    y_pred, _ = mapie.predict(X, alpha=0.1)
+    if predict_from_proba:
+        np.testing.assert_array_equal(y_pred, y_pred_est)
+    else:
+        np.testing.assert_array_equal(y_pred, -1)
+        np.testing.assert_array_equal(mapie.predict(X), -1)
+
+
+@pytest.mark.parametrize("method", ["score", "cumulated_score", "top_k"])
+def test_quantiles_from_sorted_conformity_scores(method: str) -> None:
+    """
+    Test that quantiles looked up in sorted conformity scores are equal
+    to np.quantile of conformity scores.
+    """
+    mapie = MapieClassifier(method=method, random_state=1).fit(X, y)
+    n = mapie.n_samples_val_
+    alpha = np.array([0.05, 0.1, 0.33, 0.5, 0.9])
+    expected = np.stack([
+        np.quantile(
+            mapie.conformity_scores_,
+            ((n + 1) * (1 - _alpha)) / n,
+            interpolation="higher"
+        ) for _alpha in alpha
+    ])
+    np.testing.assert_array_equal(mapie.get_quantiles(alpha), expected)
+
+
+def test_deprecated_quantiles() -> None:
+    """
+    Test that quantiles_ is only set by predict, and deprecated
+    in favor of get_quantiles.
+    """
+    mapie = MapieClassifier().fit(X, y)
+    assert not hasattr(mapie, "quantiles_")
+    mapie.predict(X, alpha=[0.1, 0.2])
+    with pytest.warns(FutureWarning, match=r".*get_quantiles.*"):
+        quantiles = mapie.quantiles_
+    np.testing.assert_array_equal(quantiles, mapie.get_quantiles([0.1, 0.2]))
+
+
+@pytest.mark.parametrize("include_last_label", [True, False, "randomized"])
+@pytest.mark.parametrize("n_top", [1, 2, 5])
+def test_proba_cumsum_top_labels(
+    include_last_label: Union[bool, str], n_top: int
+) -> None:
+    """
+    Test that sorting only the labels of highest probability gives
+    the same last included labels and prediction sets as a full sort.
+    """
+    rng = np.random.RandomState(1)
+    y_pred_proba = rng.dirichlet(np.full(40, 0.1), size=50)
+    y_pred_proba[:10, 20:] = 0
+    y_pred_proba[10:20, 5:] = 1e-20
+    y_pred_proba /= np.sum(y_pred_proba, axis=1, keepdims=True)
+    quantiles = np.array([0.1, 0.5, 0.9, 0.99, 1.])
+    mapie = MapieClassifier()
+    results = []
+    for n_top_ in [n_top, 40]:
+        y_pred_proba_cumsum = mapie._get_proba_cumsum(
+            y_pred_proba, quantiles, include_last_label, n_top=n_top_
+        )
+        y_pred_index_last = mapie._get_last_index_included(
+            y_pred_proba_cumsum, quantiles, include_last_label
+        )
+        results.append((
+            y_pred_index_last,
+            np.take_along_axis(y_pred_proba_cumsum, y_pred_index_last, axis=1)
+        ))
+    np.testing.assert_array_equal(results[0][0], results[1][0])
+    np.testing.assert_array_equal(results[0][1], results[1][1])
+
+
+@pytest.mark.parametrize("method", ["naive", "cumulated_score"])
+@pytest.mark.parametrize("include_last_label", [True, False, "randomized"])
+def test_predict_many_classes(
+    monkeypatch: Any, method: str, include_last_label: Union[bool, str]
+) -> None:
+    """
+    Test that prediction sets with many classes do not depend on the
+    number of labels initially sorted.
+    """
+    X_many, y_many = make_classification(
+        n_samples=500, n_features=20, n_informative=15, n_classes=50,
+        n_clusters_per_class=1, random_state=1
+    )
+    mapie = MapieClassifier(method=method, random_state=1)
+    mapie.fit(X_many, y_many)
+    _, y_ps = mapie.predict(
+        X_many, alpha=[0.05, 0.2], include_last_label=include_last_label
+    )
+    get_proba_cumsum = MapieClassifier._get_proba_cumsum
+    monkeypatch.setattr(
+        MapieClassifier,
+        "_get_proba_cumsum",
+        lambda self, y_pred_proba, quantiles, include_last_label: (
+            get_proba_cumsum(
+                self, y_pred_proba, quantiles, include_last_label, n_top=50
+            )
+        )
+    )
+    _, y_ps_full = mapie.predict(
+        X_many, alpha=[0.05, 0.2], include_last_label=include_last_label
+    )
+    np.testing.assert_array_equal(y_ps, y_ps_full)
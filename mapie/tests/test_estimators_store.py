@@ -0,0 +1,58 @@
+import pickle
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression
+
+from mapie.estimators_store import EstimatorsStore
+
+X = np.arange(10).reshape(-1, 1)
+ESTIMATORS = [
+    LinearRegression().fit(X, i * np.arange(10)) for i in range(5)
+]
+
+
+def test_estimators_are_loaded(tmp_path: Path) -> None:
+    """Test that stored estimators are equal to the dumped ones."""
+    store = EstimatorsStore.dump(ESTIMATORS, str(tmp_path))
+    assert len(store) == len(ESTIMATORS)
+    for estimator, loaded in zip(ESTIMATORS, store):
+        np.testing.assert_allclose(loaded.predict(X), estimator.predict(X))
+    np.testing.assert_allclose(store[-1].coef_, ESTIMATORS[-1].coef_)
+    assert len(store[1:3]) == 2
+
+
+def test_cache_is_bounded(tmp_path: Path) -> None:
+    """Test that only the most recently used estimators are in memory."""
+    store = EstimatorsStore.dump(ESTIMATORS, str(tmp_path), cache_size=2)
+    for i in [0, 1, 0, 3]:
+        store[i]
+    assert list(store._cache) == [0, 3]
+    assert store[3] is store[3]
+
+
+def test_extend(tmp_path: Path) -> None:
+    """Test that more estimators are dumped after the stored ones."""
+    store = EstimatorsStore.dump(ESTIMATORS[:2], str(tmp_path))
+    store.extend(ESTIMATORS[2:])
+    assert len(store) == len(ESTIMATORS)
+    for estimator, loaded in zip(ESTIMATORS, store):
+        np.testing.assert_allclose(loaded.predict(X), estimator.predict(X))
+
+
+def test_pickle_excludes_estimators(tmp_path: Path) -> None:
+    """Test that pickling the store does not pickle estimators."""
+    store = EstimatorsStore.dump(ESTIMATORS, str(tmp_path))
+    list(store)
+    store_pickled = pickle.loads(pickle.dumps(store))
+    assert len(store_pickled._cache) == 0
+    np.testing.assert_allclose(store_pickled[2].coef_, ESTIMATORS[2].coef_)
+
+
+@pytest.mark.parametrize("cache_size", [0, -1, 1.5])
+def test_invalid_cache_size(tmp_path: Path, cache_size: Any) -> None:
+    """Test that invalid cache sizes raise errors."""
+    with pytest.raises(ValueError, match=r".*Invalid cache_size.*"):
+        EstimatorsStore(str(tmp_path), 0, cache_size=cache_size)
@@ -0,0 +1,89 @@
+from typing import Any, Dict
+
+import numpy as np
+import pytest
+from sklearn.base import RegressorMixin, clone
+from sklearn.datasets import make_regression
+from sklearn.linear_model import Lasso, LinearRegression, Ridge
+
+from mapie.leave_one_out import fit_linear_leave_one_out
+
+X, y = make_regression(n_samples=50, n_features=5, noise=1.0, random_state=1)
+
+
+@pytest.mark.parametrize(
+    "estimator",
+    [
+        LinearRegression(),
+        LinearRegression(fit_intercept=False),
+        Ridge(alpha=10.0),
+        Ridge(alpha=0.5, fit_intercept=False, solver="svd"),
+    ],
+)
+def test_leave_one_out_equals_refits(estimator: RegressorMixin) -> None:
+    """
+    Test that closed-form leave-one-out models are equal to the
+    estimators refitted without each sample.
+    """
+    output = fit_linear_leave_one_out(estimator, X, y)
+    assert output is not None
+    estimators, y_pred = output
+    assert len(estimators) == len(X)
+    y_pred_multi = estimators.predict_all(X[:10])
+    for i in range(len(X)):
+        mask = np.arange(len(X)) != i
+        refitted = clone(estimator).fit(X[mask], y[mask])
+        np.testing.assert_allclose(
+            refitted.predict(X[i:i + 1]), y_pred[i], rtol=1e-8
+        )
+        np.testing.assert_allclose(
+            refitted.predict(X[:10]), y_pred_multi[:, i], rtol=1e-8
+        )
+        np.testing.assert_allclose(
+            estimators[i].predict(X[:10]), y_pred_multi[:, i], rtol=1e-8
+        )
+
+
+@pytest.mark.parametrize(
+    "estimator, kwargs",
+    [
+        (Lasso(), {}),
+        (Ridge(solver="sag"), {}),
+        (LinearRegression(positive=True), {}),
+        (LinearRegression(), {"sample_weight": np.ones(len(X))}),
+        (LinearRegression(), {"X": np.column_stack([X, X[:, 0]])}),
+    ],
+)
+def test_no_closed_form(
+    estimator: RegressorMixin, kwargs: Dict[str, Any]
+) -> None:
+    """
+    Test that there is no closed form for other estimators, sample
+    weights or rank deficient data.
+    """
+    params = {"X": X, "y": y, **kwargs}
+    assert fit_linear_leave_one_out(estimator, **params) is None
+
+
+def test_leave_one_out_near_collinear() -> None:
+    """
+    Test that closed-form leave-one-out models are equal to the
+    estimators refitted without each sample, with a near-collinear
+    design whose normal equations are too ill-conditioned.
+    """
+    rng = np.random.RandomState(0)
+    x = rng.randn(200)
+    X_col = np.column_stack([x, x + 1e-7 * rng.randn(200), rng.randn(200)])
+    y_col = X_col[:, 0] + X_col[:, 2] + 0.1 * rng.randn(200)
+    output = fit_linear_leave_one_out(LinearRegression(), X_col, y_col)
+    assert output is not None
+    estimators, y_pred = output
+    for i in range(len(X_col)):
+        mask = np.arange(len(X_col)) != i
+        refitted = LinearRegression().fit(X_col[mask], y_col[mask])
+        np.testing.assert_allclose(
+            refitted.predict(X_col[i:i + 1]), y_pred[i], atol=1e-8
+        )
+        np.testing.assert_allclose(
+            estimators[i].coef_, refitted.coef_, atol=1e-2
+        )
@@ -0,0 +1,135 @@
+import numpy as np
+import pytest
+
+from mapie.quantile_functions import (
+    compute_quantiles,
+    compute_quantiles_from_sorted,
+    count_less_or_equal,
+    delete_sorted,
+    grouped_order_statistic,
+    insert_sorted,
+)
+
+
+def test_count_less_or_equal() -> None:
+    """Test the result of count_less_or_equal."""
+    offsets = np.array([0.0, 1.0, -10.0])
+    values = np.array([1.0, 2.0, 2.0, 3.0])
+    thresholds = np.array([2.0, 2.5, 0.0])
+    res = count_less_or_equal(offsets, values, thresholds)
+    np.testing.assert_array_equal(res, [3, 1, 4])
+
+
+def test_count_less_or_equal_empty_values() -> None:
+    """Test that count_less_or_equal returns zeros for empty values."""
+    res = count_less_or_equal(np.zeros(3), np.array([]), np.ones(3))
+    np.testing.assert_array_equal(res, [0, 0, 0])
+
+
+@pytest.mark.parametrize("rank", [0, 1, 17, 42, 59])
+def test_grouped_order_statistic_equals_sort(rank: int) -> None:
+    """
+    Test that grouped_order_statistic gives the same order statistics
+    as sorting the expanded matrix of sums.
+    """
+    rng = np.random.RandomState(0)
+    groups = [np.sort(rng.rand(n)) for n in [10, 25, 25]]
+    offsets = rng.randn(30, 3)
+    expanded = np.concatenate(
+        [offsets[:, [g]] + values for g, values in enumerate(groups)],
+        axis=1,
+    )
+    expected = np.sort(expanded, axis=1)[:, rank]
+    res = grouped_order_statistic(offsets, groups, np.full(30, rank))
+    np.testing.assert_array_equal(res, expected)
+
+
+def test_grouped_order_statistic_nan_offsets() -> None:
+    """Test that rows with nan offsets give nan order statistics."""
+    groups = [np.array([1.0, 2.0]), np.array([3.0])]
+    offsets = np.array([[0.0, np.nan], [0.0, 0.0]])
+    res = grouped_order_statistic(offsets, groups, np.array([1, 1]))
+    assert np.isnan(res[0])
+    assert res[1] == 2.0
+
+
+@pytest.mark.parametrize("interpolation", ["lower", "higher"])
+@pytest.mark.parametrize("nan_ratio", [0.0, 0.3])
+def test_compute_quantiles_equals_nanquantile(
+    interpolation: str, nan_ratio: float
+) -> None:
+    """
+    Test that compute_quantiles gives the same results as np.nanquantile
+    for dense grids of quantiles, with or without nans.
+    """
+    rng = np.random.RandomState(0)
+    X = rng.randn(50, 37)
+    X[rng.rand(50, 37) < nan_ratio] = np.nan
+    quantiles = np.linspace(0.01, 0.99, 99)
+    res = compute_quantiles(X, quantiles, interpolation)
+    expected = np.stack(
+        [
+            np.nanquantile(X, q, axis=1, interpolation=interpolation)
+            for q in quantiles
+        ],
+        axis=1,
+    )
+    np.testing.assert_array_equal(res, expected)
+
+
+def test_compute_quantiles_only_nans() -> None:
+    """Test that rows with only nans give nan quantiles."""
+    X = np.array([[np.nan, np.nan], [1.0, np.nan]])
+    res = compute_quantiles(X, np.array([0.1, 0.9]), "higher")
+    assert np.isnan(res[0]).all()
+    np.testing.assert_array_equal(res[1], [1.0, 1.0])
+
+
+def test_invalid_interpolation() -> None:
+    """Test that invalid interpolation raises errors."""
+    with pytest.raises(ValueError, match=r".*Invalid interpolation.*"):
+        compute_quantiles(np.ones((2, 2)), np.array([0.5]), "linear")
+
+
+@pytest.mark.parametrize("interpolation", ["lower", "higher"])
+def test_compute_quantiles_from_sorted(interpolation: str) -> None:
+    """
+    Test that compute_quantiles_from_sorted gives the same results
+    as np.quantile.
+    """
+    X_sorted = np.sort(np.random.RandomState(0).rand(101))
+    quantiles = np.linspace(0.01, 0.99, 99)
+    res = compute_quantiles_from_sorted(X_sorted, quantiles, interpolation)
+    expected = np.quantile(X_sorted, quantiles, interpolation=interpolation)
+    np.testing.assert_array_equal(res, expected)
+
+
+def test_compute_quantiles_from_empty_sorted() -> None:
+    """Test that quantiles of an empty array are nans."""
+    res = compute_quantiles_from_sorted(np.array([]), [0.5], "lower")
+    assert np.isnan(res).all()
+
+
+def test_insert_sorted() -> None:
+    """Test that inserted values give the sorted concatenation."""
+    rng = np.random.RandomState(0)
+    X = rng.randint(0, 10, size=30).astype(float)
+    values = rng.randint(0, 10, size=15).astype(float)
+    res = insert_sorted(np.sort(X), values)
+    np.testing.assert_array_equal(res, np.sort(np.concatenate([X, values])))
+
+
+def test_delete_sorted() -> None:
+    """Test that deleted values give the sorted remaining values."""
+    rng = np.random.RandomState(0)
+    X = rng.randint(0, 10, size=30).astype(float)
+    res = delete_sorted(np.sort(X), X[:12])
+    np.testing.assert_array_equal(res, np.sort(X[12:]))
+
+
+def test_invalid_delete_sorted() -> None:
+    """Test that deleting missing values raises an error."""
+    X_sorted = np.array([0.0, 1.0, 1.0, 3.0])
+    for values in [[2.0], [4.0], [1.0, 1.0, 1.0]]:
+        with pytest.raises(ValueError, match=r".*Invalid values.*"):
+            delete_sorted(X_sorted, np.array(values))
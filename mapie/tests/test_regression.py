@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+import pickle
 from inspect import signature
 from itertools import combinations
+from pathlib import Path
 from typing import Any, List, Optional, Tuple, Union
 
 import numpy as np
 import pytest
+from joblib import parallel_backend
+from scipy.sparse import issparse
 from sklearn.base import RegressorMixin
 from sklearn.datasets import make_regression
 from sklearn.dummy import DummyRegressor
 from sklearn.exceptions import NotFittedError
 from sklearn.linear_model import LinearRegression
 from sklearn.model_selection import KFold, LeaveOneOut, train_test_split
+from sklearn.neighbors import KNeighborsRegressor
 from sklearn.pipeline import Pipeline, make_pipeline
 from sklearn.utils.estimator_checks import parametrize_with_checks
 from sklearn.utils.validation import check_is_fitted
@@ -443,6 +448,41 @@ def test_results_single_and_multi_jobs(strategy: str) -> None:
     np.testing.assert_allclose(y_pis_single, y_pis_multi)
 
 
+@pytest.mark.parametrize("n_jobs", [1, 2])
+@pytest.mark.parametrize("strategy", ["cv_plus", "jackknife_plus_ab"])
+def test_single_estimator_fitted_with_folds(
+    n_jobs: int, strategy: str
+) -> None:
+    """
+    Test that the estimator fitted on the whole training set in the same
+    pool as the out-of-fold models is equal to a direct fit.
+    """
+    mapie_reg = MapieRegressor(n_jobs=n_jobs, **STRATEGIES[strategy])
+    mapie_reg.fit(X, y)
+    estimator = LinearRegression().fit(X, y)
+    np.testing.assert_allclose(
+        mapie_reg.single_estimator_.coef_, estimator.coef_
+    )
+    assert len(mapie_reg.estimators_) == len(mapie_reg.n_samples_val_)
+
+
+@pytest.mark.parametrize("strategy", ["jackknife_plus", "cv_minmax"])
+def test_predict_with_process_backend(strategy: str) -> None:
+    """
+    Test that estimators give equal predictions when inference
+    is distributed over processes instead of threads.
+    """
+    mapie_reg = MapieRegressor(n_jobs=2, **STRATEGIES[strategy])
+    mapie_reg.fit(X_toy, y_toy)
+    y_pred_threads, y_pis_threads = mapie_reg.predict(X_toy, alpha=0.2)
+    with parallel_backend("loky"):
+        y_pred_processes, y_pis_processes = mapie_reg.predict(
+            X_toy, alpha=0.2
+        )
+    np.testing.assert_allclose(y_pred_threads, y_pred_processes)
+    np.testing.assert_allclose(y_pis_threads, y_pis_processes)
+
+
 @pytest.mark.parametrize("strategy", [*STRATEGIES])
 def test_results_with_constant_sample_weights(strategy: str) -> None:
     """
@@ -567,3 +607,630 @@ def test_pred_loof_isnan() -> None:
         k=0,
     )
     assert len(y_pred) == 0
+
+
+@pytest.mark.parametrize("agg_function", [None, "mean", "median"])
+def test_plus_bounds_per_fold(agg_function: Optional[str]) -> None:
+    """
+    Test that the "plus" bounds computed fold by fold are equal to the
+    quantiles of the expanded matrix of predictions.
+    """
+    alpha = np.array([0.05, 0.1, 0.5])
+    mapie_reg = MapieRegressor(
+        method="plus",
+        cv=KFold(n_splits=3, shuffle=True, random_state=1),
+        agg_function=agg_function,
+    )
+    mapie_reg.fit(X, y)
+    y_pred, y_pis = mapie_reg.predict(X, alpha=alpha)
+    y_pred_multi = np.column_stack(
+        [e.predict(X) for e in mapie_reg.estimators_]
+    )[:, mapie_reg.k_]
+    lower_bounds = y_pred_multi - mapie_reg.residuals_
+    upper_bounds = y_pred_multi + mapie_reg.residuals_
+    for i, _alpha in enumerate(alpha):
+        np.testing.assert_array_equal(
+            y_pis[:, 0, i],
+            np.quantile(
+                lower_bounds, _alpha, axis=1, interpolation="lower"
+            ),
+        )
+        np.testing.assert_array_equal(
+            y_pis[:, 1, i],
+            np.quantile(
+                upper_bounds, 1 - _alpha, axis=1, interpolation="higher"
+            ),
+        )
+    if agg_function is not None:
+        np.testing.assert_allclose(
+            y_pred, aggregate_all(agg_function, y_pred_multi)
+        )
+
+
+def test_sorted_residuals_per_fold() -> None:
+    """Test that residuals are sorted by fold at fit time."""
+    mapie_reg = MapieRegressor(
+        cv=KFold(n_splits=3, shuffle=True, random_state=1)
+    ).fit(X, y)
+    assert len(mapie_reg.sorted_residuals_per_fold_) == 3
+    for k, residuals in enumerate(mapie_reg.sorted_residuals_per_fold_):
+        np.testing.assert_array_equal(
+            residuals, np.sort(mapie_reg.residuals_[mapie_reg.k_ == k])
+        )
+
+
+@pytest.mark.parametrize("strategy", [*STRATEGIES])
+@pytest.mark.parametrize("batch_size", [1, 7, 50])
+def test_results_with_batch_size(strategy: str, batch_size: int) -> None:
+    """Test that predictions do not depend on the size of batches."""
+    mapie_reg = MapieRegressor(**STRATEGIES[strategy])
+    mapie_reg.fit(X, y)
+    y_pred, y_pis = mapie_reg.predict(X[:20], alpha=[0.05, 0.1])
+    y_pred_batch, y_pis_batch = mapie_reg.predict(
+        X[:20], alpha=[0.05, 0.1], batch_size=batch_size
+    )
+    np.testing.assert_allclose(y_pred, y_pred_batch)
+    np.testing.assert_allclose(y_pis, y_pis_batch)
+
+
+def test_predict_iter() -> None:
+    """Test that predict_iter yields the outputs of predict by batches."""
+    mapie_reg = MapieRegressor().fit(X, y)
+    y_pred, y_pis = mapie_reg.predict(X, alpha=0.1)
+    batches = list(mapie_reg.predict_iter(X, alpha=0.1, batch_size=200))
+    assert [len(batch[0]) for batch in batches] == [200, 200, 100]
+    np.testing.assert_allclose(
+        y_pis, np.concatenate([y_pis_batch for _, y_pis_batch in batches])
+    )
+    np.testing.assert_allclose(
+        y_pred, np.concatenate(list(mapie_reg.predict_iter(X, batch_size=99)))
+    )
+
+
+@pytest.mark.parametrize("batch_size", [0, -1, 2.5, "1"])
+def test_invalid_batch_size(batch_size: Any) -> None:
+    """Test that invalid batch sizes raise errors."""
+    mapie_reg = MapieRegressor().fit(X_toy, y_toy)
+    with pytest.raises(ValueError, match=r".*Invalid batch_size.*"):
+        mapie_reg.predict(X_toy, batch_size=batch_size)
+
+
+@pytest.mark.parametrize("method", ["plus", "minmax"])
+def test_nan_residuals_are_ignored(method: str) -> None:
+    """
+    Test that training samples belonging to every resampling,
+    whose residuals are nan, are ignored in the prediction intervals.
+    """
+    mapie_reg = MapieRegressor(
+        method=method,
+        cv=Subsample(n_resamplings=3, random_state=1),
+        agg_function="mean",
+    )
+    with pytest.warns(UserWarning, match=r"WARNING: at least one point*"):
+        mapie_reg.fit(X, y)
+    assert np.isnan(mapie_reg.residuals_).any()
+    _, y_pis = mapie_reg.predict(X, alpha=0.2)
+    assert not np.isnan(y_pis).any()
+
+
+@pytest.mark.parametrize("strategy", ["naive", "jackknife", "cv"])
+def test_sorted_residuals(strategy: str) -> None:
+    """
+    Test that residuals are sorted at fit time and that fixed-width
+    intervals are the quantiles of residuals.
+    """
+    mapie_reg = MapieRegressor(**STRATEGIES[strategy])
+    mapie_reg.fit(X, y)
+    np.testing.assert_array_equal(
+        mapie_reg.sorted_residuals_, np.sort(mapie_reg.residuals_)
+    )
+    y_pred, y_pis = mapie_reg.predict(X, alpha=[0.05, 0.3])
+    quantiles = np.quantile(
+        mapie_reg.residuals_, [0.95, 0.7], interpolation="higher"
+    )
+    np.testing.assert_allclose(
+        y_pis[:, 1, :] - y_pred[:, np.newaxis],
+        np.broadcast_to(quantiles, (len(X), 2)),
+    )
+
+
+@pytest.mark.parametrize("strategy", [*STRATEGIES])
+def test_predict_distribution(strategy: str) -> None:
+    """
+    Test that intervals computed from the prediction distribution
+    are equal to the outputs of predict.
+    """
+    mapie_reg = MapieRegressor(**STRATEGIES[strategy])
+    mapie_reg.fit(X, y)
+    y_pred, y_pis = mapie_reg.predict(X, alpha=[0.05, 0.2])
+    distribution = mapie_reg.predict_distribution(X)
+    np.testing.assert_allclose(distribution.predict(), y_pred)
+    np.testing.assert_allclose(distribution.intervals([0.05, 0.2]), y_pis)
+    np.testing.assert_allclose(distribution.interval(0.2), y_pis[:, :, 1])
+
+
+@pytest.mark.parametrize("method", ["base", "plus", "minmax"])
+def test_predict_distribution_method(method: str) -> None:
+    """
+    Test that the method can be changed without running the
+    estimators again.
+    """
+    cv = KFold(n_splits=3, shuffle=True, random_state=1)
+    mapie_reg = MapieRegressor(method="plus", cv=cv).fit(X, y)
+    distribution = mapie_reg.predict_distribution(X)
+    assert distribution.y_pred_single.shape == (len(X),)
+    assert distribution.y_pred_multi.shape == (len(X), 3)
+    mapie_reg.estimators_ = []
+    mapie_reg.single_estimator_ = None
+    y_pis = distribution.intervals(0.1, method=method)
+    mapie_reg_method = MapieRegressor(method=method, cv=cv).fit(X, y)
+    y_pred_method, y_pis_method = mapie_reg_method.predict(X, alpha=0.1)
+    np.testing.assert_allclose(y_pis, y_pis_method)
+    np.testing.assert_allclose(
+        distribution.predict(method=method), y_pred_method
+    )
+
+
+@pytest.mark.parametrize("refit", ["fit", "fit_more", "partial_fit"])
+def test_predict_distribution_after_refit(refit: str) -> None:
+    """
+    Test that a distribution predicted before fitting again the
+    MapieRegressor raises an error instead of mixing both fits.
+    """
+    if refit == "fit_more":
+        mapie_reg = MapieRegressor(**STRATEGIES["jackknife_plus_ab"])
+        mapie_reg.fit(X, y)
+    else:
+        mapie_reg = MapieRegressor(
+            LinearRegression().fit(X, y), cv="prefit"
+        ).fit(X, y)
+    distribution = mapie_reg.predict_distribution(X)
+    distribution.intervals(0.1)
+    if refit == "fit":
+        mapie_reg.fit(X[:50], y[:50])
+    elif refit == "fit_more":
+        mapie_reg.fit_more(X, y, n_additional=2)
+    else:
+        mapie_reg.partial_fit(X[:10], y[:10])
+    with pytest.raises(ValueError, match=r".*fitted again.*"):
+        distribution.intervals(0.1)
+    with pytest.raises(ValueError, match=r".*fitted again.*"):
+        distribution.predict()
+
+
+@pytest.mark.parametrize("method", ["naive", "jackknife"])
+def test_predict_distribution_invalid_method(method: str) -> None:
+    """
+    Test that invalid methods, or the naive method mixed with others,
+    raise errors.
+    """
+    mapie_reg = MapieRegressor(method="plus").fit(X_toy, y_toy)
+    distribution = mapie_reg.predict_distribution(X_toy)
+    with pytest.raises(ValueError, match=r".*Invalid method.*"):
+        distribution.intervals(0.5, method=method)
+
+
+@pytest.mark.parametrize("strategy", ["jackknife_minmax", "cv_minmax"])
+def test_minmax_closed_form(strategy: str) -> None:
+    """
+    Test that minmax bounds are equal to the quantiles of the bounds
+    computed for each residual.
+    """
+    mapie_reg = MapieRegressor(**STRATEGIES[strategy])
+    mapie_reg.fit(X, y)
+    _, y_pis = mapie_reg.predict(X, alpha=[0.1, 0.3])
+    y_pred_multi = mapie_reg._predict_oof_estimators(X)
+    lower_bounds = (
+        np.min(y_pred_multi, axis=1, keepdims=True) - mapie_reg.residuals_
+    )
+    upper_bounds = (
+        np.max(y_pred_multi, axis=1, keepdims=True) + mapie_reg.residuals_
+    )
+    for i, alpha in enumerate([0.1, 0.3]):
+        np.testing.assert_array_equal(
+            y_pis[:, 0, i],
+            np.quantile(lower_bounds, alpha, axis=1, interpolation="lower"),
+        )
+        np.testing.assert_array_equal(
+            y_pis[:, 1, i],
+            np.quantile(
+                upper_bounds, 1 - alpha, axis=1, interpolation="higher"
+            ),
+        )
+
+
+@pytest.mark.parametrize("agg_function", ["mean", "median"])
+def test_sparse_out_of_bag_mask(agg_function: str) -> None:
+    """
+    Test that the out-of-bag membership of Subsample is sparse,
+    and that aggregations are equal with the dense 1-or-nan array.
+    """
+    mapie_reg = MapieRegressor(
+        cv=Subsample(n_resamplings=30, random_state=1),
+        agg_function=agg_function,
+    )
+    mapie_reg.fit(X, y)
+    assert issparse(mapie_reg.k_)
+    assert mapie_reg.k_.shape == (len(X), 30)
+    y_pred_multi = np.column_stack(
+        [estimator.predict(X[:10]) for estimator in mapie_reg.estimators_]
+    )
+    k_dense = np.where(mapie_reg.k_.toarray(), 1, np.nan)
+    np.testing.assert_allclose(
+        mapie_reg.aggregate_with_mask(y_pred_multi, mapie_reg.k_),
+        mapie_reg.aggregate_with_mask(y_pred_multi, k_dense),
+    )
+
+
+@pytest.mark.parametrize("strategy", ["cv_plus", "jackknife_plus_ab"])
+def test_results_with_memmapped_data(strategy: str) -> None:
+    """
+    Test that MapieRegressor gives equal predictions when training data
+    are memory mapped for parallel jobs.
+    """
+    X_large, y_large = make_regression(
+        n_samples=2000, n_features=80, noise=1.0, random_state=1
+    )
+    mapie_single = MapieRegressor(n_jobs=1, **STRATEGIES[strategy])
+    mapie_multi = MapieRegressor(n_jobs=2, **STRATEGIES[strategy])
+    mapie_single.fit(X_large, y_large)
+    mapie_multi.fit(X_large, y_large)
+    y_pred_single, y_pis_single = mapie_single.predict(X_large[:50], alpha=0.2)
+    y_pred_multi, y_pis_multi = mapie_multi.predict(X_large[:50], alpha=0.2)
+    np.testing.assert_allclose(y_pred_single, y_pred_multi)
+    np.testing.assert_allclose(y_pis_single, y_pis_multi)
+
+
+@pytest.mark.parametrize("strategy", ["cv_plus", "jackknife_plus_ab"])
+def test_single_job_without_temporary_folder(
+    strategy: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that a fit with a single job does not create a temporary
+    folder, e.g. with a missing temporary directory.
+    """
+    monkeypatch.setattr("tempfile.tempdir", str(tmp_path / "missing"))
+    MapieRegressor(n_jobs=1, **STRATEGIES[strategy]).fit(X, y)
+
+
+@pytest.mark.parametrize("strategy", ["jackknife_plus", "jackknife_minmax"])
+def test_linear_leave_one_out(strategy: str) -> None:
+    """
+    Test that leave-one-out models of a linear regression computed in
+    closed form give the same intervals as refitted estimators.
+    """
+    mapie_reg = MapieRegressor(LinearRegression(), **STRATEGIES[strategy])
+    mapie_refit = MapieRegressor(
+        make_pipeline(LinearRegression()), **STRATEGIES[strategy]
+    )
+    mapie_reg.fit(X, y)
+    mapie_refit.fit(X, y)
+    assert hasattr(mapie_reg.estimators_, "predict_all")
+    assert len(mapie_reg.estimators_) == len(mapie_refit.estimators_)
+    np.testing.assert_allclose(mapie_reg.residuals_, mapie_refit.residuals_)
+    y_pred, y_pis = mapie_reg.predict(X, alpha=0.1)
+    y_pred_refit, y_pis_refit = mapie_refit.predict(X, alpha=0.1)
+    np.testing.assert_allclose(y_pred, y_pred_refit)
+    np.testing.assert_allclose(y_pis, y_pis_refit)
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+@pytest.mark.parametrize("strategy", [*STRATEGIES])
+def test_fit_predict_intervals(n_jobs: int, strategy: str) -> None:
+    """
+    Test that fit_predict_intervals gives the same results as fit and
+    predict, without keeping the out-of-fold estimators.
+    """
+    mapie_reg = MapieRegressor(n_jobs=n_jobs, **STRATEGIES[strategy])
+    y_pred, y_pis = mapie_reg.fit(X, y).predict(X[:20], alpha=[0.1, 0.2])
+    y_pred_single = mapie_reg.predict(X[:20])
+    y_pred_test, y_pis_test = mapie_reg.fit_predict_intervals(
+        X, y, X[:20], alpha=[0.1, 0.2]
+    )
+    np.testing.assert_allclose(y_pred_test, y_pred)
+    np.testing.assert_allclose(y_pis_test, y_pis)
+    if STRATEGIES[strategy]["method"] != "naive":
+        assert mapie_reg.estimators_ is None
+    np.testing.assert_allclose(
+        mapie_reg.fit_predict_intervals(X, y, X[:20]), y_pred_single
+    )
+
+
+@pytest.mark.parametrize("strategy", [*STRATEGIES])
+def test_predict_after_fit_predict_intervals(strategy: str) -> None:
+    """
+    Test that predict is available after fit_predict_intervals, except
+    with methods which need the discarded out-of-fold estimators.
+    """
+    mapie_reg = MapieRegressor(**STRATEGIES[strategy])
+    y_pred, y_pis = mapie_reg.fit(X, y).predict(X[:20], alpha=0.1)
+    mapie_reg.fit_predict_intervals(X, y, X[:20])
+    np.testing.assert_allclose(
+        mapie_reg.predict(X[:20]), mapie_reg.single_estimator_.predict(X[:20])
+    )
+    if STRATEGIES[strategy]["method"] in ["naive", "base"]:
+        y_pred_after, y_pis_after = mapie_reg.predict(X[:20], alpha=0.1)
+        np.testing.assert_allclose(y_pred_after, y_pred)
+        np.testing.assert_allclose(y_pis_after, y_pis)
+    else:
+        with pytest.raises(
+            ValueError, match=r".*discarded by fit_predict_intervals.*"
+        ):
+            mapie_reg.predict(X[:20], alpha=0.1)
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_dump_estimators(tmp_path: Path, n_jobs: int) -> None:
+    """
+    Test that predictions are equal with estimators stored in a folder,
+    including after pickling.
+    """
+    mapie_reg = MapieRegressor(
+        n_jobs=n_jobs, **STRATEGIES["jackknife_plus_ab"]
+    )
+    mapie_reg.fit(X, y)
+    y_pred, y_pis = mapie_reg.predict(X, alpha=0.2)
+    mapie_reg.dump_estimators(str(tmp_path), cache_size=3)
+    mapie_reg = pickle.loads(pickle.dumps(mapie_reg))
+    y_pred_dumped, y_pis_dumped = mapie_reg.predict(X, alpha=0.2)
+    np.testing.assert_allclose(y_pred_dumped, y_pred)
+    np.testing.assert_allclose(y_pis_dumped, y_pis)
+    assert len(mapie_reg.estimators_._cache) == 3
+
+
+def test_fit_more_after_dump_estimators(tmp_path: Path) -> None:
+    """
+    Test that fit_more dumps the new estimators in the folder of
+    the dumped ones, with the same predictions.
+    """
+    mapie_reg = MapieRegressor(**STRATEGIES["jackknife_plus_ab"]).fit(X, y)
+    mapie_dumped = pickle.loads(pickle.dumps(mapie_reg))
+    mapie_dumped.dump_estimators(str(tmp_path))
+    store = mapie_dumped.estimators_
+    mapie_reg.fit_more(X, y, n_additional=3)
+    mapie_dumped.fit_more(X, y, n_additional=3)
+    assert mapie_dumped.estimators_ is store
+    assert len(store) == len(mapie_reg.estimators_)
+    assert len(list(tmp_path.iterdir())) == len(store)
+    y_pred, y_pis = mapie_reg.predict(X, alpha=0.2)
+    y_pred_dumped, y_pis_dumped = mapie_dumped.predict(X, alpha=0.2)
+    np.testing.assert_allclose(y_pred_dumped, y_pred)
+    np.testing.assert_allclose(y_pis_dumped, y_pis)
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+@pytest.mark.parametrize("strategy", [*STRATEGIES])
+def test_fit_stats(n_jobs: int, strategy: str) -> None:
+    """Test that fit statistics are recorded for each fold."""
+    mapie_reg = MapieRegressor(n_jobs=n_jobs, **STRATEGIES[strategy])
+    mapie_reg.fit(X, y)
+    fit_stats = mapie_reg.fit_stats_
+    for phase in ["validation_time", "fit_time", "aggregation_time"]:
+        assert fit_stats[phase] >= 0
+    assert fit_stats["single_estimator"]["n_samples_train"] == len(X)
+    folds = fit_stats["folds"]
+    if folds:
+        assert len(folds) == len(mapie_reg.estimators_)
+        assert [fold["k"] for fold in folds] == list(range(len(folds)))
+        assert [
+            fold["n_samples_val"] for fold in folds
+        ] == mapie_reg.n_samples_val_
+        assert all(fold["fit_time"] >= 0 for fold in folds)
+        assert all(isinstance(fold["worker"], str) for fold in folds)
+
+
+def test_partial_fit() -> None:
+    """
+    Test that partial fits of a prefit estimator give the same
+    residuals and intervals as a fit on all the data.
+    """
+    estimator = LinearRegression().fit(X, y)
+    mapie_reg = MapieRegressor(estimator, cv="prefit").fit(X, y)
+    mapie_partial = MapieRegressor(estimator, cv="prefit")
+    for batch in np.array_split(np.arange(len(X)), 7):
+        mapie_partial.partial_fit(X[batch], y[batch])
+    np.testing.assert_allclose(
+        mapie_partial.sorted_residuals_, mapie_reg.sorted_residuals_
+    )
+    np.testing.assert_allclose(mapie_partial.residuals_, mapie_reg.residuals_)
+    assert np.all(np.diff(mapie_partial.sorted_residuals_) >= 0)
+    assert mapie_partial.n_samples_val_ == mapie_reg.n_samples_val_
+    _, y_pis = mapie_reg.predict(X, alpha=[0.1, 0.2])
+    _, y_pis_partial = mapie_partial.predict(X, alpha=[0.1, 0.2])
+    np.testing.assert_allclose(y_pis_partial, y_pis)
+
+
+@pytest.mark.parametrize("window", [2, 30, np.int64(30), 100, 1000])
+def test_partial_fit_window(window: int) -> None:
+    """
+    Test that partial fits with a window give the same residuals
+    and intervals as a fit on the last samples of the window.
+    """
+    estimator = LinearRegression().fit(X, y)
+    mapie_partial = MapieRegressor(estimator, cv="prefit")
+    for batch in np.array_split(np.arange(len(X)), 9):
+        mapie_partial.partial_fit(X[batch], y[batch], window=window)
+    mapie_reg = MapieRegressor(estimator, cv="prefit").fit(
+        X[-window:], y[-window:]
+    )
+    np.testing.assert_allclose(
+        mapie_partial.sorted_residuals_, mapie_reg.sorted_residuals_
+    )
+    np.testing.assert_allclose(
+        np.roll(mapie_partial.residuals_, -mapie_partial._residuals_head),
+        mapie_reg.residuals_,
+    )
+    assert mapie_partial.n_samples_val_ == [min(window, len(X))]
+    _, y_pis = mapie_reg.predict(X, alpha=0.5)
+    _, y_pis_partial = mapie_partial.predict(X, alpha=0.5)
+    np.testing.assert_allclose(y_pis_partial, y_pis)
+
+
+@pytest.mark.parametrize("window", [20, 10, 30])
+def test_partial_fit_window_in_place(window: int) -> None:
+    """
+    Test that once the window is full, residuals are overwritten in
+    place, and that the window can then be changed.
+    """
+    estimator = LinearRegression().fit(X, y)
+    mapie_partial = MapieRegressor(estimator, cv="prefit")
+    mapie_partial.partial_fit(X[:20], y[:20], window=20)
+    buffer = mapie_partial.residuals_
+    stop = 20
+    for n_samples in [1, 3, 7, 20, 2]:
+        stop += n_samples
+        mapie_partial.partial_fit(
+            X[stop - n_samples:stop], y[stop - n_samples:stop], window=20
+        )
+        assert np.shares_memory(mapie_partial.residuals_, buffer)
+    mapie_partial.partial_fit(X[stop:stop + 5], y[stop:stop + 5], window)
+    stop += 5
+    mapie_reg = MapieRegressor(estimator, cv="prefit").fit(
+        X[stop - min(window, 25):stop], y[stop - min(window, 25):stop]
+    )
+    np.testing.assert_allclose(
+        mapie_partial.sorted_residuals_, mapie_reg.sorted_residuals_
+    )
+    np.testing.assert_allclose(
+        np.roll(mapie_partial.residuals_, -mapie_partial._residuals_head),
+        mapie_reg.residuals_,
+    )
+
+
+def test_invalid_partial_fit() -> None:
+    """
+    Test that partial_fit is not available without prefit estimator
+    and raises an error with a wrong number of features.
+    """
+    assert not hasattr(MapieRegressor(), "partial_fit")
+    with pytest.raises(AttributeError, match=r".*Invalid cv argument.*"):
+        MapieRegressor().partial_fit(X, y)
+    assert "window" in signature(MapieRegressor.partial_fit).parameters
+    estimator = LinearRegression().fit(X, y)
+    mapie_reg = MapieRegressor(estimator, cv="prefit").fit(X, y)
+    with pytest.raises(ValueError, match=r".*Invalid mismatch.*"):
+        mapie_reg.partial_fit(X[:, :2], y)
+    for window in [0, 1.5]:
+        with pytest.raises(ValueError, match=r".*Invalid window.*"):
+            mapie_reg.partial_fit(X, y, window=window)  # type: ignore
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+@pytest.mark.parametrize("agg_function", ["mean", "median"])
+@pytest.mark.parametrize("independent_streams", [False, True])
+def test_fit_more(
+    n_jobs: int, agg_function: str, independent_streams: bool
+) -> None:
+    """
+    Test that additional resamplings give the same model as a fit
+    with all the resamplings.
+    """
+    mapie_reg = MapieRegressor(
+        LinearRegression(),
+        cv=Subsample(
+            n_resamplings=5,
+            random_state=1,
+            independent_streams=independent_streams,
+        ),
+        agg_function=agg_function,
+        n_jobs=n_jobs,
+    ).fit(X_toy, y_toy)
+    mapie_reg.fit_more(X_toy, y_toy, n_additional=4)
+    mapie_reg.fit_more(X_toy, y_toy, n_additional=6)
+    mapie_all = MapieRegressor(
+        LinearRegression(),
+        cv=Subsample(
+            n_resamplings=15,
+            random_state=1,
+            independent_streams=independent_streams,
+        ),
+        agg_function=agg_function,
+    ).fit(X_toy, y_toy)
+    assert len(mapie_reg.estimators_) == 15
+    assert mapie_reg.n_resamplings_ == 15
+    assert (mapie_reg.k_ != mapie_all.k_).nnz == 0
+    np.testing.assert_allclose(
+        mapie_reg.y_pred_oob_.toarray(), mapie_all.y_pred_oob_.toarray()
+    )
+    np.testing.assert_allclose(mapie_reg.residuals_, mapie_all.residuals_)
+    assert mapie_reg.n_samples_val_ == mapie_all.n_samples_val_
+    assert [fold["k"] for fold in mapie_reg.fit_stats_["folds"]] == list(
+        range(15)
+    )
+    y_pred, y_pis = mapie_reg.predict(X_toy, alpha=0.2)
+    y_pred_all, y_pis_all = mapie_all.predict(X_toy, alpha=0.2)
+    np.testing.assert_allclose(y_pred, y_pred_all)
+    np.testing.assert_allclose(y_pis, y_pis_all)
+
+
+def test_invalid_fit_more() -> None:
+    """
+    Test that fit_more raises errors without Subsample, with an
+    invalid number of resamplings or other training data.
+    """
+    mapie_reg = MapieRegressor(cv=3).fit(X_toy, y_toy)
+    with pytest.raises(ValueError, match=r".*Invalid cv argument.*"):
+        mapie_reg.fit_more(X_toy, y_toy, n_additional=2)
+    mapie_reg = MapieRegressor(
+        cv=Subsample(n_resamplings=3, random_state=1), agg_function="mean"
+    ).fit(X_toy, y_toy)
+    for n_additional in [0, 1.5]:
+        with pytest.raises(ValueError, match=r".*Invalid n_additional.*"):
+            mapie_reg.fit_more(
+                X_toy, y_toy, n_additional=n_additional  # type: ignore
+            )
+    with pytest.raises(ValueError, match=r".*Invalid mismatch.*"):
+        mapie_reg.fit_more(X_toy[:-1], y_toy[:-1], n_additional=2)
+
+
+@pytest.mark.parametrize(
+    "estimator", [LinearRegression(), KNeighborsRegressor(n_neighbors=3)]
+)
+def test_bootstrap_weights_counts(estimator: RegressorMixin) -> None:
+    """
+    Test that resamplings given as counts of unique samples give
+    the same model as repeated samples.
+    """
+    mapie_regs = [
+        MapieRegressor(
+            estimator,
+            cv=Subsample(
+                n_resamplings=10,
+                random_state=1,
+                bootstrap_weights=bootstrap_weights,
+            ),
+            agg_function="median",
+        ).fit(X, y)
+        for bootstrap_weights in [None, "counts"]
+    ]
+    np.testing.assert_allclose(
+        mapie_regs[1].residuals_, mapie_regs[0].residuals_
+    )
+    assert (mapie_regs[1].k_ != mapie_regs[0].k_).nnz == 0
+    _, y_pis = mapie_regs[0].predict(X, alpha=0.1)
+    _, y_pis_counts = mapie_regs[1].predict(X, alpha=0.1)
+    np.testing.assert_allclose(y_pis_counts, y_pis)
+
+
+@pytest.mark.parametrize(
+    "estimator", [LinearRegression(), KNeighborsRegressor(n_neighbors=3)]
+)
+def test_bootstrap_weights_poisson(estimator: RegressorMixin) -> None:
+    """
+    Test that samples with a null Poisson weight are out-of-bag,
+    and that only unique samples are used with sample weights.
+    """
+    cv = Subsample(
+        n_resamplings=10, random_state=1, bootstrap_weights="poisson"
+    )
+    mapie_reg = MapieRegressor(estimator, cv=cv, agg_function="mean")
+    mapie_reg.fit(X, y)
+    counts = cv._draw_counts(len(X), np.random.RandomState(1), 10)
+    np.testing.assert_array_equal(mapie_reg.k_.toarray(), counts.T == 0)
+    n_samples_train = [
+        fold["n_samples_train"] for fold in mapie_reg.fit_stats_["folds"]
+    ]
+    if isinstance(estimator, LinearRegression):
+        assert n_samples_train == list(np.sum(counts > 0, axis=1))
+    else:
+        assert n_samples_train == list(np.sum(counts, axis=1))
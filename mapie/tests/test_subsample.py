@@ -1,5 +1,12 @@
 from __future__ import annotations
 
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pytest
+from sklearn import config_context
+from sklearn.utils import resample
+
 from mapie.subsample import Subsample
 
 
@@ -15,3 +22,139 @@ def test_get_n_splits() -> None:
     """Test get_n_splits method of Subsample."""
     cv = Subsample(n_resamplings=30)
     assert cv.get_n_splits() == 30
+
+
+@pytest.mark.parametrize("replace", [True, False])
+@pytest.mark.parametrize("n_samples", [None, 7])
+@pytest.mark.parametrize("working_memory", [1e-4, 1024])
+def test_split_equals_resample(
+    replace: bool, n_samples: Optional[int], working_memory: float
+) -> None:
+    """
+    Test that splits are the ones of successive resamplings
+    with sklearn.utils.resample, whatever the size of chunks.
+    """
+    X = np.arange(20)
+    cv = Subsample(
+        n_resamplings=10, n_samples=n_samples, replace=replace, random_state=1
+    )
+    random_state = np.random.RandomState(1)
+    with config_context(working_memory=working_memory):
+        splits = list(cv.split(X))
+    assert len(splits) == 10
+    for train_index, test_index in splits:
+        expected_train = resample(
+            X, replace=replace, n_samples=n_samples, random_state=random_state
+        )
+        expected_test = np.setdiff1d(X, expected_train)
+        np.testing.assert_array_equal(train_index, expected_train)
+        np.testing.assert_array_equal(test_index, expected_test)
+        assert train_index.dtype == test_index.dtype == np.int32
+
+
+def test_split_matrix() -> None:
+    """Test that split_matrix gives the splits of split."""
+    X = np.arange(30)
+    cv = Subsample(n_resamplings=8, random_state=2)
+    train_indices, test_mask = cv.split_matrix(X)
+    assert train_indices.shape == (8, 30)
+    assert test_mask.shape == (8, 30)
+    for k, (train_index, test_index) in enumerate(cv.split(X)):
+        np.testing.assert_array_equal(train_indices[k], train_index)
+        np.testing.assert_array_equal(np.flatnonzero(test_mask[k]), test_index)
+
+
+def test_invalid_n_samples() -> None:
+    """Test that too many samples without replacement raise an error."""
+    cv = Subsample(n_resamplings=2, n_samples=11, replace=False)
+    with pytest.raises(ValueError, match=r".*Cannot sample 11.*"):
+        next(cv.split(np.arange(10)))
+
+
+@pytest.mark.parametrize("bootstrap_weights", ["counts", "poisson"])
+def test_split_weights(bootstrap_weights: str) -> None:
+    """
+    Test that resamplings as weights are the resamplings of split,
+    with unique training samples.
+    """
+    X = np.arange(25)
+    cv = Subsample(
+        n_resamplings=6, random_state=3, bootstrap_weights=bootstrap_weights
+    )
+    splits = cv._split_weights(X, np.random.RandomState(3), 6)
+    for (train_index, test_index), (train_unique, test, weights) in zip(
+        cv.split(X), splits
+    ):
+        index, counts = np.unique(train_index, return_counts=True)
+        np.testing.assert_array_equal(train_unique, index)
+        np.testing.assert_array_equal(weights, counts)
+        np.testing.assert_array_equal(test, test_index)
+        np.testing.assert_array_equal(np.setdiff1d(X, index), test_index)
+
+
+def test_split_counts_equals_split() -> None:
+    """Test that counts as weights do not change the splits."""
+    X = np.arange(25)
+    cv = Subsample(n_resamplings=6, random_state=3)
+    cv_counts = Subsample(
+        n_resamplings=6, random_state=3, bootstrap_weights="counts"
+    )
+    for (train, test), (train_counts, test_counts) in zip(
+        cv.split(X), cv_counts.split(X)
+    ):
+        np.testing.assert_array_equal(train, train_counts)
+        np.testing.assert_array_equal(test, test_counts)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"bootstrap_weights": "multinomial"},
+        {"bootstrap_weights": "poisson", "replace": False},
+    ],
+)
+def test_invalid_bootstrap_weights(params: Dict[str, Any]) -> None:
+    """Test that invalid bootstrap weights raise an error."""
+    cv = Subsample(n_resamplings=2, **params)
+    with pytest.raises(ValueError, match=r".*Invalid bootstrap_weights.*"):
+        next(cv.split(np.arange(10)))
+    with pytest.raises(ValueError, match=r".*Invalid bootstrap_weights.*"):
+        cv.split_matrix(np.arange(10))
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"replace": False, "n_samples": 12},
+        {"bootstrap_weights": "poisson"},
+    ],
+)
+def test_get_split_equals_split(params: Dict[str, Any]) -> None:
+    """
+    Test that each resampling with independent streams is generated
+    alone by get_split, and reproducibly by split.
+    """
+    X = np.arange(20)
+    cv = Subsample(
+        n_resamplings=5, random_state=4, independent_streams=True, **params
+    )
+    with config_context(working_memory=1e-4):
+        splits = list(cv.split(X))
+    for k, (train_index, test_index) in enumerate(cv.split(X)):
+        np.testing.assert_array_equal(train_index, splits[k][0])
+        train_k, test_k = cv.get_split(X, k)
+        np.testing.assert_array_equal(train_k, train_index)
+        np.testing.assert_array_equal(test_k, test_index)
+    assert not np.array_equal(splits[0][0], splits[1][0])
+
+
+def test_invalid_get_split() -> None:
+    """Test that get_split raises errors without independent streams."""
+    X = np.arange(20)
+    with pytest.raises(ValueError, match=r".*Invalid independent_streams.*"):
+        Subsample(n_resamplings=5).get_split(X, 0)
+    cv = Subsample(n_resamplings=5, independent_streams=True)
+    for k in [-1, 5, 1.0]:
+        with pytest.raises(ValueError, match=r".*Invalid k argument.*"):
+            cv.get_split(X, k)  # type: ignore
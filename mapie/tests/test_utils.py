@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from tempfile import TemporaryDirectory
 from typing import Any, Optional
 
 import numpy as np
@@ -9,13 +10,17 @@ from sklearn.linear_model import LinearRegression
 from sklearn.utils.validation import check_is_fitted
 
 from mapie.utils import (
+    as_slice_if_contiguous,
     check_alpha,
     check_alpha_and_n_samples,
+    check_batch_size,
     check_n_features_in,
     check_n_jobs,
     check_null_weight,
     check_verbose,
+    concatenate_batches,
     fit_estimator,
+    memmap_arrays,
 )
 
 X_toy = np.array([0, 1, 2, 3, 4, 5]).reshape(-1, 1)
@@ -185,3 +190,50 @@ def test_invalid_verbose(verbose: Any) -> None:
 def test_valid_verbose(verbose: Any) -> None:
     """Test that valid verboses raise no errors."""
     check_verbose(verbose)
+
+
+@pytest.mark.parametrize("batch_size", [0, -1, 2.5, "1", True])
+def test_invalid_batch_size(batch_size: Any) -> None:
+    """Test that invalid batch sizes raise errors."""
+    with pytest.raises(ValueError, match=r".*Invalid batch_size argument*"):
+        check_batch_size(batch_size, 10)
+
+
+@pytest.mark.parametrize("batch_size", [None, 1, 10, 100])
+def test_valid_batch_size(batch_size: Any) -> None:
+    """Test that valid batch sizes raise no errors."""
+    check_batch_size(batch_size, 10)
+
+
+def test_concatenate_batches() -> None:
+    """Test that concatenate_batches preserves the structure of outputs."""
+    batches = (
+        (np.full(n, i), np.full((n, 2), i)) for i, n in enumerate([3, 2])
+    )
+    out1, out2 = concatenate_batches(batches, 5)
+    np.testing.assert_array_equal(out1, [0, 0, 0, 1, 1])
+    assert out2.shape == (5, 2)
+
+
+@pytest.mark.parametrize(
+    "index", [np.arange(3, 8), np.array([0]), np.array([1, 2, 4]), []]
+)
+def test_as_slice_if_contiguous(index: Any) -> None:
+    """Test that indexing with the slice selects the same rows."""
+    np.testing.assert_array_equal(
+        X[as_slice_if_contiguous(index)], X[np.asarray(index, dtype=int)]
+    )
+
+
+def test_memmap_arrays() -> None:
+    """Test that only large numerical arrays are memory mapped."""
+    with TemporaryDirectory() as folder:
+        X_shared, y_shared, none = memmap_arrays(
+            (X, y.astype(object), None), folder, min_nbytes=X.nbytes
+        )
+        assert isinstance(X_shared, np.memmap)
+        assert not X_shared.flags.writeable
+        np.testing.assert_array_equal(X_shared, X)
+        assert not isinstance(y_shared, np.memmap)
+        assert none is None
+        del X_shared
@@ -1,14 +1,33 @@
+import os
+import threading
 import warnings
+from functools import update_wrapper
 from inspect import signature
-from typing import Any, Iterable, Optional, Tuple, Union, cast
+from types import MethodType
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import numpy as np
+from joblib import dump, load
+from scipy.sparse import csr_matrix, issparse
 from sklearn.base import ClassifierMixin, RegressorMixin
 from sklearn.model_selection import BaseCrossValidator
 from sklearn.utils.validation import _check_sample_weight
 
 from ._typing import ArrayLike
 
+F = TypeVar("F", bound=Callable[..., Any])
+
 
 def check_null_weight(
     sample_weight: ArrayLike, X: ArrayLike, y: ArrayLike
@@ -63,6 +82,32 @@ def check_null_weight(
     return sample_weight, X, y
 
 
+def supports_sample_weight(estimator: RegressorMixin) -> bool:
+    """
+    Whether the ``fit`` method of an estimator accepts sample weights.
+
+    Parameters
+    ----------
+    estimator : RegressorMixin
+        Estimator to check.
+
+    Returns
+    -------
+    bool
+        Whether ``sample_weight`` is a parameter of ``estimator.fit``.
+
+    Examples
+    --------
+    >>> from sklearn.linear_model import LinearRegression
+    >>> from sklearn.neighbors import KNeighborsRegressor
+    >>> supports_sample_weight(LinearRegression())
+    True
+    >>> supports_sample_weight(KNeighborsRegressor())
+    False
+    """
+    return "sample_weight" in signature(estimator.fit).parameters
+
+
 def fit_estimator(
     estimator: RegressorMixin,
     X: ArrayLike,
@@ -106,9 +151,7 @@ def fit_estimator(
     >>> estimator = fit_estimator(estimator, X, y)
     >>> check_is_fitted(estimator)
     """
-    fit_parameters = signature(estimator.fit).parameters
-    supports_sw = "sample_weight" in fit_parameters
-    if supports_sw and sample_weight is not None:
+    if supports_sample_weight(estimator) and sample_weight is not None:
         estimator.fit(X, y, sample_weight=sample_weight)
     else:
         estimator.fit(X, y)
@@ -321,6 +364,7 @@ def check_nan_in_aposteriori_prediction(X: ArrayLike) -> None:
     ----------
     X : Array of shape (size of training set, number of estimators) whose rows
     are the predictions by each estimator of each training sample.
+    If sparse, only stored values are predictions.
 
     Raises
     ------
@@ -342,7 +386,16 @@ def check_nan_in_aposteriori_prediction(X: ArrayLike) -> None:
     Increase the number of resamplings
     """
 
-    if np.any(np.all(np.isnan(X), axis=1), axis=0):
+    if issparse(X):
+        X = csr_matrix(X)
+        row_ids = np.repeat(np.arange(X.shape[0]), np.diff(X.indptr))
+        n_predictions = np.bincount(
+            row_ids[~np.isnan(X.data)], minlength=X.shape[0]
+        )
+        is_nan = n_predictions == 0
+    else:
+        is_nan = np.all(np.isnan(X), axis=1)
+    if np.any(is_nan, axis=0):
         warnings.warn(
             "WARNING: at least one point of training set "
             + "belongs to every resamplings.\n"
@@ -372,3 +425,278 @@ def check_input_is_image(X: ArrayLike) -> None:
             "When X is an image, the number of dimensions"
             "must be equal to 3 or 4."
         )
+
+
+def check_batch_size(batch_size: Optional[int], n_samples: int) -> int:
+    """
+    Check parameter ``batch_size`` and return the number of samples
+    processed at once.
+
+    Parameters
+    ----------
+    batch_size : Optional[int]
+        Number of samples processed at once.
+        If ``None``, all samples are processed at once.
+
+    n_samples : int
+        Number of samples to process.
+
+    Returns
+    -------
+    int
+        Number of samples processed at once.
+
+    Raises
+    ------
+    ValueError
+        If parameter is not valid.
+
+    Examples
+    --------
+    >>> from mapie.utils import check_batch_size
+    >>> check_batch_size(None, 100)
+    100
+    >>> try:
+    ...     check_batch_size(0, 100)
+    ... except Exception as exception:
+    ...     print(exception)
+    ...
+    Invalid batch_size argument. Must be a positive integer.
+    """
+    if batch_size is None:
+        return max(n_samples, 1)
+    if (
+        not isinstance(batch_size, (int, np.integer))
+        or isinstance(batch_size, bool)
+        or batch_size < 1
+    ):
+        raise ValueError(
+            "Invalid batch_size argument. Must be a positive integer."
+        )
+    return int(batch_size)
+
+
+def concatenate_batches(
+    batches: Iterator[Union[ArrayLike, Tuple[ArrayLike, ArrayLike]]],
+    n_samples: int,
+) -> Union[ArrayLike, Tuple[ArrayLike, ArrayLike]]:
+    """
+    Write the outputs computed on successive batches of samples
+    into arrays preallocated for all the samples.
+
+    Parameters
+    ----------
+    batches : Iterator[Union[ArrayLike, Tuple[ArrayLike, ArrayLike]]]
+        Outputs of each batch, either an array or a pair of arrays
+        whose first dimension is the number of samples in the batch.
+
+    n_samples : int
+        Total number of samples.
+
+    Returns
+    -------
+    Union[ArrayLike, Tuple[ArrayLike, ArrayLike]]
+        Outputs for all the samples, with the same structure
+        as the outputs of each batch.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from mapie.utils import concatenate_batches
+    >>> batches = (np.arange(i, min(i + 2, 5)) for i in range(0, 5, 2))
+    >>> print(concatenate_batches(batches, 5))
+    [0 1 2 3 4]
+    """
+    outputs: Tuple[ArrayLike, ...] = ()
+    is_tuple = False
+    start = 0
+    for batch in batches:
+        is_tuple = isinstance(batch, tuple)
+        arrays = batch if isinstance(batch, tuple) else (batch,)
+        if not outputs:
+            outputs = tuple(
+                np.empty((n_samples,) + array.shape[1:], dtype=array.dtype)
+                for array in arrays
+            )
+        stop = start + len(arrays[0])
+        for output, array in zip(outputs, arrays):
+            output[start:stop] = array
+        start = stop
+    if is_tuple:
+        return outputs[0], outputs[1]
+    return outputs[0]
+
+
+def as_slice_if_contiguous(index: ArrayLike) -> Union[slice, ArrayLike]:
+    """
+    Convert an array of indices to an equivalent slice when indices are
+    consecutive and increasing, so that indexing returns a view
+    instead of a copy.
+
+    Parameters
+    ----------
+    index : ArrayLike of shape (n_indices,)
+        Indices.
+
+    Returns
+    -------
+    Union[slice, ArrayLike]
+        Equivalent slice if indices are contiguous, ``index`` otherwise.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from mapie.utils import as_slice_if_contiguous
+    >>> print(as_slice_if_contiguous(np.array([3, 4, 5])))
+    slice(3, 6, None)
+    >>> print(as_slice_if_contiguous(np.array([3, 5])))
+    [3 5]
+    """
+    index_ = np.asarray(index)
+    if (
+        index_.ndim == 1
+        and len(index_) > 0
+        and index_.dtype.kind in "iu"
+        and index_[0] >= 0
+        and np.all(np.diff(index_) == 1)
+    ):
+        return slice(int(index_[0]), int(index_[-1]) + 1)
+    return index
+
+
+def memmap_arrays(
+    arrays: Tuple[Optional[ArrayLike], ...],
+    folder: str,
+    min_nbytes: int = 2 ** 20,
+) -> Tuple[Optional[ArrayLike], ...]:
+    """
+    Dump numerical arrays to a folder and load them back as read-only
+    memory maps, so that process-based ``joblib`` workers share the same
+    data, sent by reference, instead of receiving copies.
+
+    Parameters
+    ----------
+    arrays : Tuple[Optional[ArrayLike], ...]
+        Arrays to share. Arrays that are not numerical ``np.ndarray``,
+        or smaller than ``min_nbytes``, are returned unchanged.
+
+    folder : str
+        Folder where memory maps are stored. It must exist as long as
+        the memory maps are used.
+
+    min_nbytes : int
+        Minimum size of the arrays to share, in bytes.
+        By default ``2 ** 20``.
+
+    Returns
+    -------
+    Tuple[Optional[ArrayLike], ...]
+        Arrays, memory mapped when possible.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from tempfile import TemporaryDirectory
+    >>> from mapie.utils import memmap_arrays
+    >>> with TemporaryDirectory() as folder:
+    ...     X, y = memmap_arrays((np.ones((2, 2)), None), folder, 0)
+    ...     print(type(X).__name__, y)
+    memmap None
+    """
+    shared_arrays: List[Optional[ArrayLike]] = []
+    for i, array in enumerate(arrays):
+        if (
+            isinstance(array, np.ndarray)
+            and not isinstance(array, np.memmap)
+            and array.dtype.kind in "biuf"
+            and array.nbytes >= min_nbytes
+        ):
+            filename = os.path.join(folder, f"array_{i}.mmap")
+            dump(array, filename)
+            array = load(filename, mmap_mode="r")
+        shared_arrays.append(array)
+    return tuple(shared_arrays)
+
+
+def get_worker_id() -> str:
+    """
+    Identify the process and thread running the current task,
+    e.g. to find which ``joblib`` worker fitted an estimator.
+
+    Returns
+    -------
+    str
+        Process id and thread name, separated by a colon.
+
+    Examples
+    --------
+    >>> import os
+    >>> from mapie.utils import get_worker_id
+    >>> get_worker_id() == f"{os.getpid()}:MainThread"
+    True
+    """
+    return f"{os.getpid()}:{threading.current_thread().name}"
+
+
+class _AvailableIfDescriptor:
+    """
+    Method descriptor raising an ``AttributeError`` when ``check``
+    fails on the instance, see ``available_if``.
+    """
+
+    def __init__(
+        self, fn: Callable[..., Any], check: Callable[[Any], bool], msg: str
+    ) -> None:
+        self.fn = fn
+        self.check = check
+        self.msg = msg
+        update_wrapper(self, fn)  # type: ignore
+
+    def __get__(self, obj: Any, owner: Optional[type] = None) -> Any:
+        if obj is None:
+            return self.fn
+        if not self.check(obj):
+            raise AttributeError(self.msg)
+        return MethodType(self.fn, obj)
+
+
+def available_if(check: Callable[[Any], bool], msg: str) -> Callable[[F], F]:
+    """
+    Make a method available only if ``check`` returns ``True`` on the
+    instance, as ``sklearn.utils.metaestimators.available_if``, which
+    requires scikit-learn 1.0 or later.
+
+    Otherwise, accessing the method raises an ``AttributeError``,
+    so that ``hasattr`` is ``False``. The method keeps its signature
+    and docstring.
+
+    Parameters
+    ----------
+    check : Callable[[Any], bool]
+        Whether the method is available for an instance.
+
+    msg : str
+        Message of the ``AttributeError``.
+
+    Returns
+    -------
+    Callable[[F], F]
+        Decorator of the method.
+
+    Examples
+    --------
+    >>> from mapie.utils import available_if
+    >>> class Counter:
+    ...     def __init__(self, frozen):
+    ...         self.frozen = frozen
+    ...     @available_if(lambda self: not self.frozen, "Frozen counter.")
+    ...     def add(self, n):
+    ...         return n + 1
+    >>> print(Counter(False).add(1), hasattr(Counter(True), "add"))
+    2 False
+    """
+
+    def decorator(fn: F) -> F:
+        return cast(F, _AvailableIfDescriptor(fn, check, msg))
+
+    return decorator